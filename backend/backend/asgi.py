@@ -12,6 +12,9 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Read by settings.py: no persistent per-thread DB connections under ASGI,
+# dedupe Bloom filter loaded at startup
+os.environ.setdefault('DJANGO_SERVER_INTERFACE', 'asgi')
 
 application = get_asgi_application()
 
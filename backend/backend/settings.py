@@ -96,24 +96,85 @@ WSGI_APPLICATION = 'backend.wsgi.application'
 
 import os
 
+# Database driver and connection reuse
+# - MYSQL_DRIVER: 'connector' (mysql-connector-python) or 'mysqlclient' (Django's own
+#   MySQL backend on the mysqlclient C library; pip install mysqlclient)
+# - MYSQL_USE_PURE: force mysql-connector's pure-Python protocol; by default its C
+#   extension is used when installed (it ships in the binary wheels)
+# - DB_CONN_MAX_AGE: seconds a request thread keeps its connection open; 0 opens a new
+#   connection per request. Defaults to 0 under ASGI (backend/asgi.py sets
+#   DJANGO_SERVER_INTERFACE, as backend/wsgi.py does for WSGI), where sync_to_async
+#   threads would each hold a connection; rely on MYSQL_POOL_SIZE for reuse there.
+#   60 everywhere else.
+# - MYSQL_POOL_SIZE: mysql-connector connection pool per process (0 = off). Every thread
+#   that can touch the DB at once (request threads, LEAD_EMAIL_WORKERS, ASGI sync_to_async
+#   threads) needs a slot; the pool raises instead of waiting when it is exhausted.
+MYSQL_DRIVER = os.environ.get('MYSQL_DRIVER', 'connector').lower()
+MYSQL_USE_PURE = os.environ.get('MYSQL_USE_PURE', 'False').lower() == 'true'
+MYSQL_POOL_SIZE = int(os.environ.get('MYSQL_POOL_SIZE', '0'))
+SERVER_INTERFACE = os.environ.get('DJANGO_SERVER_INTERFACE', '').lower()
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', '0' if SERVER_INTERFACE == 'asgi' else '60'))
+
+if MYSQL_DRIVER == 'mysqlclient':
+    DATABASE_ENGINE = "django.db.backends.mysql"
+    DATABASE_OPTIONS = {
+        "charset": "utf8mb4",
+    }
+else:
+    DATABASE_ENGINE = "mysql.connector.django"
+    DATABASE_OPTIONS = {
+        "use_pure": MYSQL_USE_PURE,
+        "charset": "utf8mb4",
+    }
+    if MYSQL_POOL_SIZE:
+        DATABASE_OPTIONS.update(pool_name="leads", pool_size=MYSQL_POOL_SIZE)
+
 DATABASES = {
     "default": {
-        "ENGINE": "mysql.connector.django",
+        "ENGINE": DATABASE_ENGINE,
         "NAME": os.environ.get("MYSQL_DATABASE"),
         "USER": os.environ.get("MYSQLUSER"),
         "PASSWORD": os.environ.get("MYSQLPASSWORD"),
         "HOST": os.environ.get("MYSQLHOST"),
         "PORT": os.environ.get("MYSQLPORT", "3306"),
-        "OPTIONS": {
-            "use_pure": True,
-            "charset": "utf8mb4",
-        },
+        "CONN_MAX_AGE": DB_CONN_MAX_AGE,
+        # Ping a reused connection before the first query of each request
+        "CONN_HEALTH_CHECKS": True,
+        "OPTIONS": DATABASE_OPTIONS,
     }
 }
 
 
 
 
+# Cache (idempotency keys, ROI results):
+# - REDIS_URL: shared Redis cache, e.g. redis://localhost:6379/0 (needs the redis package);
+#   without it each process keeps its own in-memory cache
+REDIS_URL = os.environ.get('REDIS_URL', '')
+
+try:
+    import redis  # noqa: F401
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+if REDIS_URL and REDIS_AVAILABLE:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    if REDIS_URL:
+        print("⚠️ REDIS_URL is set but the redis package is not installed; using the in-memory cache")
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
+
 # Database setup notes:
 # 1. Ensure MySQL server is running on localhost:3306
 # 2. Create database: CREATE DATABASE Roi CHARACTER SET utf8mb4 COLLATE utf8mb4_unicode_ci;
@@ -209,15 +270,54 @@ CORS_ALLOW_HEADERS = [
     "user-agent",
     "x-csrftoken",
     "x-requested-with",
+    "idempotency-key",
 ]
 
 
+# Google Sheets webhook configuration
+# Leads are forwarded to a Google Apps Script web app that appends them to a sheet
+
+GOOGLE_SHEETS_WEBHOOK_URL = os.environ.get(
+    'GOOGLE_SHEETS_WEBHOOK_URL',
+    'https://script.google.com/macros/s/AKfycbxg8OpadW0z9cro_BL0TudSn-p-iZS8IWb3vZm5GbLY4lzkz__4sYSipD_MglOUrP79/exec'
+)
+GOOGLE_SHEETS_WEBHOOK_TIMEOUT = float(os.environ.get('GOOGLE_SHEETS_WEBHOOK_TIMEOUT', '5'))
+
+# Pooled keep-alive HTTP session for outbound webhook calls (see leads/http.py)
+OUTBOUND_HTTP_POOL_CONNECTIONS = int(os.environ.get('OUTBOUND_HTTP_POOL_CONNECTIONS', '4'))  # hosts kept pooled
+OUTBOUND_HTTP_POOL_MAXSIZE = int(os.environ.get('OUTBOUND_HTTP_POOL_MAXSIZE', '10'))  # connections per host
+OUTBOUND_HTTP_IDLE_TIMEOUT = float(os.environ.get('OUTBOUND_HTTP_IDLE_TIMEOUT', '60'))  # seconds
+# Upper bound on concurrent webhook connections from one ASGI event loop
+OUTBOUND_HTTP_ASYNC_MAX_CONNECTIONS = int(os.environ.get('OUTBOUND_HTTP_ASYNC_MAX_CONNECTIONS', '200'))
+
+# Lead delivery mode:
+# - 'inline': POST /api/leads/ calls the webhook before answering (default)
+# - 'outbox': POST /api/leads/ writes the lead to the leads table and answers immediately;
+#             `python manage.py dispatch_outbox` delivers queued leads to the webhook
+LEAD_WEBHOOK_MODE = os.environ.get('LEAD_WEBHOOK_MODE', 'inline').lower()
+
+# Outbox dispatcher tuning
+LEAD_OUTBOX_BATCH_SIZE = int(os.environ.get('LEAD_OUTBOX_BATCH_SIZE', '50'))
+LEAD_OUTBOX_POLL_INTERVAL = float(os.environ.get('LEAD_OUTBOX_POLL_INTERVAL', '1'))  # seconds
+LEAD_OUTBOX_MAX_ATTEMPTS = int(os.environ.get('LEAD_OUTBOX_MAX_ATTEMPTS', '8'))
+LEAD_OUTBOX_BACKOFF_BASE = float(os.environ.get('LEAD_OUTBOX_BACKOFF_BASE', '2'))  # seconds
+LEAD_OUTBOX_BACKOFF_MAX = float(os.environ.get('LEAD_OUTBOX_BACKOFF_MAX', '600'))  # seconds
+LEAD_OUTBOX_LEASE_SECONDS = int(os.environ.get('LEAD_OUTBOX_LEASE_SECONDS', '60'))
+
+# Batched delivery: send up to LEAD_OUTBOX_BATCH_SIZE leads per webhook call as one JSON array,
+# flushing a partial batch after LEAD_OUTBOX_FLUSH_INTERVAL_MS.
+# The Apps Script must accept an array body (and may answer {"results": [{"ok": ...}, ...]}).
+LEAD_OUTBOX_BATCHED = os.environ.get('LEAD_OUTBOX_BATCHED', 'False').lower() == 'true'
+LEAD_OUTBOX_FLUSH_INTERVAL_MS = int(os.environ.get('LEAD_OUTBOX_FLUSH_INTERVAL_MS', '500'))
+
+
 # Email configuration
 # SMTP settings for sending roadmap emails
 # IMPORTANT: Replace these with actual SMTP credentials in production
 # Use environment variables for sensitive information
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# Pooled SMTP backend keeps authenticated connections open between sends (see leads/mail_backends.py)
+EMAIL_BACKEND = os.environ.get('EMAIL_BACKEND', 'leads.mail_backends.PooledSMTPEmailBackend')
 EMAIL_HOST = os.environ.get('EMAIL_HOST', 'smtp.gmail.com')  # Default to Gmail SMTP
 EMAIL_PORT = int(os.environ.get('EMAIL_PORT', '587'))
 EMAIL_USE_TLS = os.environ.get('EMAIL_USE_TLS', 'True').lower() == 'true'
@@ -230,6 +330,60 @@ EMAIL_HOST_PASSWORD = os.environ.get('EMAIL_HOST_PASSWORD', '')  # Your SMTP pas
 # Email FROM address (must match authorized sender in SMTP settings)
 EMAIL_FROM_ADDRESS = os.environ.get('EMAIL_FROM_ADDRESS', 'digitalmavencommunity@gmail.com')
 
+EMAIL_TIMEOUT = int(os.environ.get('EMAIL_TIMEOUT', '10'))  # seconds
+
+# SMTP connection pool (PooledSMTPEmailBackend)
+EMAIL_POOL_MAX_CONNECTIONS = int(os.environ.get('EMAIL_POOL_MAX_CONNECTIONS', '4'))
+EMAIL_POOL_NOOP_AFTER = float(os.environ.get('EMAIL_POOL_NOOP_AFTER', '5'))  # idle seconds before a NOOP check
+EMAIL_POOL_MAX_IDLE = float(os.environ.get('EMAIL_POOL_MAX_IDLE', '60'))  # idle seconds before closing
+
+# Roadmap email worker pool (see leads/mailer.py)
+LEAD_EMAIL_WORKERS = int(os.environ.get('LEAD_EMAIL_WORKERS', '4'))  # concurrent SMTP sends
+LEAD_EMAIL_QUEUE_DEPTH = int(os.environ.get('LEAD_EMAIL_QUEUE_DEPTH', '500'))  # emails waiting for a worker
+LEAD_EMAIL_SUBMIT_TIMEOUT = float(os.environ.get('LEAD_EMAIL_SUBMIT_TIMEOUT', '2'))  # seconds to wait when full
+
+# Idempotency-Key handling for POST /api/leads/ (see leads/idempotency.py).
+# Keys are kept in the default cache; use a shared cache when running several workers.
+LEAD_IDEMPOTENCY_TTL = int(os.environ.get('LEAD_IDEMPOTENCY_TTL', '86400'))  # seconds a response is replayed
+LEAD_IDEMPOTENCY_LOCK_SECONDS = int(os.environ.get('LEAD_IDEMPOTENCY_LOCK_SECONDS', '60'))  # in-progress claim
+
+# In-process duplicate-email detection (see leads/dedupe.py): an LRU of recent emails plus a
+# Bloom filter of the leads table. Known duplicates skip the webhook, outbox write and email.
+LEAD_DEDUPE_ENABLED = os.environ.get('LEAD_DEDUPE_ENABLED', 'True').lower() == 'true'
+LEAD_DEDUPE_LRU_SIZE = int(os.environ.get('LEAD_DEDUPE_LRU_SIZE', '10000'))
+LEAD_DEDUPE_BLOOM_CAPACITY = int(os.environ.get('LEAD_DEDUPE_BLOOM_CAPACITY', '1000000'))  # ~1.2 MB at 1%
+LEAD_DEDUPE_BLOOM_ERROR_RATE = float(os.environ.get('LEAD_DEDUPE_BLOOM_ERROR_RATE', '0.01'))
+# Load the Bloom filter when the app starts; on by default only in processes started through
+# backend/wsgi.py or backend/asgi.py. Elsewhere (runserver, scripts) the first check() loads it.
+LEAD_DEDUPE_WARM_AT_STARTUP = os.environ.get(
+    'LEAD_DEDUPE_WARM_AT_STARTUP', str(SERVER_INTERFACE in ('wsgi', 'asgi'))
+).lower() == 'true'
+
+# Bulk lead import (see leads/bulk_import.py)
+LEAD_IMPORT_CHUNK_SIZE = int(os.environ.get('LEAD_IMPORT_CHUNK_SIZE', '500'))  # rows per bulk_create
+
+# Keyset-paginated lead listing (GET /api/leads/list/)
+LEAD_LIST_PAGE_SIZE = int(os.environ.get('LEAD_LIST_PAGE_SIZE', '50'))
+LEAD_LIST_MAX_PAGE_SIZE = int(os.environ.get('LEAD_LIST_MAX_PAGE_SIZE', '500'))
+
+# Streaming lead export (see leads/export.py)
+LEAD_EXPORT_CHUNK_SIZE = int(os.environ.get('LEAD_EXPORT_CHUNK_SIZE', '2000'))  # rows per keyset page
+
+# Active A/B versions of the roadmap email, comma-separated (see ROADMAP_VARIANTS in leads/emails.py)
+ROADMAP_EMAIL_VARIANTS = os.environ.get('ROADMAP_EMAIL_VARIANTS', 'v1')
+
+# Bulk roadmap email replay (see leads/bulk_email.py and the send_roadmaps command)
+LEAD_BULK_EMAIL_RATE_PER_MINUTE = int(os.environ.get('LEAD_BULK_EMAIL_RATE_PER_MINUTE', '20'))  # provider cap
+LEAD_BULK_EMAIL_CHUNK_SIZE = int(os.environ.get('LEAD_BULK_EMAIL_CHUNK_SIZE', '20'))  # leads stamped per round trip
+
+# Server-side ROI engine (see leads/roi/)
+ROI_MAX_SKILLS = int(os.environ.get('ROI_MAX_SKILLS', '200'))  # skills per profile
+ROI_BATCH_MAX_PROFILES = int(os.environ.get('ROI_BATCH_MAX_PROFILES', '5000'))  # profiles per batch call
+ROI_SKILL_CACHE_SIZE = int(os.environ.get('ROI_SKILL_CACHE_SIZE', '10000'))  # raw skills memoized per process
+ROI_RESCORE_CHUNK_SIZE = int(os.environ.get('ROI_RESCORE_CHUNK_SIZE', '5000'))  # leads per rescore round trip
+ROI_RESULT_CACHE_TTL = int(os.environ.get('ROI_RESULT_CACHE_TTL', '0'))  # seconds; 0 (default) disables the cache
+ROI_RESULT_CACHE_ALIAS = os.environ.get('ROI_RESULT_CACHE_ALIAS', 'default')  # entry in CACHES
+
 # Email configuration notes:
 # 1. For Gmail: Use App Password (not regular password) - enable 2FA and generate app password
 # 2. For custom SMTP: Update EMAIL_HOST, EMAIL_PORT, EMAIL_USE_TLS/SSL accordingly
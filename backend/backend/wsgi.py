@@ -12,6 +12,8 @@ import os
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+# Read by settings.py: this process is a WSGI server
+os.environ.setdefault('DJANGO_SERVER_INTERFACE', 'wsgi')
 
 application = get_wsgi_application()
 
@@ -0,0 +1,156 @@
+"""
+Benchmark: per-request database overhead for the MySQL connection settings.
+
+Each profile runs in its own process with the environment variables read by
+backend/settings.py, against the MySQL server configured by MYSQL_DATABASE,
+MYSQLUSER, MYSQLPASSWORD, MYSQLHOST and MYSQLPORT:
+
+- pure, per-request   MYSQL_USE_PURE=True,  DB_CONN_MAX_AGE=0   (previous settings)
+- cext, per-request   MYSQL_USE_PURE=False, DB_CONN_MAX_AGE=0
+- cext, persistent    MYSQL_USE_PURE=False, DB_CONN_MAX_AGE=60  (new default)
+- cext, pooled        MYSQL_USE_PURE=False, DB_CONN_MAX_AGE=0, MYSQL_POOL_SIZE=threads
+- mysqlclient         MYSQL_DRIVER=mysqlclient, DB_CONN_MAX_AGE=60 (if installed)
+
+A "request" is request_started -> one primary-key lookup on leads ->
+request_finished, on --threads threads, like a threaded WSGI worker. A
+"worker job" is what an email worker thread does per email: reset connections
+(connections.close_all() before, close_old_connections() now) and stamp one
+lead with an UPDATE.
+
+Usage (from backend/, with the MySQL env vars set and migrations applied):
+    python benchmarks/bench_db_overhead.py --requests 2000 --threads 8
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+BENCH_EMAIL = 'db-bench@example.com'
+
+
+def profiles(threads):
+    rows = [
+        ('pure, per-request', {'MYSQL_USE_PURE': 'True', 'DB_CONN_MAX_AGE': '0'}),
+        ('cext, per-request', {'MYSQL_USE_PURE': 'False', 'DB_CONN_MAX_AGE': '0'}),
+        ('cext, persistent', {'MYSQL_USE_PURE': 'False', 'DB_CONN_MAX_AGE': '60'}),
+        ('cext, pooled', {'MYSQL_USE_PURE': 'False', 'DB_CONN_MAX_AGE': '0', 'MYSQL_POOL_SIZE': str(threads)}),
+    ]
+    try:
+        import MySQLdb  # noqa: F401
+        rows.append(('mysqlclient, persistent', {'MYSQL_DRIVER': 'mysqlclient', 'DB_CONN_MAX_AGE': '60'}))
+    except ImportError:
+        print("[Bench] mysqlclient not installed, skipping its profile")
+    base = {'MYSQL_DRIVER': 'connector', 'MYSQL_POOL_SIZE': '0'}
+    return [(label, {**base, **env}) for label, env in rows]
+
+
+def summarize(latencies):
+    latencies = sorted(latencies)
+    return {
+        'mean_ms': statistics.fmean(latencies) * 1000,
+        'p50_ms': latencies[len(latencies) // 2] * 1000,
+        'p99_ms': latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000,
+    }
+
+
+def run_profile(n, threads):
+    """Child process: time requests and worker jobs with the current settings."""
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+    from django.core.signals import request_finished, request_started
+    from django.db import close_old_connections, connection, connections
+    from django.db.backends.signals import connection_created
+    from django.utils import timezone
+
+    from leads.models import Lead
+
+    opened = {'count': 0}
+    lock = threading.Lock()
+
+    def on_connect(**kwargs):
+        with lock:
+            opened['count'] += 1
+
+    connection_created.connect(on_connect)
+    Lead.objects.get_or_create(
+        email=BENCH_EMAIL, defaults={'full_name': 'Bench User', 'phone_number': '+919876543210'}
+    )
+    connections.close_all()
+    opened['count'] = 0
+
+    def request(_i):
+        start = time.perf_counter()
+        request_started.send(sender=None)
+        try:
+            Lead.objects.filter(pk=BENCH_EMAIL).only('email').first()
+        finally:
+            request_finished.send(sender=None)
+        return time.perf_counter() - start
+
+    def job(reset):
+        def run(_i):
+            start = time.perf_counter()
+            reset()
+            Lead.objects.filter(pk=BENCH_EMAIL).update(roadmap_sent_at=timezone.now())
+            return time.perf_counter() - start
+        return run
+
+    results = {'driver': type(connection).__module__, 'use_pure': connection.settings_dict['OPTIONS'].get('use_pure')}
+    for scenario, fn in (
+        ('request', request),
+        ('worker, close_all', job(connections.close_all)),
+        ('worker, reuse', job(close_old_connections)),
+    ):
+        opened['count'] = 0
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            list(pool.map(fn, range(min(n, 50))))  # warm-up
+            opened['count'] = 0
+            latencies = list(pool.map(fn, range(n)))
+            # Release the pool threads' connections before the next scenario
+            list(pool.map(lambda _i: connections.close_all(), range(threads)))
+        results[scenario] = dict(summarize(latencies), connections=opened['count'])
+    print(json.dumps(results))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000, help='Requests (and worker jobs) per profile.')
+    parser.add_argument('--threads', type=int, default=8, help='Concurrent request / worker threads.')
+    parser.add_argument('--child', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if 'DJANGO_SETTINGS_MODULE' not in os.environ and not os.environ.get('MYSQLHOST'):
+        parser.error("set MYSQL_DATABASE, MYSQLUSER, MYSQLPASSWORD and MYSQLHOST for the MySQL server to test")
+
+    if args.child:
+        run_profile(args.requests, args.threads)
+        return
+
+    print(f"{'profile':<26} {'scenario':<18} {'conns':>6} {'mean ms':>9} {'p50 ms':>8} {'p99 ms':>8}")
+    for label, env in profiles(args.threads):
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), '--child',
+             '--requests', str(args.requests), '--threads', str(args.threads)],
+            cwd=BACKEND_DIR, env={**os.environ, **env}, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            print(f"{label:<26} failed: {proc.stderr.strip().splitlines()[-1] if proc.stderr.strip() else proc.returncode}")
+            continue
+        results = json.loads(proc.stdout.strip().splitlines()[-1])
+        for scenario in ('request', 'worker, close_all', 'worker, reuse'):
+            row = results[scenario]
+            print(f"{label:<26} {scenario:<18} {row['connections']:>6} {row['mean_ms']:>9.3f} "
+                  f"{row['p50_ms']:>8.3f} {row['p99_ms']:>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
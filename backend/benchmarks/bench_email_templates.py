@@ -0,0 +1,66 @@
+"""
+Benchmark: per-render cost of the roadmap email templates.
+
+Compares the precompiled segment join used by leads/emails.py against
+re-formatting the template source on every send (str.format-style replace,
+string.Template and a Django Template), for the HTML and plain text bodies.
+Also times a full build_roadmap_email() call (templates + cached PDF part).
+
+Usage (from backend/):
+    python benchmarks/bench_email_templates.py --renders 20000
+"""
+import argparse
+import os
+import string
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def per_call_us(fn, number):
+    """Best of 5 runs, in microseconds per call."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--renders', type=int, default=20000, help='Renders per timing run.')
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+    from django.template import Context, Engine
+
+    from leads.emails import ACTIVE_VARIANTS, build_roadmap_email
+    from leads.templating import CompiledTemplate
+
+    variant = ACTIVE_VARIANTS[0]
+    name = 'Asha Rao'
+    n = args.renders
+
+    print(f"{'template':<10} {'method':<28} {'us/render':>10}")
+    for label, compiled in (('html', variant.html), ('text', variant.text)):
+        source = compiled.source
+        tmpl = string.Template(source.replace('$', '$$').replace('{full_name}', '${full_name}'))
+        django_tmpl = Engine().from_string(source.replace('{full_name}', '{{ full_name }}'))
+        django_ctx = Context({'full_name': name}, autoescape=compiled.escape)
+
+        rows = [
+            ('precompiled join', lambda: compiled.render(full_name=name)),
+            ('compile + render each time', lambda: CompiledTemplate(source, escape=compiled.escape).render(full_name=name)),
+            ('str.replace', lambda: source.replace('{full_name}', name)),
+            ('string.Template', lambda: tmpl.substitute(full_name=name)),
+            ('django Template', lambda: django_tmpl.render(django_ctx)),
+        ]
+        for method, fn in rows:
+            print(f"{label:<10} {method:<28} {per_call_us(fn, n):>10.2f}")
+
+    build_n = max(n // 100, 10)
+    build_us = per_call_us(lambda: build_roadmap_email('bench@example.com', name), build_n)
+    print(f"\nbuild_roadmap_email (templates + cached PDF part): {build_us:.1f} us/message")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,214 @@
+"""
+Benchmark: lead ingestion through the WSGI path vs the async ASGI path.
+
+Runs POST /api/leads/ through backend.wsgi.application on a fixed pool of
+threads (like gunicorn sync workers) and POST /api/leads/async/ through
+backend.asgi.application on one event loop, against a local fake Google Sheets
+webhook that answers after --upstream-delay-ms.
+
+With --webhook-mode outbox no webhook is called; every request is an outbox
+upsert instead, which shows whether concurrent async submissions write to the
+database in parallel (migrations must be applied to the configured database).
+
+Usage (from backend/):
+    python benchmarks/bench_ingest_wsgi_vs_asgi.py --requests 2000 --wsgi-threads 16 --concurrency 1000
+    python benchmarks/bench_ingest_wsgi_vs_asgi.py --webhook-mode outbox --requests 2000
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def start_fake_webhook(delay):
+    """Minimal keep-alive HTTP server on its own event loop; returns its URL."""
+    ready = threading.Event()
+    state = {}
+
+    async def handle(reader, writer):
+        try:
+            while True:
+                head = await reader.readuntil(b'\r\n\r\n')
+                length = 0
+                for line in head.split(b'\r\n'):
+                    if line.lower().startswith(b'content-length:'):
+                        length = int(line.split(b':', 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(delay)
+                body = b'{"ok": true}'
+                writer.write(
+                    b'HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n'
+                    b'Content-Length: ' + str(len(body)).encode() + b'\r\n\r\n' + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        server = loop.run_until_complete(asyncio.start_server(handle, '127.0.0.1', 0, backlog=4096))
+        state['port'] = server.sockets[0].getsockname()[1]
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return f"http://127.0.0.1:{state['port']}/exec"
+
+
+RUN_ID = str(int(time.time()))
+
+
+def payload(i):
+    return json.dumps({
+        'full_name': 'Bench User',
+        # New emails on every run, so outbox runs insert rather than update
+        'email': f'bench{RUN_ID}.{i}@example.com',
+        'phone_number': '9876543210',
+    }).encode()
+
+
+def run_wsgi(application, n, threads):
+    def call(i):
+        body = payload(i)
+        environ = {
+            'REQUEST_METHOD': 'POST',
+            'PATH_INFO': '/api/leads/',
+            'QUERY_STRING': '',
+            'SERVER_NAME': 'localhost',
+            'SERVER_PORT': '8000',
+            'HTTP_HOST': 'localhost',
+            'CONTENT_TYPE': 'application/json',
+            'CONTENT_LENGTH': str(len(body)),
+            'wsgi.input': io.BytesIO(body),
+            'wsgi.url_scheme': 'http',
+            'wsgi.errors': sys.stderr,
+            'wsgi.multithread': True,
+            'wsgi.multiprocess': False,
+            'wsgi.run_once': False,
+            'wsgi.version': (1, 0),
+        }
+        status_holder = []
+        start = time.perf_counter()
+        result = application(environ, lambda status, headers, exc_info=None: status_holder.append(status))
+        b''.join(result)
+        if hasattr(result, 'close'):
+            result.close()
+        return time.perf_counter() - start, status_holder[0].startswith('201')
+
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        return list(pool.map(call, range(n)))
+
+
+def run_asgi(application, n, concurrency):
+    async def call(i, semaphore):
+        body = payload(i)
+        scope = {
+            'type': 'http',
+            'asgi': {'version': '3.0'},
+            'http_version': '1.1',
+            'method': 'POST',
+            'scheme': 'http',
+            'path': '/api/leads/async/',
+            'raw_path': b'/api/leads/async/',
+            'query_string': b'',
+            'root_path': '',
+            'headers': [
+                (b'host', b'localhost'),
+                (b'content-type', b'application/json'),
+                (b'content-length', str(len(body)).encode()),
+            ],
+            'client': ('127.0.0.1', 50000),
+            'server': ('localhost', 8000),
+        }
+        done = asyncio.Event()
+        sent_body = False
+        statuses = []
+
+        async def receive():
+            nonlocal sent_body
+            if not sent_body:
+                sent_body = True
+                return {'type': 'http.request', 'body': body, 'more_body': False}
+            await done.wait()
+            return {'type': 'http.disconnect'}
+
+        async def send(message):
+            if message['type'] == 'http.response.start':
+                statuses.append(message['status'])
+            elif message['type'] == 'http.response.body' and not message.get('more_body'):
+                done.set()
+
+        async with semaphore:
+            start = time.perf_counter()
+            await application(scope, receive, send)
+            return time.perf_counter() - start, statuses[0] == 201
+
+    async def main():
+        semaphore = asyncio.Semaphore(concurrency)
+        return await asyncio.gather(*(call(n + i, semaphore) for i in range(n)))
+
+    return asyncio.run(main())
+
+
+def report(name, results, elapsed):
+    latencies = sorted(r[0] for r in results)
+    ok = sum(1 for r in results if r[1])
+    p95 = latencies[int(len(latencies) * 0.95) - 1]
+    print(
+        f"{name:<6} {len(results):>6} req  {ok:>6} ok  {len(results) / elapsed:>9.1f} req/s  "
+        f"p50 {statistics.median(latencies) * 1000:>8.1f} ms  p95 {p95 * 1000:>8.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--wsgi-threads', type=int, default=16, help='Worker threads for the WSGI run.')
+    parser.add_argument('--concurrency', type=int, default=1000, help='In-flight requests for the ASGI run.')
+    parser.add_argument('--upstream-delay-ms', type=float, default=300)
+    parser.add_argument('--webhook-mode', choices=('inline', 'outbox'), default='inline')
+    args = parser.parse_args()
+
+    os.environ['GOOGLE_SHEETS_WEBHOOK_URL'] = start_fake_webhook(args.upstream_delay_ms / 1000)
+    os.environ['LEAD_WEBHOOK_MODE'] = args.webhook_mode
+    os.environ['OUTBOUND_HTTP_POOL_MAXSIZE'] = str(args.wsgi_threads)
+    os.environ['OUTBOUND_HTTP_ASYNC_MAX_CONNECTIONS'] = str(args.concurrency)
+    # Leave SMTP unconfigured so the email hand-off returns immediately
+    os.environ['EMAIL_HOST_USER'] = ''
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+
+    from backend.asgi import application as asgi_application
+    from backend.wsgi import application as wsgi_application
+
+    if args.webhook_mode == 'outbox':
+        print(f"Outbox mode, {args.requests} requests")
+    else:
+        print(f"Upstream delay {args.upstream_delay_ms:.0f} ms, {args.requests} requests")
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        wsgi_results = run_wsgi(wsgi_application, args.requests, args.wsgi_threads)
+        wsgi_elapsed = time.perf_counter() - start
+
+        start = time.perf_counter()
+        asgi_results = run_asgi(asgi_application, args.requests, args.concurrency)
+        asgi_elapsed = time.perf_counter() - start
+
+    report('WSGI', wsgi_results, wsgi_elapsed)
+    report('ASGI', asgi_results, asgi_elapsed)
+
+
+if __name__ == '__main__':
+    main()
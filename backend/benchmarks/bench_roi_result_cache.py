@@ -0,0 +1,97 @@
+"""
+Benchmark: ROI result cache vs scoring directly.
+
+Scores --profiles profiles drawn from --distinct different ones (a repeat
+rate typical of the calculator: the same few skill lists over and over)
+through score_profile() and through leads/roi/result_cache.py, one call per
+profile and in batches of --batch, after checking that every cached result
+matches. The cache is warmed first, so the cached rows are the best case:
+every lookup is a hit.
+
+The cache is the one ROI_RESULT_CACHE_ALIAS names (Redis when REDIS_URL is
+set, per-process memory otherwise). ROI_RESULT_CACHE_TTL stays at 0 (off)
+unless this shows a win for that backend.
+
+Usage (from backend/):
+    python benchmarks/bench_roi_result_cache.py --profiles 20000 --distinct 500
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def per_profile_us(fn, items, per_item=1, repeat=3):
+    """Best of `repeat` passes over items, in microseconds per profile."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - started)
+    return best / (len(items) * per_item) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--profiles', type=int, default=20000, help='Profiles scored per pass.')
+    parser.add_argument('--distinct', type=int, default=500, help='Different profiles among them.')
+    parser.add_argument('--batch', type=int, default=500, help='Profiles per score_profiles_cached() call.')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+
+    from django.conf import settings
+
+    from leads.roi import golden
+    from leads.roi.engine import score_profile
+    from leads.roi.result_cache import score_profile_cached, score_profiles_cached
+    from leads.roi.validation import validate_profile
+
+    rng = random.Random(args.seed)
+    vocabulary = [skill for skill in golden._skill_vocabulary() if isinstance(skill, str)]
+    distinct = []
+    while len(distinct) < args.distinct:
+        profile, errors = validate_profile({
+            'user_type': rng.choice(['fresher', 'experienced']),
+            'skills': rng.sample(vocabulary, rng.randrange(0, 10)),
+            'has_full_stack': rng.random() < 0.5,
+            'current_salary': rng.choice([0, 4.5, 8, 12.5, 20, 33]),
+        })
+        if not errors:
+            distinct.append(profile)
+    profiles = [rng.choice(distinct) for _ in range(args.profiles)]
+    batches = [profiles[i:i + args.batch] for i in range(0, len(profiles), args.batch)]
+
+    settings.ROI_RESULT_CACHE_TTL = 3600
+    dump = lambda result: json.dumps(result, sort_keys=True)
+    # Warms the cache and checks it: same answers first
+    assert all(dump(score_profile_cached(p)) == dump(score_profile(p)) for p in distinct)
+    for batch in batches:
+        for cached, profile in zip(score_profiles_cached(batch), batch):
+            assert dump(cached) == dump(score_profile(profile)), profile
+
+    direct_us = per_profile_us(score_profile, profiles)
+    rows = [
+        ('score_profile (direct)', direct_us),
+        ('score_profile_cached', per_profile_us(score_profile_cached, profiles)),
+        (f'score_profiles_cached ({args.batch})', per_profile_us(score_profiles_cached, batches, args.batch)),
+    ]
+
+    backend = settings.CACHES[settings.ROI_RESULT_CACHE_ALIAS]['BACKEND'].rsplit('.', 1)[-1]
+    print(f"{'path':<32} {'us/profile':>11} {'vs direct':>10}")
+    for name, us in rows:
+        print(f"{name:<32} {us:>11.2f} {direct_us / us:>9.2f}x")
+    print(f"\n[Bench] {args.profiles} profiles ({args.distinct} distinct), {backend}, all cache hits; "
+          f"cached and direct results identical")
+
+
+if __name__ == '__main__':
+    main()
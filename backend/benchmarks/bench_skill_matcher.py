@@ -0,0 +1,127 @@
+"""
+Benchmark: compiled skill matcher vs nested substring loops.
+
+Times detect_pillars() and the legacy map_skill_to_pillars() in leads/roi
+against the original implementations (every dictionary entry checked with a
+bidirectional `in`), on large generated skill inputs, after checking that both
+return identical results for every input. resolve_alias() still scans its
+dozen aliases; the matcher row for it shows why.
+
+Usage (from backend/):
+    python benchmarks/bench_skill_matcher.py --skills 20000 --length 60
+"""
+import argparse
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def per_skill_us(fn, items, repeat=3):
+    """Best of `repeat` passes over items, in microseconds per item."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for item in items:
+            fn(item)
+        best = min(best, time.perf_counter() - started)
+    return best / len(items) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--skills', type=int, default=20000, help='Generated skills per run.')
+    parser.add_argument('--length', type=int, default=60, help='Maximum length of random filler text.')
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args()
+
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'backend.settings')
+    import django
+    django.setup()
+
+    from leads.roi import golden
+    from leads.roi.legacy import SKILL_KEYWORDS, _js_trim, map_skill_to_pillars
+    from leads.roi.pillars import PILLAR_DEFINITIONS, detect_pillars, match_skill_to_pillar
+    from leads.roi.matcher import SkillMatcher, lowest_bit_index
+    from leads.roi.skills import _JS_PROTOTYPE_KEYS, JS_WHITESPACE, SKILL_ALIASES, normalize_skill, resolve_alias
+
+    aliases = list(SKILL_ALIASES.items())
+    alias_matcher = SkillMatcher((alias, 1 << i) for i, (alias, _canonical) in enumerate(aliases))
+
+    def resolve_alias_matcher(normalized_skill):
+        if normalized_skill in _JS_PROTOTYPE_KEYS:
+            return None
+        canonical = SKILL_ALIASES.get(normalized_skill)
+        if canonical:
+            return canonical
+        matched = alias_matcher.match(normalized_skill)
+        return aliases[lowest_bit_index(matched)][1] if matched else normalized_skill
+
+    def detect_pillars_loop(user_skills):
+        detected = []
+        for user_skill in user_skills:
+            if not user_skill:
+                continue
+            normalized = user_skill.lower().strip(JS_WHITESPACE)
+            for pillar_key, pillar in PILLAR_DEFINITIONS.items():
+                if pillar_key not in detected and match_skill_to_pillar(normalized, pillar['skills']):
+                    detected.append(pillar_key)
+                    break
+        return detected
+
+    def map_skill_to_pillars_loop(skill_name):
+        skill = _js_trim(skill_name.lower())
+        matched = []
+        for pillar, keywords in SKILL_KEYWORDS.items():
+            for keyword in keywords:
+                if (keyword in skill or skill in keyword) and pillar not in matched:
+                    matched.append(pillar)
+        return matched or ['strategy']
+
+    rng = random.Random(args.seed)
+    vocabulary = [skill for skill in golden._skill_vocabulary() if isinstance(skill, str)]
+    filler = string.ascii_lowercase + '    '
+
+    def dictionary_skill():
+        """A known skill, alias or keyword, or a fragment of one (typical form input)."""
+        word = rng.choice(vocabulary)
+        if rng.random() < 0.3:
+            start = rng.randrange(len(word) + 1)
+            word = word[start:rng.randrange(start, len(word) + 1)]
+        return word.upper() if rng.random() < 0.2 else word
+
+    def free_text_skill():
+        """Random text, half of them ending in a known skill."""
+        text = ''.join(rng.choice(filler) for _ in range(rng.randrange(1, args.length)))
+        return f"{text} {rng.choice(vocabulary)}" if rng.random() < 0.5 else text
+
+    print(f"{'input':<14} {'function':<28} {'loop us/skill':>14} {'compiled us/skill':>18} {'speedup':>8}")
+    for label, make_skill in (('dictionary', dictionary_skill), ('free text', free_text_skill)):
+        raw = [make_skill() for _ in range(args.skills)]
+        normalized = [normalize_skill(skill) for skill in raw]
+        profiles = [raw[i:i + 25] for i in range(0, len(raw), 25)]
+
+        # Same answers first
+        for skill, norm in zip(raw, normalized):
+            assert resolve_alias_matcher(norm) == resolve_alias(norm), norm
+            assert map_skill_to_pillars(skill) == map_skill_to_pillars_loop(skill), skill
+        for profile in profiles:
+            assert detect_pillars(profile) == detect_pillars_loop(profile), profile
+
+        rows = [
+            ('resolve_alias', normalized, resolve_alias, resolve_alias_matcher, 1),
+            ('map_skill_to_pillars', raw, map_skill_to_pillars_loop, map_skill_to_pillars, 1),
+            ('detect_pillars (25 skills)', profiles, detect_pillars_loop, detect_pillars, 25),
+        ]
+        for name, items, loop_fn, compiled_fn, per_item in rows:
+            loop_us = per_skill_us(loop_fn, items) / per_item
+            compiled_us = per_skill_us(compiled_fn, items) / per_item
+            print(f"{label:<14} {name:<28} {loop_us:>14.2f} {compiled_us:>18.2f} {loop_us / compiled_us:>7.1f}x")
+
+    print(f"\n[Bench] {args.skills} skills per input type: compiled and loop results identical")
+
+if __name__ == '__main__':
+    main()
@@ -1,11 +1,15 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class LeadsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'leads'
 
-
-
-
-
+    def ready(self):
+        # Servers (backend/wsgi.py, backend/asgi.py) load the dedupe Bloom filter in the
+        # background while they start, so no request waits for it. Other processes never
+        # scan the leads table just by importing Django: the first check() loads it instead.
+        if settings.LEAD_DEDUPE_ENABLED and settings.LEAD_DEDUPE_WARM_AT_STARTUP:
+            from .dedupe import get_duplicate_detector
+            get_duplicate_detector().warm_in_background()
@@ -0,0 +1,76 @@
+"""
+In-memory cache for static email attachments.
+
+EmailMessage.attach_file() reads the file and base64-encodes it again for every
+message. CachedAttachment reads and encodes the file once, keeps the encoded
+payload in memory and hands out a ready MIME part per message. The file is
+stat()ed on each use and only reloaded when its mtime or size changes, so
+replacing the PDF on disk takes effect without a restart.
+"""
+import mimetypes
+import os
+import threading
+from email import encoders
+from email.mime.base import MIMEBase
+
+
+class CachedAttachment:
+    """
+    A file attachment whose base64-encoded MIME payload is built once.
+
+    Args:
+        path: File to attach
+        mimetype: MIME type (guessed from the file name if omitted)
+    """
+
+    def __init__(self, path, mimetype=None):
+        self.path = path
+        self.filename = os.path.basename(path)
+        self.mimetype = mimetype or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+        self._lock = threading.Lock()
+        self._version = None
+        self._payload = None
+        self._counters = {'loads': 0, 'hits': 0}
+
+    def _current_payload(self):
+        # One stat() per message instead of a full read + base64 encode
+        st = os.stat(self.path)
+        version = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            if version != self._version:
+                with open(self.path, 'rb') as f:
+                    part = MIMEBase(*self.mimetype.split('/', 1))
+                    part.set_payload(f.read())
+                encoders.encode_base64(part)
+                self._payload = part.get_payload()
+                self._version = version
+                self._counters['loads'] += 1
+            else:
+                self._counters['hits'] += 1
+            return self._payload
+
+    def mime_part(self):
+        """
+        Build a MIME part for one message from the cached encoded payload.
+
+        Each message gets its own part object (the encoded string is shared),
+        so concurrent senders never touch the same headers.
+
+        Returns:
+            MIMEBase: Base64 attachment part with Content-Disposition set
+
+        Raises:
+            OSError: If the file is missing or unreadable
+        """
+        part = MIMEBase(*self.mimetype.split('/', 1))
+        part.set_payload(self._current_payload())
+        part['Content-Transfer-Encoding'] = 'base64'
+        part.add_header('Content-Disposition', 'attachment', filename=self.filename)
+        return part
+
+    def stats(self):
+        """Loads from disk vs. cache hits, plus the cached payload size in bytes."""
+        with self._lock:
+            stats = dict(self._counters)
+            stats['cached_bytes'] = len(self._payload) if self._payload else 0
+        return stats
@@ -0,0 +1,181 @@
+"""
+Bulk roadmap email sending.
+
+Replays roadmap emails for leads whose roadmap_sent_at is still NULL, e.g. after
+an SMTP outage, over ONE SMTP session instead of one worker task per lead:
+
+- Leads are read from the `leads` table oldest first, in chunks of
+  LEAD_BULK_EMAIL_CHUNK_SIZE
+- Every message goes through the same backend connection via send_messages()
+- A sliding one-minute window keeps the send rate at or below
+  LEAD_BULK_EMAIL_RATE_PER_MINUTE (the provider's per-minute cap)
+- roadmap_sent_at is stamped after every chunk, so a rerun resumes with the
+  first lead that was not sent
+
+Delivery is at-least-once: if the process dies in the middle of a chunk, the
+messages already sent from that chunk are sent again on the next run.
+
+Used by the `send_roadmaps` management command.
+"""
+import smtplib
+import time
+from collections import deque
+
+from django.conf import settings
+from django.core.mail import get_connection
+from django.utils import timezone
+
+from .emails import build_roadmap_email
+from .models import Lead
+
+
+class RateLimiter:
+    """
+    Sliding-window limiter: at most `per_minute` sends in any 60 second window.
+
+    Args:
+        per_minute: Maximum number of messages per minute
+        clock / sleep: Injectable time functions (time.monotonic / time.sleep)
+    """
+
+    WINDOW = 60.0
+
+    def __init__(self, per_minute, clock=time.monotonic, sleep=time.sleep):
+        if per_minute < 1:
+            raise ValueError("per_minute must be at least 1")
+        self.per_minute = per_minute
+        self._clock = clock
+        self._sleep = sleep
+        self._sent = deque()
+
+    def acquire(self):
+        """Block until one more send fits in the window, then record it."""
+        while True:
+            now = self._clock()
+            while self._sent and now - self._sent[0] >= self.WINDOW:
+                self._sent.popleft()
+            if len(self._sent) < self.per_minute:
+                self._sent.append(now)
+                return
+            self._sleep(self.WINDOW - (now - self._sent[0]))
+
+
+def mark_roadmap_sent(emails, sent_at=None):
+    """
+    Stamp roadmap_sent_at for the given leads (rows already stamped are left alone).
+
+    Returns:
+        int: Number of rows updated
+    """
+    if not emails:
+        return 0
+    return Lead.objects.filter(email__in=list(emails), roadmap_sent_at__isnull=True).update(
+        roadmap_sent_at=sent_at or timezone.now()
+    )
+
+
+def defer_roadmap_email(full_name, email, phone_number):
+    """
+    Leave a lead's roadmap email to send_roadmaps (the worker pool rejected it).
+
+    In outbox mode the lead row already exists; in inline mode the webhook has
+    already delivered the lead, so the row is created as sent to Google Sheets
+    and only waits for its email. An existing row gets roadmap_sent_at cleared.
+
+    Returns:
+        bool: True if a new row was created
+    """
+    inline = settings.LEAD_WEBHOOK_MODE != 'outbox'
+    now = timezone.now()
+    _lead, created = Lead.objects.get_or_create(
+        email=email,
+        defaults={
+            'full_name': full_name,
+            'phone_number': phone_number,
+            'sheets_status': Lead.SHEETS_SENT if inline else Lead.SHEETS_PENDING,
+            'sheets_sent_at': now if inline else None,
+        },
+    )
+    if not created:
+        Lead.objects.filter(email=email).update(roadmap_sent_at=None, roadmap_requested=True)
+    return created
+
+
+def unsent_leads(include_imported=False):
+    """
+    Leads still waiting for their roadmap email, oldest first.
+
+    Args:
+        include_imported: Also include bulk-imported leads that never asked
+            for the roadmap (roadmap_requested=False)
+    """
+    leads = Lead.objects.filter(roadmap_sent_at__isnull=True)
+    if not include_imported:
+        leads = leads.filter(roadmap_requested=True)
+    return leads.order_by('created_at', 'email')
+
+
+def send_roadmaps_bulk(limit=None, chunk_size=None, rate_per_minute=None, limiter=None, log=print,
+                       include_imported=False):
+    """
+    Send roadmap emails to unsent leads over a single SMTP connection.
+
+    Args:
+        limit: Maximum number of leads to process in this run (None = all)
+        chunk_size: Leads loaded and stamped per round trip (defaults to LEAD_BULK_EMAIL_CHUNK_SIZE)
+        rate_per_minute: Send cap (defaults to LEAD_BULK_EMAIL_RATE_PER_MINUTE)
+        limiter: Optional RateLimiter instance (overrides rate_per_minute)
+        log: Callable used for progress lines
+        include_imported: Also email bulk-imported leads (see unsent_leads())
+
+    Returns:
+        dict: {"sent", "refused", "remaining", "aborted"} - refused leads had their
+        recipient rejected and stay unsent; aborted holds the error that ended the
+        run early (the connection failed), or '' if the run completed
+    """
+    chunk_size = chunk_size or settings.LEAD_BULK_EMAIL_CHUNK_SIZE
+    limiter = limiter or RateLimiter(rate_per_minute or settings.LEAD_BULK_EMAIL_RATE_PER_MINUTE)
+    result = {'sent': 0, 'refused': 0, 'remaining': 0, 'aborted': ''}
+    refused = set()
+    processed = 0
+
+    connection = get_connection(fail_silently=False)
+    connection.open()
+    try:
+        while limit is None or processed < limit:
+            size = chunk_size if limit is None else min(chunk_size, limit - processed)
+            chunk = list(unsent_leads(include_imported).exclude(email__in=refused)[:size])
+            if not chunk:
+                break
+
+            sent = []
+            try:
+                for lead in chunk:
+                    limiter.acquire()
+                    message = build_roadmap_email(lead.email, lead.full_name, connection=connection)
+                    try:
+                        if not connection.send_messages([message]):
+                            raise smtplib.SMTPException("Backend reported the message as not sent")
+                    except smtplib.SMTPRecipientsRefused as e:
+                        # Per-message rejection: skip the lead, keep the session
+                        refused.add(lead.email)
+                        result['refused'] += 1
+                        log(f"[Bulk Email] ⚠️ Refused {lead.email}: {str(e)}")
+                    else:
+                        sent.append(lead.email)
+                    processed += 1
+            except (OSError, smtplib.SMTPException) as e:
+                # Session-level failure: stop here, the next run resumes
+                result['aborted'] = f"{type(e).__name__}: {str(e)}"
+                log(f"[Bulk Email] ❌ SMTP session failed, stopping: {result['aborted']}")
+                break
+            finally:
+                mark_roadmap_sent(sent)
+                result['sent'] += len(sent)
+
+            log(f"[Bulk Email] ✅ Sent {result['sent']} email(s) so far")
+    finally:
+        connection.close()
+
+    result['remaining'] = unsent_leads(include_imported).count()
+    return result
@@ -0,0 +1,327 @@
+"""
+Streaming bulk lead import.
+
+Parses an NDJSON stream (one JSON object per line) or a single JSON array
+incrementally from a file-like object, so a 50k-row partner list is never
+held in memory. Rows are validated with the shared rules in leads/validators.py
+and written to the `leads` table with bulk_create() in chunks of
+LEAD_IMPORT_CHUNK_SIZE. import_leads() yields one result per input row as soon
+as the row's chunk has been written.
+
+Imported leads enter the outbox (sheets_status='pending'), so dispatch_outbox
+delivers them. They did not ask for a roadmap, so they are stored with
+roadmap_requested=False: send_roadmaps only emails them with
+--include-imported, and a lead that later submits the form gets it as usual.
+"""
+import json
+
+from django.conf import settings
+from django.utils import timezone
+
+from .models import Lead
+from .validators import validate_many
+
+READ_SIZE = 64 * 1024
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = ' \t\r\n'
+
+
+class ImportParseError(ValueError):
+    """Raised when the request body is not valid NDJSON / JSON array syntax."""
+
+
+def _read_text(stream, read_size):
+    """Yield decoded text chunks from a binary stream (UTF-8, split-safe)."""
+    pending = b''
+    while True:
+        chunk = stream.read(read_size)
+        if not chunk:
+            break
+        data = pending + chunk
+        try:
+            text = data.decode('utf-8')
+            pending = b''
+        except UnicodeDecodeError as e:
+            # A multi-byte character may be cut at the chunk boundary
+            if e.start < len(data) - 3:
+                raise ImportParseError(f"Invalid UTF-8 at byte offset {e.start}")
+            text = data[:e.start].decode('utf-8')
+            pending = data[e.start:]
+        if text:
+            yield text
+    if pending:
+        raise ImportParseError("Body ends with an incomplete UTF-8 character")
+
+
+def iter_ndjson(stream, read_size=READ_SIZE):
+    """
+    Parse newline-delimited JSON incrementally.
+
+    Yields:
+        tuple: (row_number, record) - record is the decoded value, or an
+        ImportParseError instance for a line that is not valid JSON (the rest
+        of the stream is still processed). Blank lines are skipped.
+    """
+    row = 0
+    buffer = ''
+    for text in _read_text(stream, read_size):
+        buffer += text
+        lines = buffer.split('\n')
+        buffer = lines.pop()
+        for line in lines:
+            if line.strip():
+                row += 1
+                yield row, _parse_line(line)
+    if buffer.strip():
+        row += 1
+        yield row, _parse_line(buffer)
+
+
+def _parse_line(line):
+    try:
+        return json.loads(line)
+    except ValueError as e:
+        return ImportParseError(f"Invalid JSON: {e}")
+
+
+def iter_json_array(stream, read_size=READ_SIZE):
+    """
+    Parse a top-level JSON array one element at a time.
+
+    Yields:
+        tuple: (row_number, record)
+
+    Raises:
+        ImportParseError: If the body is not a well-formed JSON array (the
+        rows before the error have already been yielded)
+    """
+    chunks = _read_text(stream, read_size)
+    buffer = ''
+    pos = 0
+    eof = False
+
+    def fill():
+        nonlocal buffer, pos, eof
+        try:
+            buffer = buffer[pos:] + next(chunks)
+        except StopIteration:
+            buffer = buffer[pos:]
+            eof = True
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            if pos < len(buffer) or eof:
+                return
+            fill()
+
+    skip_whitespace()
+    if pos >= len(buffer) or buffer[pos] != '[':
+        raise ImportParseError("Expected a JSON array")
+    pos += 1
+
+    row = 0
+    expect_value = True
+    while True:
+        skip_whitespace()
+        if pos >= len(buffer):
+            raise ImportParseError(f"Unterminated JSON array after row {row}")
+        char = buffer[pos]
+        if char == ']' and (row == 0 or not expect_value):
+            pos += 1
+            break
+        if not expect_value:
+            if char != ',':
+                raise ImportParseError(f"Expected ',' or ']' after row {row}")
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            value, end = _decoder.raw_decode(buffer, pos)
+        except ValueError as e:
+            if eof:
+                raise ImportParseError(f"Invalid JSON in row {row + 1}: {getattr(e, 'msg', e)}")
+            fill()
+            continue
+        if end == len(buffer) and not eof:
+            # A number or literal may continue in the next chunk
+            fill()
+            continue
+        pos = end
+        row += 1
+        expect_value = False
+        yield row, value
+
+    skip_whitespace()
+    if pos < len(buffer):
+        raise ImportParseError("Unexpected data after the JSON array")
+
+
+NDJSON_CONTENT_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl', 'application/x-jsonlines')
+
+
+def parser_for(content_type):
+    """
+    Pick the body parser from the request Content-Type.
+
+    Returns:
+        callable: iter_ndjson for NDJSON types, iter_json_array for
+        application/json, or None for anything else
+    """
+    content_type = (content_type or '').split(';')[0].strip().lower()
+    if content_type in NDJSON_CONTENT_TYPES:
+        return iter_ndjson
+    if content_type == 'application/json':
+        return iter_json_array
+    return None
+
+
+class _PeekedStream:
+    """A stream whose first chunk has already been read."""
+
+    def __init__(self, first, stream):
+        self._first = first
+        self._stream = stream
+
+    def read(self, size=-1):
+        if self._first:
+            first, self._first = self._first, b''
+            return first
+        return self._stream.read(size)
+
+
+def open_body(request):
+    """
+    The raw body of a DRF request as a binary stream, or None if it is empty.
+
+    DRF's request.stream is None without a Content-Length, and Django's
+    WSGIRequest then reads nothing, so chunked uploads (curl -T -) are read
+    from wsgi.input directly when the server has de-chunked it
+    (wsgi.input_terminated); under ASGI the Django request holds the whole body.
+
+    Args:
+        request: rest_framework.request.Request
+
+    Returns:
+        file-like or None: Object with read(size)
+    """
+    stream = request.stream
+    if stream is None:
+        django_request = request._request
+        environ = getattr(django_request, 'environ', {})
+        stream = environ['wsgi.input'] if environ.get('wsgi.input_terminated') else django_request
+    first = stream.read(READ_SIZE)
+    if not first:
+        return None
+    return _PeekedStream(first, stream)
+
+
+def _write_chunk(chunk):
+    """
+    Store the valid rows of one chunk.
+
+    Args:
+        chunk: List of (row_number, payload or None)
+
+    Returns:
+        dict: {row_number: "created" | "duplicate"} for the valid rows
+    """
+    emails = [payload['email'] for _row, payload in chunk if payload]
+    if not emails:
+        return {}
+    taken = set(Lead.objects.filter(email__in=emails).values_list('email', flat=True))
+
+    now = timezone.now()
+    statuses = {}
+    new_leads = {}
+    for row, payload in chunk:
+        if payload is None:
+            continue
+        if payload['email'] in taken:
+            statuses[row] = 'duplicate'
+            continue
+        # First occurrence wins; later rows with the same email are duplicates
+        taken.add(payload['email'])
+        statuses[row] = 'created'
+        new_leads[row] = Lead(
+            email=payload['email'],
+            full_name=payload['full_name'],
+            phone_number=payload['phone_number'],
+            sheets_status=Lead.SHEETS_PENDING,
+            sheets_next_attempt_at=now,
+            roadmap_requested=False,
+        )
+    if not new_leads:
+        return statuses
+    # ignore_conflicts covers a concurrent insert of the same email; that row keeps
+    # its own created_at, so re-reading the chunk's emails shows which inserts lost
+    Lead.objects.bulk_create(list(new_leads.values()), ignore_conflicts=True)
+    stored = dict(
+        Lead.objects.filter(email__in=[lead.email for lead in new_leads.values()])
+        .values_list('email', 'created_at')
+    )
+    for row, lead in new_leads.items():
+        if stored.get(lead.email) != lead.created_at:
+            statuses[row] = 'duplicate'
+    return statuses
+
+
+def import_leads(records, chunk_size=None):
+    """
+    Validate and store leads from an iterable of (row_number, record).
+
+    Args:
+        records: Output of iter_ndjson() / iter_json_array()
+        chunk_size: Rows per bulk_create (defaults to LEAD_IMPORT_CHUNK_SIZE)
+
+    Yields:
+        dict: {"row", "status", ...} per row, in input order - status is
+        "created", "duplicate" (email already stored or repeated in the
+        upload) or "invalid" (with "errors"). The last item is
+        {"summary": {"rows", "created", "duplicate", "invalid"}}; an
+        ImportParseError in the body ends the report with {"error": ...}.
+    """
+    chunk_size = chunk_size or settings.LEAD_IMPORT_CHUNK_SIZE
+    summary = {'rows': 0, 'created': 0, 'duplicate': 0, 'invalid': 0}
+    chunk = []
+
+    def drain():
+        validated = iter(validate_many(
+            record for _row, record in chunk if not isinstance(record, ImportParseError)
+        ))
+        rows = []
+        for row, record in chunk:
+            if isinstance(record, ImportParseError):
+                rows.append((row, None, {'non_field_errors': [str(record)]}))
+            else:
+                rows.append((row,) + next(validated))
+        chunk.clear()
+
+        statuses = _write_chunk([(row, payload) for row, payload, _errors in rows])
+        for row, payload, errors in rows:
+            if payload is None:
+                result = {"row": row, "status": "invalid", "errors": errors}
+            else:
+                result = {"row": row, "status": statuses[row], "email": payload['email']}
+            summary[result['status']] += 1
+            yield result
+
+    try:
+        for row, record in records:
+            summary['rows'] += 1
+            chunk.append((row, record))
+            if len(chunk) >= chunk_size:
+                yield from drain()
+    except ImportParseError as e:
+        yield from drain()
+        yield {"error": str(e)}
+        yield {"summary": summary}
+        return
+
+    yield from drain()
+    yield {"summary": summary}
@@ -0,0 +1,65 @@
+"""
+Keyset cursors over the leads table.
+
+Leads are walked in (created_at, email) order. email is the primary key, so
+the pair is unique and "rows after (created_at, email)" is a stable position
+that survives inserts - unlike OFFSET. A cursor is that pair encoded as an
+opaque URL-safe token.
+"""
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+
+
+class InvalidCursor(ValueError):
+    """Raised when a cursor token cannot be decoded."""
+
+
+def encode_cursor(created_at, email):
+    """
+    Encode a (created_at, email) position as a URL-safe token.
+
+    Returns:
+        str: Opaque cursor token
+    """
+    raw = json.dumps([created_at.isoformat(), email], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token):
+    """
+    Decode a token produced by encode_cursor().
+
+    Returns:
+        tuple: (created_at as aware datetime, email)
+
+    Raises:
+        InvalidCursor: If the token is malformed
+    """
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        created_at, email = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        parsed = parse_datetime(created_at)
+    except (binascii.Error, UnicodeError, ValueError, TypeError):
+        raise InvalidCursor("Invalid cursor")
+    if parsed is None or parsed.tzinfo is None or not isinstance(email, str):
+        raise InvalidCursor("Invalid cursor")
+    return parsed, email
+
+
+def after_q(created_at, email):
+    """Filter for rows strictly after (created_at, email) in ascending order."""
+    return Q(created_at__gt=created_at) | Q(created_at=created_at, email__gt=email)
+
+
+def before_q(created_at, email):
+    """Filter for rows strictly before (created_at, email), i.e. after it in descending order."""
+    return Q(created_at__lt=created_at) | Q(created_at=created_at, email__lt=email)
+
+
+def lead_cursor(lead):
+    """Cursor pointing at a Lead instance."""
+    return encode_cursor(lead.created_at, lead.email)
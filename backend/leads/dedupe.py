@@ -0,0 +1,317 @@
+"""
+In-process duplicate-email detection for lead submission.
+
+Most duplicate submissions are the same user clicking submit again. Before
+calling the webhook or writing the outbox, the views ask DuplicateDetector:
+
+1. LRU of recently accepted emails (LEAD_DEDUPE_LRU_SIZE entries)
+   -> hit: known duplicate, answered without the DB or Google Sheets
+2. Bloom filter of every email in the leads table, loaded by a background
+   thread started at app startup (LeadsConfig.ready())
+   -> miss: definitely new, no lookup needed
+3. Bloom filter hit that is not in the LRU
+   -> confirmed with one primary-key lookup; a miss there is a false positive.
+      A stored lead that never got its roadmap email (roadmap_sent_at is NULL,
+      e.g. a bulk import) is treated as new so the email still goes out.
+
+Only emails whose roadmap email was actually sent are recorded, so a user
+whose email failed can always resubmit.
+
+Stages 2 and 3 run in outbox mode only (LEAD_WEBHOOK_MODE = 'outbox'), where
+every accepted lead has a row to confirm a Bloom hit against. Inline mode
+delivers leads to the webhook without storing them, so a confirmation would
+miss every real duplicate; there only the LRU is used, and an email that has
+left it is treated as new.
+
+Dedupe never fails a submission: until the Bloom filter is loaded, and
+whenever the database errors, anything not in the LRU is treated as new
+(a failed load is retried in the background after WARM_RETRY_SECONDS).
+
+Memory is fixed up front: the Bloom filter is sized for
+LEAD_DEDUPE_BLOOM_CAPACITY emails at LEAD_DEDUPE_BLOOM_ERROR_RATE (about 1.2 MB
+for 1M emails at 1%). Past that capacity the false-positive rate climbs
+(reported as estimated_false_positive_rate) but the answers stay correct,
+since every Bloom hit is confirmed.
+
+State is per process and only grows: a lead deleted from the table stays
+"seen" until the process restarts.
+"""
+import hashlib
+import math
+import threading
+import time
+import traceback
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import connection
+
+from .models import Lead
+
+NEW = 'new'
+DUPLICATE = 'duplicate'
+
+WARM_PAGE_SIZE = 5000
+WARM_RETRY_SECONDS = 30
+
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over strings.
+
+    Uses k bit positions derived from one BLAKE2b digest (double hashing).
+    Not thread-safe on its own; DuplicateDetector serializes access.
+    """
+
+    def __init__(self, capacity, error_rate):
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("Bloom filter needs capacity >= 1 and 0 < error_rate < 1")
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, value):
+        digest = hashlib.blake2b(value.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.size for i in range(self.hashes)]
+
+    def add(self, value):
+        for position in self._positions(value):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, value):
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(value))
+
+    def estimated_error_rate(self):
+        """False-positive rate expected for the number of values added so far."""
+        return (1 - math.exp(-self.hashes * self.count / self.size)) ** self.hashes
+
+
+class DuplicateDetector:
+    """
+    LRU + Bloom filter in front of the lead write path.
+
+    Args:
+        lru_size: Recently accepted emails kept for lookup-free duplicate answers
+        capacity: Emails the Bloom filter is sized for
+        error_rate: Target Bloom filter false-positive rate at capacity
+        use_bloom: False for the LRU alone (inline mode, no rows to confirm against)
+    """
+
+    def __init__(self, lru_size, capacity, error_rate, use_bloom=True):
+        self.lru_size = lru_size
+        self.use_bloom = use_bloom
+        self._recent = OrderedDict()
+        self._bloom = BloomFilter(capacity, error_rate)
+        self._lock = threading.Lock()
+        self._warm = False
+        self._warm_lock = threading.Lock()
+        self._warming = False
+        self._last_warm_attempt = None
+        self._counters = {
+            'checks': 0,
+            'lru_hits': 0,
+            'lru_misses': 0,
+            'bloom_negatives': 0,
+            'bloom_positives': 0,
+            'confirmed_duplicates': 0,
+            'false_positives': 0,
+            'unsent': 0,
+            'not_warm': 0,
+            'errors': 0,
+        }
+
+    def warm(self):
+        """Load every email in the leads table into the Bloom filter (once)."""
+        if self._warm or not self.use_bloom:
+            return
+        with self._warm_lock:
+            if self._warm:
+                return
+            loaded = 0
+            last = None
+            # Keyset pages: the MySQL drivers buffer whole result sets client-side
+            while True:
+                page = Lead.objects.order_by('email')
+                if last is not None:
+                    page = page.filter(email__gt=last)
+                emails = list(page.values_list('email', flat=True)[:WARM_PAGE_SIZE])
+                with self._lock:
+                    for email in emails:
+                        self._bloom.add(email)
+                loaded += len(emails)
+                if len(emails) < WARM_PAGE_SIZE:
+                    break
+                last = emails[-1]
+            self._warm = True
+            print(f"[Dedupe] Bloom filter loaded with {loaded} email(s)")
+
+    def warm_in_background(self):
+        """
+        Start warm() on a daemon thread unless loaded, loading, or recently failed.
+
+        Returns:
+            bool: True if a thread was started
+        """
+        with self._lock:
+            now = time.monotonic()
+            recently_failed = (
+                self._last_warm_attempt is not None
+                and now - self._last_warm_attempt < WARM_RETRY_SECONDS
+            )
+            if not self.use_bloom or self._warm or self._warming or recently_failed:
+                return False
+            self._warming = True
+            self._last_warm_attempt = now
+
+        def run():
+            try:
+                self.warm()
+            except Exception as e:
+                print(f"[Dedupe] ⚠️ Could not load Bloom filter (retrying later): {str(e)}")
+                traceback.print_exc()
+            finally:
+                connection.close()
+                with self._lock:
+                    self._warming = False
+
+        threading.Thread(target=run, name='dedupe-warm', daemon=True).start()
+        return True
+
+    def check(self, email):
+        """
+        Classify a normalized email before it is submitted.
+
+        Args:
+            email: Normalized email address
+
+        Returns:
+            str: DUPLICATE if the email is already known, NEW otherwise
+            (also NEW while the Bloom filter is loading or the database fails)
+        """
+        with self._lock:
+            self._counters['checks'] += 1
+            if email in self._recent:
+                self._recent.move_to_end(email)
+                self._counters['lru_hits'] += 1
+                return DUPLICATE
+            if not self.use_bloom:
+                self._counters['lru_misses'] += 1
+                return NEW
+            warm = self._warm
+            if not warm:
+                self._counters['not_warm'] += 1
+        if not warm:
+            self.warm_in_background()
+            return NEW
+
+        with self._lock:
+            if email not in self._bloom:
+                self._counters['bloom_negatives'] += 1
+                return NEW
+            self._counters['bloom_positives'] += 1
+
+        try:
+            stored = list(Lead.objects.filter(email=email).values_list('roadmap_sent_at', flat=True)[:1])
+        except Exception as e:
+            # Fail open: a database outage must not turn lead capture into a 500
+            with self._lock:
+                self._counters['errors'] += 1
+            print(f"[Dedupe] ⚠️ Lookup failed, treating {email} as new: {str(e)}")
+            return NEW
+        with self._lock:
+            if not stored:
+                self._counters['false_positives'] += 1
+                return NEW
+            if stored[0] is None:
+                # Stored (e.g. bulk imported) but never emailed: let it through
+                self._counters['unsent'] += 1
+                return NEW
+            self._counters['confirmed_duplicates'] += 1
+            self._remember(email)
+            return DUPLICATE
+
+    def record(self, email):
+        """Remember an email whose roadmap email has just been sent."""
+        with self._lock:
+            if self.use_bloom:
+                self._bloom.add(email)
+            self._remember(email)
+
+    def _remember(self, email):
+        self._recent[email] = True
+        self._recent.move_to_end(email)
+        while len(self._recent) > self.lru_size:
+            self._recent.popitem(last=False)
+
+    def stats(self):
+        """
+        Counters plus hit / false-positive rates and memory use.
+
+        Without the Bloom stage only the LRU counters and rates are reported.
+        """
+        with self._lock:
+            stats = dict(self._counters)
+            stats.update(
+                lru_size=len(self._recent),
+                lru_max_size=self.lru_size,
+                bloom_enabled=self.use_bloom,
+            )
+            if not self.use_bloom:
+                for name in ('bloom_negatives', 'bloom_positives', 'confirmed_duplicates',
+                             'false_positives', 'unsent', 'not_warm', 'errors'):
+                    del stats[name]
+                checks = stats['checks']
+                stats['hit_rate'] = round(stats['lru_hits'] / checks, 4) if checks else 0.0
+                stats['lookup_free_rate'] = 1.0 if checks else 0.0
+                return stats
+            del stats['lru_misses']
+            stats.update(
+                bloom_items=self._bloom.count,
+                bloom_capacity=self._bloom.capacity,
+                bloom_bytes=len(self._bloom.bits),
+                bloom_hashes=self._bloom.hashes,
+                estimated_false_positive_rate=round(self._bloom.estimated_error_rate(), 6),
+                warm=self._warm,
+            )
+        duplicates = stats['lru_hits'] + stats['confirmed_duplicates']
+        stats['hit_rate'] = round(duplicates / stats['checks'], 4) if stats['checks'] else 0.0
+        stats['lookup_free_rate'] = round(
+            (stats['lru_hits'] + stats['bloom_negatives']) / stats['checks'], 4
+        ) if stats['checks'] else 0.0
+        stats['false_positive_rate'] = round(
+            stats['false_positives'] / stats['bloom_positives'], 4
+        ) if stats['bloom_positives'] else 0.0
+        return stats
+
+
+_detector = None
+_detector_lock = threading.Lock()
+
+
+def get_duplicate_detector():
+    """Process-wide DuplicateDetector, created on first use."""
+    global _detector
+    if _detector is None:
+        with _detector_lock:
+            if _detector is None:
+                _detector = DuplicateDetector(
+                    lru_size=settings.LEAD_DEDUPE_LRU_SIZE,
+                    capacity=settings.LEAD_DEDUPE_BLOOM_CAPACITY,
+                    error_rate=settings.LEAD_DEDUPE_BLOOM_ERROR_RATE,
+                    use_bloom=settings.LEAD_WEBHOOK_MODE == 'outbox',
+                )
+    return _detector
+
+
+def dedupe_stats():
+    """Stats of the process-wide detector (empty dict when disabled)."""
+    if not settings.LEAD_DEDUPE_ENABLED:
+        return {}
+    return get_duplicate_detector().stats()
@@ -0,0 +1,113 @@
+"""
+Roadmap email construction.
+
+Builds the roadmap EmailMultiAlternatives (plain text, HTML alternative and the
+static PDF attachment) in one place, so the per-lead worker in views.py and the
+bulk sender in leads/bulk_email.py send exactly the same message.
+
+Subject lines and bodies come from precompiled templates. Several versions can
+be active at once for A/B tests; each recipient is assigned one by a stable
+hash of their address and the message carries an X-Roadmap-Variant header.
+"""
+import os
+import zlib
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.core.mail import EmailMultiAlternatives
+
+from .attachments import CachedAttachment
+from .templating import TemplateStore
+
+# Static PDF attached to every roadmap email (same file for all leads)
+ROADMAP_PDF_PATH = os.path.join(settings.BASE_DIR, "leads", "assets", "FSM_Roadmap.pdf")
+
+# Read and base64-encoded once, reloaded only when the file changes on disk
+ROADMAP_PDF = CachedAttachment(ROADMAP_PDF_PATH, mimetype='application/pdf')
+
+# Bodies are compiled once from leads/email_templates/ (see leads/templating.py)
+ROADMAP_TEMPLATES = TemplateStore(os.path.join(settings.BASE_DIR, "leads", "email_templates"))
+
+# A/B versions of the roadmap email; ROADMAP_EMAIL_VARIANTS selects the active ones
+ROADMAP_VARIANTS = {
+    'v1': {
+        'subject': "Your Personalized Full Stack Marketing Career Roadmap",
+        'html': 'roadmap_v1.html',
+        'text': 'roadmap_v1.txt',
+    },
+    'v2': {
+        'subject': "{full_name}, your Full Stack Marketing Career Roadmap is inside",
+        'html': 'roadmap_v1.html',
+        'text': 'roadmap_v1.txt',
+    },
+}
+
+
+class RoadmapVariant:
+    """Compiled subject, HTML and plain text templates of one A/B version."""
+
+    def __init__(self, key, subject, html, text):
+        self.key = key
+        self.subject = ROADMAP_TEMPLATES.compile_string(subject)
+        self.html = ROADMAP_TEMPLATES.get(html)
+        self.text = ROADMAP_TEMPLATES.get(text)
+
+
+def _compile_variants():
+    active = [key.strip() for key in settings.ROADMAP_EMAIL_VARIANTS.split(',') if key.strip()]
+    unknown = [key for key in active if key not in ROADMAP_VARIANTS]
+    if not active or unknown:
+        raise ImproperlyConfigured(
+            f"ROADMAP_EMAIL_VARIANTS must list versions from {sorted(ROADMAP_VARIANTS)}, got {unknown or active}"
+        )
+    return [RoadmapVariant(key, **ROADMAP_VARIANTS[key]) for key in active]
+
+
+ACTIVE_VARIANTS = _compile_variants()
+
+
+def choose_variant(email_address):
+    """
+    Pick the A/B version for a recipient.
+
+    The choice is a stable hash of the address, so a lead always gets the same
+    version (also when the bulk sender replays it).
+    """
+    if len(ACTIVE_VARIANTS) == 1:
+        return ACTIVE_VARIANTS[0]
+    index = zlib.crc32(email_address.strip().lower().encode('utf-8')) % len(ACTIVE_VARIANTS)
+    return ACTIVE_VARIANTS[index]
+
+
+def build_roadmap_email(email_address, full_name, connection=None, variant=None):
+    """
+    Build the roadmap email for one lead.
+
+    Args:
+        email_address: Recipient address
+        full_name: Full name used in the greeting
+        connection: Optional email backend to send through (bulk sends share one)
+        variant: RoadmapVariant to use (defaults to choose_variant(email_address))
+
+    Returns:
+        EmailMultiAlternatives: Message with HTML alternative and PDF attached
+        (the PDF is skipped with a warning if it cannot be read)
+    """
+    variant = variant or choose_variant(email_address)
+    email = EmailMultiAlternatives(
+        subject=variant.subject.render(full_name=full_name),
+        body=variant.text.render(full_name=full_name),
+        from_email=settings.EMAIL_FROM_ADDRESS,
+        to=[email_address],
+        connection=connection,
+        headers={'X-Roadmap-Variant': variant.key},
+    )
+    email.attach_alternative(variant.html.render(full_name=full_name), "text/html")
+
+    try:
+        email.attach(ROADMAP_PDF.mime_part())
+    except Exception as pdf_error:
+        print(f"[Email] ⚠️ Warning: Failed to attach PDF: {str(pdf_error)}")
+        print(f"[Email] Continuing without PDF attachment...")
+        # Continue without PDF - email will still be sent
+    return email
@@ -0,0 +1,147 @@
+"""
+Streaming export of the leads table as CSV or NDJSON.
+
+Rows are read in (created_at, email) order in keyset pages of
+LEAD_EXPORT_CHUNK_SIZE rows, each fetched with .iterator(chunk_size=...). The
+MySQL drivers buffer a whole result set on the client, so paging by key (not
+one big query) is what keeps memory flat from 10k to 10M rows.
+
+Every exported row carries a `cursor`; passing the cursor of the last row
+received as `after` resumes an interrupted export right after that row.
+Used by GET /api/leads/export/ and the `export_leads` management command.
+"""
+import csv
+import json
+from datetime import date, datetime, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+
+from .cursors import after_q, decode_cursor, encode_cursor
+from .models import Lead
+
+EXPORT_FIELDS = [
+    'email', 'full_name', 'phone_number', 'created_at',
+    'sheets_status', 'sheets_sent_at', 'roadmap_sent_at',
+]
+
+FORMATS = ('csv', 'ndjson')
+
+
+def parse_bound(value, end=False):
+    """
+    Parse a created_at filter bound.
+
+    Accepts an ISO datetime or a plain date. A date used as the end bound
+    covers that whole day. Naive values are taken in the project TIME_ZONE.
+
+    Args:
+        value: ISO string (or None)
+        end: True for the exclusive upper bound
+
+    Returns:
+        datetime or None
+
+    Raises:
+        ValueError: If the value is not a valid date or datetime
+    """
+    if not value:
+        return None
+    try:
+        day = parse_date(value)
+        parsed = None if day else parse_datetime(value)
+    except ValueError:
+        day = parsed = None
+    if day is not None:
+        parsed = datetime.combine(day + timedelta(days=1) if end else day, time.min)
+    elif parsed is None:
+        raise ValueError(f"Invalid date or datetime: {value}")
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def iter_leads(created_from=None, created_to=None, after=None, chunk_size=None):
+    """
+    Yield leads in (created_at, email) order, one keyset page at a time.
+
+    Args:
+        created_from: Inclusive lower bound on created_at
+        created_to: Exclusive upper bound on created_at
+        after: Cursor token; only rows after it are returned
+        chunk_size: Rows per page (defaults to LEAD_EXPORT_CHUNK_SIZE)
+
+    Raises:
+        InvalidCursor: If `after` is malformed
+    """
+    chunk_size = chunk_size or settings.LEAD_EXPORT_CHUNK_SIZE
+    base = Lead.objects.order_by('created_at', 'email').only(*EXPORT_FIELDS)
+    if created_from is not None:
+        base = base.filter(created_at__gte=created_from)
+    if created_to is not None:
+        base = base.filter(created_at__lt=created_to)
+
+    position = decode_cursor(after) if after else None
+    while True:
+        page = base.filter(after_q(*position)) if position else base
+        count = 0
+        last = None
+        for lead in page[:chunk_size].iterator(chunk_size=chunk_size):
+            count += 1
+            last = lead
+            yield lead
+        if count < chunk_size:
+            return
+        position = (last.created_at, last.email)
+
+
+def _value(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def lead_row(lead):
+    """Export row for one lead: EXPORT_FIELDS values plus its resume cursor."""
+    row = {field: _value(getattr(lead, field)) for field in EXPORT_FIELDS}
+    row['cursor'] = encode_cursor(lead.created_at, lead.email)
+    return row
+
+
+class _Echo:
+    """File-like object whose write() returns the value (for csv.writer)."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(leads):
+    """Yield CSV text: a header line, then one line per lead."""
+    writer = csv.writer(_Echo())
+    columns = EXPORT_FIELDS + ['cursor']
+    yield writer.writerow(columns)
+    for lead in leads:
+        row = lead_row(lead)
+        yield writer.writerow(['' if row[c] is None else row[c] for c in columns])
+
+
+def stream_ndjson(leads):
+    """Yield one JSON object per line per lead."""
+    for lead in leads:
+        yield json.dumps(lead_row(lead)) + '\n'
+
+
+def stream_export(output, leads):
+    """
+    Serialize leads in the requested format.
+
+    Args:
+        output: 'csv' or 'ndjson'
+        leads: Iterable of Lead (usually iter_leads())
+    """
+    if output == 'csv':
+        return stream_csv(leads)
+    if output == 'ndjson':
+        return stream_ndjson(leads)
+    raise ValueError(f"Unsupported export format: {output}")
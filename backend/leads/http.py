@@ -0,0 +1,144 @@
+"""
+Process-wide pooled HTTP session for outbound webhook calls.
+
+A module-level requests.post() opens a fresh TCP+TLS connection for every call.
+get_session() instead hands out one shared requests.Session whose urllib3 pools
+keep connections alive, so repeated webhook calls reuse warm connections.
+
+Pooled connections that sit idle longer than OUTBOUND_HTTP_IDLE_TIMEOUT are
+recycled before the next request, since the remote end will usually have
+dropped them by then.
+
+get_async_client() is the asyncio counterpart used by the ASGI lead endpoint:
+one httpx.AsyncClient per event loop, with the same pool limits.
+"""
+import asyncio
+import threading
+import time
+import weakref
+
+import requests
+from django.conf import settings
+from requests.adapters import HTTPAdapter
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+_lock = threading.Lock()
+_session = None
+_last_used = 0.0
+
+# Counters from pools that have been recycled, keyed by host
+_retired = {}
+
+# One async client per running event loop
+_async_clients = weakref.WeakKeyDictionary()
+
+
+def _build_session():
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=settings.OUTBOUND_HTTP_POOL_CONNECTIONS,
+        pool_maxsize=settings.OUTBOUND_HTTP_POOL_MAXSIZE,
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+
+def _iter_pools(session):
+    seen = set()
+    for adapter in session.adapters.values():
+        if id(adapter) in seen:
+            continue
+        seen.add(id(adapter))
+        poolmanager = adapter.poolmanager
+        for key in list(poolmanager.pools.keys()):
+            pool = poolmanager.pools.get(key)
+            if pool is not None:
+                yield f"{pool.scheme}://{pool.host}:{pool.port}", pool
+
+
+def _recycle(session):
+    """Fold pool counters into _retired and drop every pooled connection."""
+    for host, pool in _iter_pools(session):
+        totals = _retired.setdefault(host, {'connections': 0, 'requests': 0})
+        totals['connections'] += pool.num_connections
+        totals['requests'] += pool.num_requests
+    for adapter in session.adapters.values():
+        adapter.poolmanager.clear()
+
+
+def get_session():
+    """
+    Return the shared outbound session, recycling idle connections first.
+
+    Returns:
+        requests.Session: Session with keep-alive connection pools
+    """
+    global _session, _last_used
+
+    with _lock:
+        now = time.monotonic()
+        if _session is None:
+            _session = _build_session()
+        elif now - _last_used > settings.OUTBOUND_HTTP_IDLE_TIMEOUT:
+            _recycle(_session)
+        _last_used = now
+        return _session
+
+
+def get_async_client():
+    """
+    Return the httpx.AsyncClient bound to the running event loop.
+
+    Returns:
+        httpx.AsyncClient: Client with keep-alive connection pools
+
+    Raises:
+        RuntimeError: If httpx is not installed
+    """
+    if not HTTPX_AVAILABLE:
+        raise RuntimeError("httpx is required for async webhook calls: pip install httpx")
+
+    loop = asyncio.get_running_loop()
+    client = _async_clients.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=settings.OUTBOUND_HTTP_ASYNC_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.OUTBOUND_HTTP_POOL_MAXSIZE,
+                keepalive_expiry=settings.OUTBOUND_HTTP_IDLE_TIMEOUT,
+            ),
+            # Apps Script answers POSTs with a redirect to the result page
+            follow_redirects=True,
+        )
+        _async_clients[loop] = client
+    return client
+
+
+def connection_stats():
+    """
+    Per-host connection reuse statistics since process start.
+
+    Returns:
+        dict: {host: {"connections": opened, "requests": sent, "reused": requests
+        served by an already-open connection, "reuse_ratio": reused / requests}}
+    """
+    with _lock:
+        stats = {host: dict(totals) for host, totals in _retired.items()}
+        if _session is not None:
+            for host, pool in _iter_pools(_session):
+                totals = stats.setdefault(host, {'connections': 0, 'requests': 0})
+                totals['connections'] += pool.num_connections
+                totals['requests'] += pool.num_requests
+
+    for totals in stats.values():
+        totals['reused'] = max(totals['requests'] - totals['connections'], 0)
+        totals['reuse_ratio'] = (
+            round(totals['reused'] / totals['requests'], 3) if totals['requests'] else 0.0
+        )
+    return stats
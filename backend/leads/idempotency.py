@@ -0,0 +1,112 @@
+"""
+Idempotency-Key support for lead submission.
+
+A client that may retry a submission (the frontend's LeadCaptureModal does,
+on network errors and 5xx responses) sends the same `Idempotency-Key` header
+with every attempt. The first attempt claims the key in the Django cache; a
+retry of a request that succeeded gets the stored response replayed (with
+`Idempotent-Replayed: true`) instead of calling the webhook, writing the lead
+and sending the roadmap email again.
+
+- Key still being processed           -> 409
+- Key reused with a different payload -> 422
+- Failed attempts (non-2xx) are not stored, so they can be retried with the same key
+
+Claims live in the `default` cache for LEAD_IDEMPOTENCY_TTL seconds. The
+default LocMemCache is per process; with several workers configure a shared
+cache (e.g. Redis or Memcached) in CACHES so retries that land on another
+worker are recognised.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+HEADER = 'Idempotency-Key'
+MAX_KEY_LENGTH = 255
+
+_IN_PROGRESS = None
+
+
+class Claim:
+    """A key claimed by the current request; pass it to finish() or release()."""
+
+    def __init__(self, cache_key, fingerprint):
+        self.cache_key = cache_key
+        self.fingerprint = fingerprint
+
+
+def fingerprint(data):
+    """Stable hash of a request payload (key order does not matter)."""
+    raw = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+
+def _cache_key(key):
+    # Hashed so any header value is a valid memcached key
+    return 'leads:idempotency:' + hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _error(status_code, message):
+    return status_code, {"success": False, "message": message}, {}
+
+
+def begin(key, data):
+    """
+    Claim an Idempotency-Key for a request.
+
+    Args:
+        key: Idempotency-Key header value
+        data: Parsed request payload
+
+    Returns:
+        tuple: (claim, reply) - exactly one is None. With a claim the request
+        should be processed and passed to finish(); otherwise reply is
+        (status_code, body, headers) to return as-is.
+    """
+    key = key.strip()
+    if not key or len(key) > MAX_KEY_LENGTH:
+        return None, _error(400, f"Idempotency-Key must be 1-{MAX_KEY_LENGTH} characters")
+
+    claim = Claim(_cache_key(key), fingerprint(data))
+    marker = {'fingerprint': claim.fingerprint, 'status': _IN_PROGRESS, 'body': None}
+    # add() is atomic, so only one of several concurrent attempts wins the key
+    if cache.add(claim.cache_key, marker, timeout=settings.LEAD_IDEMPOTENCY_LOCK_SECONDS):
+        return claim, None
+
+    stored = cache.get(claim.cache_key)
+    if stored is None:
+        # Expired between add() and get(): try once more
+        if cache.add(claim.cache_key, marker, timeout=settings.LEAD_IDEMPOTENCY_LOCK_SECONDS):
+            return claim, None
+        return None, _error(409, "A request with this Idempotency-Key is already in progress")
+    if stored['fingerprint'] != claim.fingerprint:
+        return None, _error(422, "This Idempotency-Key was already used with a different request")
+    if stored['status'] is _IN_PROGRESS:
+        return None, _error(409, "A request with this Idempotency-Key is already in progress")
+
+    print(f"[Idempotency] Replaying stored {stored['status']} response")
+    return None, (stored['status'], stored['body'], {'Idempotent-Replayed': 'true'})
+
+
+def finish(claim, status_code, body):
+    """
+    Record the outcome of a claimed request.
+
+    Successful (2xx) responses are stored for LEAD_IDEMPOTENCY_TTL seconds and
+    replayed to retries; anything else releases the key so it can be retried.
+    """
+    if 200 <= status_code < 300:
+        cache.set(
+            claim.cache_key,
+            {'fingerprint': claim.fingerprint, 'status': status_code, 'body': body},
+            timeout=settings.LEAD_IDEMPOTENCY_TTL,
+        )
+    else:
+        release(claim)
+
+
+def release(claim):
+    """Drop a claim without storing a response (e.g. the request raised)."""
+    cache.delete(claim.cache_key)
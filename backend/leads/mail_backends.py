@@ -0,0 +1,178 @@
+"""
+Pooled SMTP email backend.
+
+Django's SMTP backend opens a connection, runs STARTTLS, logs in and quits for
+every send_messages() call. PooledSMTPEmailBackend keeps authenticated
+connections in a process-wide pool and hands them to the next sender instead:
+
+- At most EMAIL_POOL_MAX_CONNECTIONS connections exist at once
+- A connection idle for longer than EMAIL_POOL_NOOP_AFTER seconds gets a NOOP
+  health check before reuse; one idle past EMAIL_POOL_MAX_IDLE is closed
+- A connection the server dropped mid-send is replaced and the message retried once
+
+Enable with EMAIL_BACKEND = 'leads.mail_backends.PooledSMTPEmailBackend'.
+"""
+import queue
+import smtplib
+import threading
+import time
+
+from django.conf import settings
+from django.core.mail.backends.smtp import EmailBackend
+
+
+class _ConnectionPool:
+    """Idle authenticated SMTP connections plus a cap on open connections."""
+
+    def __init__(self, max_connections):
+        self.max_connections = max_connections
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle = queue.LifoQueue()
+        self.lock = threading.Lock()
+        self.counters = {'opened': 0, 'reused': 0, 'discarded': 0}
+
+    def bump(self, name):
+        with self.lock:
+            self.counters[name] += 1
+
+    def stats(self):
+        with self.lock:
+            stats = dict(self.counters)
+        stats.update(idle=self.idle.qsize(), max_connections=self.max_connections)
+        return stats
+
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = _ConnectionPool(settings.EMAIL_POOL_MAX_CONNECTIONS)
+    return _pool
+
+
+def pool_stats():
+    """Counters for the shared SMTP pool (opened / reused / discarded / idle)."""
+    return get_pool().stats()
+
+
+def _quit_quietly(connection):
+    try:
+        connection.quit()
+    except Exception:
+        try:
+            connection.close()
+        except Exception:
+            pass
+
+
+class PooledSMTPEmailBackend(EmailBackend):
+    """SMTP backend that borrows authenticated connections from a shared pool."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._broken = False
+        self._holds_slot = False
+
+    def _checkout_idle(self):
+        """Return a healthy idle connection from the pool, or None."""
+        pool = get_pool()
+        while True:
+            try:
+                connection, last_used = pool.idle.get_nowait()
+            except queue.Empty:
+                return None
+
+            idle_for = time.monotonic() - last_used
+            if idle_for > settings.EMAIL_POOL_MAX_IDLE:
+                _quit_quietly(connection)
+                pool.bump('discarded')
+                continue
+            if idle_for > settings.EMAIL_POOL_NOOP_AFTER:
+                try:
+                    healthy = connection.noop()[0] == 250
+                except OSError:  # includes smtplib.SMTPException
+                    healthy = False
+                if not healthy:
+                    _quit_quietly(connection)
+                    pool.bump('discarded')
+                    continue
+            return connection
+
+    def open(self):
+        """
+        Borrow a pooled connection, or open and authenticate a new one.
+
+        Returns:
+            bool: True if a connection was checked out, False if this backend
+            already holds one (same contract as EmailBackend.open())
+        """
+        if self.connection:
+            return False
+
+        pool = get_pool()
+        if not pool.slots.acquire(timeout=self.timeout or settings.EMAIL_TIMEOUT):
+            raise smtplib.SMTPException("Timed out waiting for a pooled SMTP connection")
+        self._holds_slot = True
+        self._broken = False
+
+        connection = self._checkout_idle()
+        if connection is not None:
+            self.connection = connection
+            pool.bump('reused')
+            return True
+
+        try:
+            opened = super().open()
+        except BaseException:
+            self._release_slot()
+            raise
+        if not opened:
+            # fail_silently swallowed a connection error
+            self._release_slot()
+            return opened
+        pool.bump('opened')
+        return True
+
+    def _release_slot(self):
+        if self._holds_slot:
+            self._holds_slot = False
+            get_pool().slots.release()
+
+    def close(self):
+        """Return the connection to the pool (or drop it if it broke)."""
+        if self.connection is not None:
+            pool = get_pool()
+            if self._broken:
+                _quit_quietly(self.connection)
+                pool.bump('discarded')
+            else:
+                pool.idle.put((self.connection, time.monotonic()))
+            self.connection = None
+        self._release_slot()
+
+    def _send(self, email_message):
+        fail_silently, self.fail_silently = self.fail_silently, False
+        try:
+            try:
+                return super()._send(email_message)
+            except smtplib.SMTPServerDisconnected:
+                # Server dropped the pooled connection - reconnect and retry once
+                _quit_quietly(self.connection)
+                get_pool().bump('discarded')
+                self.connection = None
+                super().open()
+                get_pool().bump('opened')
+                return super()._send(email_message)
+        except OSError:  # includes smtplib.SMTPException
+            # Connection state is unknown after an SMTP or socket error; do not pool it
+            self._broken = True
+            if not fail_silently:
+                raise
+            return False
+        finally:
+            self.fail_silently = fail_silently
@@ -0,0 +1,123 @@
+"""
+Bounded worker pool for roadmap emails.
+
+Replaces one Thread per lead with a fixed ThreadPoolExecutor. At most
+LEAD_EMAIL_WORKERS SMTP sends run concurrently and at most LEAD_EMAIL_QUEUE_DEPTH
+more wait in the queue. When the pool is full, submit() blocks for up to
+LEAD_EMAIL_SUBMIT_TIMEOUT seconds (backpressure) and then rejects the email.
+The lead views then spill a rejected email to the leads table (a row with
+roadmap_sent_at = NULL, leads/bulk_email.py defer_roadmap_email()), where the
+send_roadmaps command picks it up.
+
+The pool stops accepting work and flushes its queue on process exit.
+"""
+import atexit
+import threading
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+
+
+class EmailDispatcher:
+    """
+    Executor-backed email dispatcher with a bounded queue and counters.
+
+    Counters:
+    - queued: accepted, waiting for a worker
+    - in_flight: currently being sent
+    - sent / failed: finished tasks (task returned truthy / falsy or raised)
+    - rejected: not accepted because the pool was full or shutting down
+    """
+
+    def __init__(self, workers, queue_depth, submit_timeout):
+        self.workers = workers
+        self.queue_depth = queue_depth
+        self.submit_timeout = submit_timeout
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='roadmap-email')
+        self._slots = threading.BoundedSemaphore(workers + queue_depth)
+        self._lock = threading.Lock()
+        self._closed = False
+        self._counters = {'queued': 0, 'in_flight': 0, 'sent': 0, 'failed': 0, 'rejected': 0}
+
+    def _bump(self, **deltas):
+        with self._lock:
+            for name, delta in deltas.items():
+                self._counters[name] += delta
+
+    def submit(self, fn, *args, block=True):
+        """
+        Queue fn(*args) for a worker thread.
+
+        Args:
+            fn: Callable returning True on success
+            block: Wait up to submit_timeout for a free slot when the pool is full
+
+        Returns:
+            bool: True if the task was accepted
+        """
+        timeout = self.submit_timeout if block else 0
+        if self._closed or not self._slots.acquire(timeout=timeout):
+            self._bump(rejected=1)
+            return False
+
+        self._bump(queued=1)
+        try:
+            self._executor.submit(self._run, fn, args)
+        except RuntimeError:
+            # Executor shut down between the check above and submit()
+            self._slots.release()
+            self._bump(queued=-1, rejected=1)
+            return False
+        return True
+
+    def _run(self, fn, args):
+        self._bump(queued=-1, in_flight=1)
+        ok = False
+        try:
+            ok = bool(fn(*args))
+        except Exception:
+            traceback.print_exc()
+        finally:
+            if ok:
+                self._bump(in_flight=-1, sent=1)
+            else:
+                self._bump(in_flight=-1, failed=1)
+            self._slots.release()
+
+    def shutdown(self, wait=True):
+        """Stop accepting work and, with wait=True, send everything still queued."""
+        if self._closed:
+            return
+        self._closed = True
+        stats = self.stats()
+        pending = stats['queued'] + stats['in_flight']
+        if pending:
+            print(f"[Email Pool] Flushing {pending} queued email(s) before exit...")
+        self._executor.shutdown(wait=wait)
+
+    def stats(self):
+        """Snapshot of the dispatcher counters plus its configured limits."""
+        with self._lock:
+            stats = dict(self._counters)
+        stats.update(workers=self.workers, queue_depth=self.queue_depth)
+        return stats
+
+
+_dispatcher = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_email_dispatcher():
+    """Process-wide EmailDispatcher, created on first use and flushed at exit."""
+    global _dispatcher
+    if _dispatcher is None:
+        with _dispatcher_lock:
+            if _dispatcher is None:
+                _dispatcher = EmailDispatcher(
+                    workers=settings.LEAD_EMAIL_WORKERS,
+                    queue_depth=settings.LEAD_EMAIL_QUEUE_DEPTH,
+                    submit_timeout=settings.LEAD_EMAIL_SUBMIT_TIMEOUT,
+                )
+                atexit.register(_dispatcher.shutdown)
+    return _dispatcher
@@ -0,0 +1,55 @@
+"""
+Drain the lead outbox to the Google Sheets webhook.
+
+Usage:
+    python manage.py dispatch_outbox            # run forever
+    python manage.py dispatch_outbox --once     # deliver one batch and exit
+    python manage.py dispatch_outbox --batched --batch-size 100 --flush-interval-ms 250
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from leads.outbox import OutboxDispatcher, drain_outbox, outbox_stats
+
+
+class Command(BaseCommand):
+    help = 'Deliver pending leads from the outbox to the Google Sheets webhook.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true', help='Deliver a single batch and exit.')
+        parser.add_argument('--batch-size', type=int, default=settings.LEAD_OUTBOX_BATCH_SIZE)
+        parser.add_argument(
+            '--batched', action='store_true', default=settings.LEAD_OUTBOX_BATCHED,
+            help='Send each batch as one JSON array instead of one request per lead.'
+        )
+        parser.add_argument(
+            '--flush-interval-ms', type=int, default=settings.LEAD_OUTBOX_FLUSH_INTERVAL_MS,
+            help='Longest time a due lead waits for its batch to fill up (batched mode).'
+        )
+        parser.add_argument(
+            '--poll-interval', type=float, default=settings.LEAD_OUTBOX_POLL_INTERVAL,
+            help='Seconds to sleep when the outbox has nothing due.'
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        mode = 'batched' if options['batched'] else 'per-lead'
+        self.stdout.write(f"[Outbox] Dispatcher started (batch size {batch_size}, {mode})")
+
+        if options['once']:
+            self.report(drain_outbox(batch_size, batched=options['batched']))
+            return
+
+        OutboxDispatcher(
+            batch_size=batch_size,
+            batched=options['batched'],
+            flush_interval_ms=options['flush_interval_ms'],
+            poll_interval=options['poll_interval'],
+        ).run(on_flush=self.report)
+
+    def report(self, result):
+        if any(result.values()):
+            self.stdout.write(
+                f"[Outbox] sent={result['sent']} retried={result['retried']} "
+                f"failed={result['failed']} depth={outbox_stats()['pending']}"
+            )
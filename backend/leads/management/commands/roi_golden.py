@@ -0,0 +1,65 @@
+"""
+Check the Python ROI engine (leads/roi) against the browser engine.
+
+Usage:
+    python manage.py roi_golden                  # compare with leads/roi/golden_cases.json
+    python manage.py roi_golden --live --cases 5000 --seed 7   # compare with the JS engine (needs node)
+    python manage.py roi_golden --regenerate     # rewrite the fixture from the JS engine (needs node)
+
+Also checks the engine's precomputed pillar table against its reference
+calculation (in Python, and in the browser engine with --live / --regenerate).
+Exits with an error if any output differs.
+"""
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from leads.roi import golden
+from leads.roi.engine import verify_pillar_table
+
+
+class Command(BaseCommand):
+    help = 'Verify the Python ROI engine against golden outputs of src/utils/salaryEngine.js.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--live', action='store_true', help='Generate fresh cases and run the JS engine now.')
+        parser.add_argument('--regenerate', action='store_true', help='Rewrite golden_cases.json from the JS engine.')
+        parser.add_argument('--cases', type=int, default=400, help='Engine cases for --live / --regenerate.')
+        parser.add_argument('--legacy-cases', type=int, default=200, help='Legacy calculator cases.')
+        parser.add_argument('--seed', type=int, default=2024)
+        parser.add_argument('--show', type=int, default=5, help='Mismatches to print.')
+
+    def handle(self, *args, **options):
+        table_mismatches = verify_pillar_table()
+        for mismatch in table_mismatches[:options['show']]:
+            self.stderr.write(json.dumps(mismatch, ensure_ascii=False))
+        if table_mismatches:
+            raise CommandError(
+                f"[ROI] ❌ Pillar table differs from the reference calculation in {len(table_mismatches)} case(s)"
+            )
+
+        if options['live'] or options['regenerate']:
+            cases, legacy_cases = golden.generate_cases(options['cases'], options['legacy_cases'], options['seed'])
+            try:
+                expected, legacy_expected = golden.run_js(cases, legacy_cases)
+            except golden.GoldenError as e:
+                raise CommandError(str(e))
+            # Inputs as the JS engine saw them (JSON round trip)
+            cases, legacy_cases = json.loads(json.dumps([cases, legacy_cases]))
+            if options['regenerate']:
+                golden.write_fixture(cases, expected, legacy_cases, legacy_expected, options['seed'])
+                self.stdout.write(f"[ROI] Wrote {len(cases)} + {len(legacy_cases)} golden case(s) to {golden.FIXTURE_PATH}")
+        else:
+            fixture = golden.load_fixture()
+            cases = [case['input'] for case in fixture['cases']]
+            expected = [case['expected'] for case in fixture['cases']]
+            legacy_cases = [case['input'] for case in fixture['legacy']]
+            legacy_expected = [case['expected'] for case in fixture['legacy']]
+
+        mismatches = golden.compare(cases, expected, legacy_cases, legacy_expected)
+        for mismatch in mismatches[:options['show']]:
+            self.stderr.write(json.dumps(mismatch, ensure_ascii=False))
+        total = len(cases) + len(legacy_cases)
+        if mismatches:
+            raise CommandError(f"[ROI] ❌ {len(mismatches)} of {total} case(s) differ from the JS engine")
+        self.stdout.write(f"[ROI] ✅ {total} case(s) match the JS engine")
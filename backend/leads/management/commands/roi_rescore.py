@@ -0,0 +1,64 @@
+"""
+Recompute the stored ROI projection of every lead (leads/roi/batch.py).
+
+Usage:
+    python manage.py roi_rescore                    # after changing pillar constants in leads/roi/engine.py
+    python manage.py roi_rescore --remask           # after changing the skill lists (re-detects pillars)
+    python manage.py roi_rescore --verify           # only check the vectorized tables against the engine
+    python manage.py roi_rescore --chunk-size 10000 --force
+
+Only rows whose projection changed are written, so reruns are cheap.
+"""
+import json
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from leads.roi import batch
+from leads.roi.engine import verify_pillar_table
+
+
+class Command(BaseCommand):
+    help = 'Rescore the ROI projection of every lead with a calculator profile.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size', type=int, default=settings.ROI_RESCORE_CHUNK_SIZE,
+            help='Leads read and written per database round trip.'
+        )
+        parser.add_argument('--remask', action='store_true', help='Re-detect pillars from the stored skills first.')
+        parser.add_argument('--force', action='store_true', help='Write every row, not only changed ones.')
+        parser.add_argument('--verify', action='store_true', help='Check the tables against the engine and exit.')
+
+    def handle(self, *args, **options):
+        if options['chunk_size'] < 1:
+            raise CommandError("--chunk-size must be at least 1")
+
+        mismatches = verify_pillar_table() + batch.verify_tables()
+        for mismatch in mismatches[:5]:
+            self.stderr.write(json.dumps(mismatch))
+        if mismatches:
+            raise CommandError(
+                f"[ROI] ❌ {len(mismatches)} profile(s) score differently from the engine; "
+                'check the pillar table in leads/roi/engine.py'
+            )
+        if options['verify']:
+            self.stdout.write(f"[ROI] ✅ Tables match the engine for all {batch.MASK_COUNT} pillar combinations")
+            return
+
+        if not batch.NUMPY_AVAILABLE:
+            self.stdout.write("[ROI] ⚠️ NumPy not installed, scoring row by row")
+
+        def progress(stats):
+            self.stdout.write(f"[ROI] {stats['scanned']} lead(s) scanned, {stats['updated']} updated")
+
+        stats = batch.rescore_leads(
+            chunk_size=options['chunk_size'],
+            remask=options['remask'],
+            force=options['force'],
+            on_chunk=progress,
+        )
+        self.stdout.write(
+            f"[ROI] ✅ Rescored {stats['scanned']} lead(s) in {stats['seconds']}s "
+            f"({stats['rows_per_second']} rows/s): updated={stats['updated']} remasked={stats['remasked']}"
+        )
@@ -0,0 +1,61 @@
+"""
+Send roadmap emails to every lead that has not received one yet.
+
+Usage:
+    python manage.py send_roadmaps                      # all unsent leads
+    python manage.py send_roadmaps --limit 200 --rate 30
+    python manage.py send_roadmaps --dry-run            # only count unsent leads
+    python manage.py send_roadmaps --include-imported   # also email bulk-imported leads
+
+Safe to rerun: sent leads are stamped with roadmap_sent_at, so an interrupted
+run resumes with the first lead that was not sent.
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from leads.bulk_email import send_roadmaps_bulk, unsent_leads
+
+
+class Command(BaseCommand):
+    help = 'Send roadmap emails to unsent leads over one rate-limited SMTP connection.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--limit', type=int, default=None, help='Process at most this many leads.')
+        parser.add_argument(
+            '--rate', type=int, default=settings.LEAD_BULK_EMAIL_RATE_PER_MINUTE,
+            help='Maximum emails per minute (stay under the SMTP provider cap).'
+        )
+        parser.add_argument(
+            '--chunk-size', type=int, default=settings.LEAD_BULK_EMAIL_CHUNK_SIZE,
+            help='Leads loaded and marked as sent per database round trip.'
+        )
+        parser.add_argument('--dry-run', action='store_true', help='Report how many leads are unsent and exit.')
+        parser.add_argument(
+            '--include-imported', action='store_true',
+            help='Also email bulk-imported leads, which never asked for the roadmap.'
+        )
+
+    def handle(self, *args, **options):
+        pending = unsent_leads(options['include_imported']).count()
+        self.stdout.write(f"[Bulk Email] {pending} lead(s) without a roadmap email")
+        if options['dry_run'] or not pending:
+            return
+
+        if not settings.EMAIL_HOST_USER or not settings.EMAIL_HOST_PASSWORD:
+            raise CommandError("Email credentials not configured: set EMAIL_HOST_USER and EMAIL_HOST_PASSWORD")
+        if options['rate'] < 1 or options['chunk_size'] < 1:
+            raise CommandError("--rate and --chunk-size must be at least 1")
+
+        self.stdout.write(f"[Bulk Email] Sending at up to {options['rate']} email(s)/minute...")
+        result = send_roadmaps_bulk(
+            limit=options['limit'],
+            chunk_size=options['chunk_size'],
+            rate_per_minute=options['rate'],
+            log=self.stdout.write,
+            include_imported=options['include_imported'],
+        )
+        self.stdout.write(
+            f"[Bulk Email] sent={result['sent']} refused={result['refused']} remaining={result['remaining']}"
+        )
+        if result['aborted']:
+            raise CommandError(f"Stopped early ({result['aborted']}); rerun to resume")
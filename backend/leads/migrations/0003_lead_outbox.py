@@ -0,0 +1,50 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:20
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0002_remove_lead_id_alter_lead_email'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='sheets_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='sheets_last_error',
+            field=models.TextField(blank=True, default=''),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='sheets_next_attempt_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='sheets_sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        # Rows that already exist were stored before the outbox existed; backfill them
+        # as 'sent' so the dispatcher does not replay them, then switch the default.
+        migrations.AddField(
+            model_name='lead',
+            name='sheets_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='sent', max_length=10),
+        ),
+        migrations.AlterField(
+            model_name='lead',
+            name='sheets_status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sent', 'Sent'), ('failed', 'Failed')], default='pending', max_length=10),
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['sheets_status', 'sheets_next_attempt_at'], name='leads_outbox_idx'),
+        ),
+    ]
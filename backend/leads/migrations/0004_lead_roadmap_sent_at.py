@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:35
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def backfill_roadmap_sent_at(apps, schema_editor):
+    # Existing leads were emailed when they were created; stamp them so the
+    # bulk sender does not mail the whole table again
+    Lead = apps.get_model('leads', 'Lead')
+    Lead.objects.filter(roadmap_sent_at__isnull=True).update(roadmap_sent_at=F('created_at'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0003_lead_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='roadmap_sent_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_roadmap_sent_at, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['roadmap_sent_at', 'created_at'], name='leads_roadmap_unsent_idx'),
+        ),
+    ]
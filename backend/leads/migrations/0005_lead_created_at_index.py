@@ -0,0 +1,21 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0004_lead_roadmap_sent_at'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='lead',
+            options={'ordering': ['-created_at', '-email'], 'verbose_name': 'Lead', 'verbose_name_plural': 'Leads'},
+        ),
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['created_at', 'email'], name='leads_created_email_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:43
+
+from django.db import migrations, models
+
+
+def add_fulltext_index(apps, schema_editor):
+    """FULLTEXT index for name token search (MySQL only; other backends fall back to LIKE)."""
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute("CREATE FULLTEXT INDEX leads_full_name_ft ON leads (full_name)")
+
+
+def drop_fulltext_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'mysql':
+        return
+    schema_editor.execute("DROP INDEX leads_full_name_ft ON leads")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0005_lead_created_at_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='lead',
+            index=models.Index(fields=['phone_number'], name='leads_phone_idx'),
+        ),
+        migrations.RunPython(add_fulltext_index, drop_fulltext_index),
+    ]
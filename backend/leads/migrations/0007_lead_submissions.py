@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0006_lead_search_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='submissions',
+            field=models.PositiveIntegerField(default=1),
+        ),
+    ]
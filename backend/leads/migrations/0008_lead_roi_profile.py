@@ -0,0 +1,58 @@
+# Generated by Django 4.2.7 on 2026-10-17 04:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0007_lead_submissions'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='roi_after',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_before',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_current_salary',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_has_full_stack',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_pillar_mask',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_scored_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_skills',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_uplift',
+            field=models.FloatField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='lead',
+            name='roi_user_type',
+            field=models.CharField(blank=True, default='', max_length=12),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.7 on 2026-10-17 05:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('leads', '0008_lead_roi_profile'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='lead',
+            name='roadmap_requested',
+            field=models.BooleanField(default=True),
+        ),
+    ]
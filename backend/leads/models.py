@@ -2,6 +2,7 @@
 Lead model for storing user information from Career ROI tool.
 """
 from django.db import models
+from django.utils import timezone
 
 
 class Lead(models.Model):
@@ -13,18 +14,89 @@ class Lead(models.Model):
     - full_name: User's full name (max 150 characters)
     - phone_number: Indian phone number in +91XXXXXXXXXX format
     - created_at: Timestamp when lead was created (auto-set on creation)
+    - submissions: Times this email was submitted (resubmissions only increment it)
+    
+    Outbox fields (Google Sheets delivery, see leads/outbox.py):
+    - sheets_status: pending / sent / failed
+    - sheets_attempts: Number of delivery attempts made so far
+    - sheets_next_attempt_at: Earliest time the dispatcher may (re)try delivery
+    - sheets_last_error: Error message from the last failed attempt
+    - sheets_sent_at: Timestamp of successful delivery
+    
+    Email fields (see leads/bulk_email.py):
+    - roadmap_sent_at: Timestamp the roadmap email was sent (NULL = not sent yet)
+    - roadmap_requested: The lead asked for the roadmap (False for bulk-imported
+      partner leads until they submit the form themselves)
+    
+    ROI fields (calculator profile sent with the lead, see leads/roi/):
+    - roi_user_type: fresher / experienced ('' = no profile submitted)
+    - roi_skills: Raw skills as entered in the calculator
+    - roi_has_full_stack: Whether the Full Stack Program was selected
+    - roi_current_salary: Current salary in ₹ LPA (experienced users)
+    - roi_pillar_mask: Detected pillars as a bitmask (leads/roi/batch.py PILLAR_BITS)
+    - roi_before / roi_after / roi_uplift: Projected salaries in ₹ LPA
+    - roi_scored_at: When the projection was last (re)calculated
     """
+    SHEETS_PENDING = 'pending'
+    SHEETS_SENT = 'sent'
+    SHEETS_FAILED = 'failed'
+    SHEETS_STATUS_CHOICES = [
+        (SHEETS_PENDING, 'Pending'),
+        (SHEETS_SENT, 'Sent'),
+        (SHEETS_FAILED, 'Failed'),
+    ]
+
     email = models.EmailField(primary_key=True)
     full_name = models.CharField(max_length=150)
     phone_number = models.CharField(max_length=15)
     created_at = models.DateTimeField(auto_now_add=True)
+    submissions = models.PositiveIntegerField(default=1)
+
+    sheets_status = models.CharField(
+        max_length=10, choices=SHEETS_STATUS_CHOICES, default=SHEETS_PENDING
+    )
+    sheets_attempts = models.PositiveSmallIntegerField(default=0)
+    sheets_next_attempt_at = models.DateTimeField(default=timezone.now)
+    sheets_last_error = models.TextField(blank=True, default='')
+    sheets_sent_at = models.DateTimeField(null=True, blank=True)
+
+    roadmap_sent_at = models.DateTimeField(null=True, blank=True)
+    roadmap_requested = models.BooleanField(default=True)
+
+    roi_user_type = models.CharField(max_length=12, blank=True, default='')
+    roi_skills = models.JSONField(default=list, blank=True)
+    roi_has_full_stack = models.BooleanField(default=False)
+    roi_current_salary = models.FloatField(null=True, blank=True)
+    roi_pillar_mask = models.PositiveSmallIntegerField(default=0)
+    roi_before = models.FloatField(null=True, blank=True)
+    roi_after = models.FloatField(null=True, blank=True)
+    roi_uplift = models.FloatField(null=True, blank=True)
+    roi_scored_at = models.DateTimeField(null=True, blank=True)
 
     class Meta:
         db_table = 'leads'
-        ordering = ['-created_at']
+        # email breaks created_at ties so the order is total (keyset pagination relies on it)
+        ordering = ['-created_at', '-email']
         verbose_name = 'Lead'
         verbose_name_plural = 'Leads'
+        indexes = [
+            # Default ordering, admin date filter, exports and keyset pagination
+            models.Index(fields=['created_at', 'email'], name='leads_created_email_idx'),
+            # Dispatcher scans pending rows that are due for delivery
+            models.Index(fields=['sheets_status', 'sheets_next_attempt_at'], name='leads_outbox_idx'),
+            # Phone prefix search (leads/search.py); email prefixes use the primary key
+            models.Index(fields=['phone_number'], name='leads_phone_idx'),
+            # Bulk email sender scans unsent rows oldest first
+            models.Index(fields=['roadmap_sent_at', 'created_at'], name='leads_roadmap_unsent_idx'),
+        ]
 
     def __str__(self):
         return f"{self.full_name} ({self.email})"
 
+    def to_webhook_payload(self):
+        """Payload shape expected by the Google Sheets webhook."""
+        return {
+            "full_name": self.full_name,
+            "email": self.email,
+            "phone_number": self.phone_number
+        }
@@ -0,0 +1,310 @@
+"""
+Durable outbox for Google Sheets webhook delivery.
+
+In outbox mode (LEAD_WEBHOOK_MODE = 'outbox') the API only writes the lead to
+the `leads` table with sheets_status='pending' and answers immediately.
+The `dispatch_outbox` management command drains pending rows to the webhook
+with retries and exponential backoff, either one request per lead or, with
+LEAD_OUTBOX_BATCHED, as one JSON array per batch of up to LEAD_OUTBOX_BATCH_SIZE
+leads gathered for at most LEAD_OUTBOX_FLUSH_INTERVAL_MS.
+
+Delivery is at-least-once: a row is leased (its sheets_next_attempt_at is pushed
+forward) before it is sent, so a crashed dispatcher simply lets the lease expire
+and the row is picked up again.
+"""
+import random
+import time
+import traceback
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils import timezone
+
+from .models import Lead
+from .roi.batch import profile_fields
+from .webhook import send_batch_to_sheets, send_to_sheets
+
+
+def enqueue_lead(full_name, email, phone_number, profile=None):
+    """
+    Write a validated lead to the outbox with one atomic upsert.
+
+    A new email is inserted as pending; a resubmitted email only has its
+    `submissions` counter incremented and roadmap_requested set (a bulk-imported
+    lead has now asked for the roadmap), its outbox state is left alone, so
+    duplicates are detected by the insert itself rather than a prior SELECT.
+    A calculator profile, when given, is stored (or replaced) with its ROI
+    projection in the same statement; if scoring it fails the lead is still
+    queued, without a profile:
+
+    - MySQL: INSERT ... ON DUPLICATE KEY UPDATE (1 affected row = inserted, 2 = updated)
+    - SQLite / PostgreSQL: INSERT ... ON CONFLICT (email) DO UPDATE ... RETURNING submissions
+
+    Args:
+        full_name: Validated full name
+        email: Normalized email address (primary key)
+        phone_number: Phone number in +91XXXXXXXXXX format
+        profile: Optional calculator profile (leads.roi.validation.validate_career_profile())
+
+    Returns:
+        bool: True if the lead was created, False if the email was already stored
+    """
+    lead = Lead(
+        email=email,
+        full_name=full_name,
+        phone_number=phone_number,
+        sheets_status=Lead.SHEETS_PENDING,
+        sheets_next_attempt_at=timezone.now(),
+    )
+    roi = {}
+    if profile:
+        try:
+            roi = profile_fields(profile)
+        except Exception as e:
+            print(f"[Outbox] ⚠️ Could not score calculator profile for {email}, storing lead without it: {e}")
+    for field, value in roi.items():
+        setattr(lead, field, value)
+
+    if connection.vendor not in ('mysql', 'sqlite', 'postgresql'):
+        stored, created = Lead.objects.get_or_create(
+            email=email,
+            defaults={field: getattr(lead, field) for field in (
+                'full_name', 'phone_number', 'sheets_status', 'sheets_next_attempt_at', *roi,
+            )},
+        )
+        if not created:
+            Lead.objects.filter(pk=stored.pk).update(roadmap_requested=True, **roi)
+        return created
+
+    qn = connection.ops.quote_name
+    fields = Lead._meta.concrete_fields
+    values = [field.get_db_prep_save(field.pre_save(lead, True), connection) for field in fields]
+    table = qn(Lead._meta.db_table)
+    submissions = qn(Lead._meta.get_field('submissions').column)
+    replaced = [qn(Lead._meta.get_field(field).column) for field in ('roadmap_requested', *roi)]
+    insert = (
+        f"INSERT INTO {table} ({', '.join(qn(field.column) for field in fields)}) "
+        f"VALUES ({', '.join(['%s'] * len(fields))})"
+    )
+
+    with connection.cursor() as cursor:
+        if connection.vendor == 'mysql':
+            updates = [f"{submissions} = {submissions} + 1"] + [f"{c} = VALUES({c})" for c in replaced]
+            cursor.execute(f"{insert} ON DUPLICATE KEY UPDATE {', '.join(updates)}", values)
+            return cursor.rowcount == 1
+        updates = [f"{submissions} = {table}.{submissions} + 1"] + [f"{c} = excluded.{c}" for c in replaced]
+        cursor.execute(
+            f"{insert} ON CONFLICT ({qn(Lead._meta.pk.column)}) "
+            f"DO UPDATE SET {', '.join(updates)} RETURNING {submissions}",
+            values,
+        )
+        return cursor.fetchone()[0] == 1
+
+
+def backoff_delay(attempts):
+    """
+    Seconds to wait before the next delivery attempt.
+
+    Exponential backoff (base * 2^(attempts-1)) capped at LEAD_OUTBOX_BACKOFF_MAX,
+    with up to 20% jitter so retries from a burst do not hit the webhook together.
+    """
+    base = settings.LEAD_OUTBOX_BACKOFF_BASE
+    delay = min(base * (2 ** max(attempts - 1, 0)), settings.LEAD_OUTBOX_BACKOFF_MAX)
+    return delay * (1 + random.uniform(0, 0.2))
+
+
+def claim_batch(limit):
+    """
+    Lease up to `limit` due rows for delivery.
+
+    Rows are locked with SKIP LOCKED so several dispatchers can run side by side,
+    then leased for LEAD_OUTBOX_LEASE_SECONDS by moving sheets_next_attempt_at.
+
+    Returns:
+        list[Lead]: Leased leads, oldest first
+    """
+    now = timezone.now()
+    lease_until = now + timedelta(seconds=settings.LEAD_OUTBOX_LEASE_SECONDS)
+
+    with transaction.atomic():
+        leads = list(
+            Lead.objects.select_for_update(skip_locked=True)
+            .filter(sheets_status=Lead.SHEETS_PENDING, sheets_next_attempt_at__lte=now)
+            .order_by('sheets_next_attempt_at')[:limit]
+        )
+        if leads:
+            Lead.objects.filter(pk__in=[lead.pk for lead in leads]).update(
+                sheets_next_attempt_at=lease_until
+            )
+    return leads
+
+
+def mark_sent(lead):
+    """Record a successful delivery."""
+    Lead.objects.filter(pk=lead.pk).update(
+        sheets_status=Lead.SHEETS_SENT,
+        sheets_attempts=lead.sheets_attempts + 1,
+        sheets_sent_at=timezone.now(),
+        sheets_last_error='',
+    )
+
+
+def mark_failed(lead, error):
+    """
+    Record a failed delivery and schedule the retry.
+
+    Returns:
+        bool: True if the lead will be retried, False if it was given up on
+    """
+    attempts = lead.sheets_attempts + 1
+    retry = attempts < settings.LEAD_OUTBOX_MAX_ATTEMPTS
+    Lead.objects.filter(pk=lead.pk).update(
+        sheets_status=Lead.SHEETS_PENDING if retry else Lead.SHEETS_FAILED,
+        sheets_attempts=attempts,
+        sheets_next_attempt_at=timezone.now() + timedelta(seconds=backoff_delay(attempts)),
+        sheets_last_error=str(error)[:1000],
+    )
+    return retry
+
+
+def due_count(limit):
+    """Number of leads due for delivery, counting at most `limit` rows."""
+    return Lead.objects.filter(
+        sheets_status=Lead.SHEETS_PENDING, sheets_next_attempt_at__lte=timezone.now()
+    )[:limit].count()
+
+
+def _record_failure(lead, error, result):
+    print(f"[Outbox] ❌ Delivery failed for {lead.email}: {str(error)}")
+    if mark_failed(lead, error):
+        result['retried'] += 1
+    else:
+        print(f"[Outbox] ❌ Giving up on {lead.email} after {lead.sheets_attempts + 1} attempts")
+        result['failed'] += 1
+
+
+def drain_outbox(batch_size=None, batched=None):
+    """
+    Deliver one batch of due leads to the Google Sheets webhook.
+
+    Args:
+        batch_size: Maximum rows to claim (defaults to LEAD_OUTBOX_BATCH_SIZE)
+        batched: Send the batch as one JSON array instead of one request per
+            lead (defaults to LEAD_OUTBOX_BATCHED)
+
+    Returns:
+        dict: Counts of sent, retried and failed (given up) leads
+    """
+    if batch_size is None:
+        batch_size = settings.LEAD_OUTBOX_BATCH_SIZE
+    if batched is None:
+        batched = settings.LEAD_OUTBOX_BATCHED
+
+    result = {'sent': 0, 'retried': 0, 'failed': 0}
+    leads = claim_batch(batch_size)
+    if not leads:
+        return result
+
+    if batched:
+        try:
+            outcomes = send_batch_to_sheets([lead.to_webhook_payload() for lead in leads])
+        except Exception as e:
+            # Whole request failed - every lead in the batch is retried
+            traceback.print_exc()
+            outcomes = [(False, str(e))] * len(leads)
+
+        for lead, (ok, error) in zip(leads, outcomes):
+            if ok:
+                mark_sent(lead)
+                result['sent'] += 1
+            else:
+                _record_failure(lead, error, result)
+        return result
+
+    for lead in leads:
+        try:
+            send_to_sheets(lead.to_webhook_payload())
+        except Exception as e:
+            _record_failure(lead, e, result)
+            continue
+
+        mark_sent(lead)
+        result['sent'] += 1
+
+    return result
+
+
+class OutboxDispatcher:
+    """
+    Long-running outbox drain loop used by the dispatch_outbox command.
+
+    In batched mode the dispatcher waits until `batch_size` leads are due or the
+    oldest due lead has waited `flush_interval_ms`, whichever comes first, and then
+    sends them as a single webhook call.
+    """
+
+    def __init__(self, batch_size=None, batched=None, flush_interval_ms=None, poll_interval=None):
+        self.batch_size = batch_size or settings.LEAD_OUTBOX_BATCH_SIZE
+        self.batched = settings.LEAD_OUTBOX_BATCHED if batched is None else batched
+        self.flush_interval = (
+            flush_interval_ms if flush_interval_ms is not None
+            else settings.LEAD_OUTBOX_FLUSH_INTERVAL_MS
+        ) / 1000
+        self.poll_interval = poll_interval or settings.LEAD_OUTBOX_POLL_INTERVAL
+        self._window_started = None
+
+    def ready(self):
+        """Whether a batch should be flushed now."""
+        due = due_count(self.batch_size)
+        if due == 0:
+            self._window_started = None
+            return False
+        if not self.batched or due >= self.batch_size:
+            return True
+        if self._window_started is None:
+            self._window_started = time.monotonic()
+        return time.monotonic() - self._window_started >= self.flush_interval
+
+    def run_once(self):
+        """
+        Flush a batch if one is ready.
+
+        Returns:
+            dict or None: drain_outbox() counts, or None if nothing was flushed
+        """
+        close_old_connections()
+        if not self.ready():
+            return None
+        self._window_started = None
+        return drain_outbox(self.batch_size, batched=self.batched)
+
+    def run(self, on_flush=None):
+        """Drain the outbox forever, calling on_flush(result) after every flush."""
+        while True:
+            result = self.run_once()
+            if result is None:
+                # Nothing due yet - poll again, sooner while a batch window is open
+                time.sleep(min(self.poll_interval, self.flush_interval) if self._window_started else self.poll_interval)
+                continue
+            if on_flush:
+                on_flush(result)
+
+
+def outbox_stats():
+    """
+    Outbox depth metrics.
+
+    Returns:
+        dict: pending and failed row counts, and the age in seconds of the
+        oldest pending lead (0 when the outbox is empty)
+    """
+    pending = Lead.objects.filter(sheets_status=Lead.SHEETS_PENDING)
+    oldest = pending.order_by('created_at').values_list('created_at', flat=True).first()
+    return {
+        'pending': pending.count(),
+        'failed': Lead.objects.filter(sheets_status=Lead.SHEETS_FAILED).count(),
+        'oldest_pending_seconds': (
+            round((timezone.now() - oldest).total_seconds(), 1) if oldest else 0
+        ),
+    }
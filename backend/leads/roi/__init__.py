@@ -0,0 +1,33 @@
+"""
+Server-side Career ROI engine.
+
+A Python port of the browser salary engine in src/utils, with identical
+outputs (verified by the roi_golden management command):
+
+- skills.py   <- skillNormalization.js (normalize_skill, resolve_alias, process_user_skills)
+- pillars.py  <- pillarDetection.js    (detect_pillars, get_pillar_names, get_all_pillar_keys)
+- engine.py   <- salaryEngine.js       (calculate_fresher_salary, calculate_experienced_salary, calculate_salary)
+- legacy.py   <- salaryCalculator.js   (calculate_legacy_salary)
+
+Used by POST /api/roi/ and POST /api/roi/batch/. batch.py rescores the
+projections stored on leads (roi_rescore command); it imports the Lead model,
+so it is not re-exported here.
+"""
+from .engine import calculate_experienced_salary, calculate_fresher_salary, calculate_salary, score_profile
+from .legacy import calculate_legacy_salary
+from .pillars import detect_pillars, get_all_pillar_keys, get_pillar_names
+from .skills import normalize_skill, process_user_skills, resolve_alias
+
+__all__ = [
+    'calculate_experienced_salary',
+    'calculate_fresher_salary',
+    'calculate_legacy_salary',
+    'calculate_salary',
+    'detect_pillars',
+    'get_all_pillar_keys',
+    'get_pillar_names',
+    'normalize_skill',
+    'process_user_skills',
+    'resolve_alias',
+    'score_profile',
+]
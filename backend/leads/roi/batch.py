@@ -0,0 +1,296 @@
+"""
+Vectorized ROI rescoring for the whole leads table.
+
+A lead's projection depends only on its user type, Full Stack flag, current
+salary and the *set* of detected pillars, so the set is stored as a bitmask
+(Lead.roi_pillar_mask, one bit per pillar in PILLAR_BITS). Rescoring after a
+change to the pillar constants in leads/roi/engine.py then needs no skill
+matching at all:
+
+1. take the per-mask columns (2^5 = 32 entries) of the engine's pillar table,
+   built with the browser's arithmetic, so rounding matches to the last digit
+2. read leads in keyset-paginated chunks of ROI_RESCORE_CHUNK_SIZE rows
+3. gather before/after from the tables and round with NumPy array operations
+4. write back only the rows whose projection changed, chunk by chunk
+
+Fresher pillar values are summed in pillar order rather than detection order;
+with the current values every order rounds to the same result (checked by
+the roi_rescore command's --verify option against the scalar engine).
+
+NumPy is optional: without it the same tables are applied row by row.
+"""
+import time
+from itertools import permutations
+
+from django.conf import settings
+from django.utils import timezone
+
+from ..models import Lead
+from .engine import calculate_salary, get_pillar_table, round1
+from .pillars import PILLAR_DEFINITIONS, detect_pillars, get_all_pillar_keys
+from .skill_cache import detect_skill_pillars
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+PILLAR_KEYS = get_all_pillar_keys()
+PILLAR_BITS = {key: 1 << index for index, key in enumerate(PILLAR_KEYS)}
+MASK_COUNT = 1 << len(PILLAR_KEYS)
+
+# Integer codes for the user_type column of a chunk (0 = unknown type)
+USER_TYPE_CODES = {'fresher': 1, 'experienced': 2}
+FRESHER = 1
+EXPERIENCED = 2
+
+ROI_FIELDS = ('roi_before', 'roi_after', 'roi_uplift', 'roi_scored_at')
+
+
+def pillar_mask(pillar_keys):
+    """Bitmask for a list of pillar keys (unknown keys are ignored)."""
+    mask = 0
+    for key in pillar_keys:
+        mask |= PILLAR_BITS.get(key, 0)
+    return mask
+
+
+def mask_pillars(mask):
+    """Pillar keys set in a bitmask, in pillar order."""
+    return [key for key in PILLAR_KEYS if mask & PILLAR_BITS[key]]
+
+
+def skills_mask(skills):
+    """Bitmask of the pillars detected in raw calculator skills."""
+    return pillar_mask(detect_skill_pillars(skills))
+
+
+def build_tables():
+    """
+    Per-mask salary columns of the engine's pillar table (leads/roi/engine.py).
+
+    Returns:
+        dict: fresher_before[mask], fresher_full_stack (after, for every mask),
+        experienced_factor[mask] (after = salary * factor with the Full Stack
+        Program; 1 without it)
+    """
+    table = get_pillar_table()
+    return {
+        'fresher_before': [entry['fresher_before'] for entry in table['entries']],
+        'fresher_full_stack': table['fresher_full_stack_after'],
+        'experienced_factor': [entry['experienced_factor'] for entry in table['entries']],
+    }
+
+
+def _round1_array(values):
+    """round1() over an array (Math.round: halves towards +infinity)."""
+    scaled = values * 10
+    rounded = np.floor(scaled)
+    rounded += (scaled - rounded) >= 0.5
+    return rounded / 10
+
+
+def score_arrays(user_types, masks, has_full_stack, current_salary, tables=None):
+    """
+    Vectorized calculate_salary() over many profiles.
+
+    Args:
+        user_types: int array of USER_TYPE_CODES (0 = unknown type)
+        masks: int array of pillar bitmasks
+        has_full_stack: bool array
+        current_salary: float array (NaN = not given)
+        tables: build_tables() result (built on demand if omitted)
+
+    Returns:
+        tuple: (before, after, uplift) float arrays, rounded like the engine
+    """
+    tables = tables or build_tables()
+    masks = np.asarray(masks, dtype=np.intp)
+    user_types = np.asarray(user_types)
+    has_full_stack = np.asarray(has_full_stack, dtype=bool)
+    salary = np.asarray(current_salary, dtype=np.float64)
+
+    fresher = user_types == FRESHER
+    # NaN compares False, so missing salaries drop out here
+    experienced = (user_types == EXPERIENCED) & (salary > 0)
+
+    fresher_before = np.asarray(tables['fresher_before'])[masks]
+    fresher_after = np.where(has_full_stack, tables['fresher_full_stack'], fresher_before)
+
+    experienced_salary = np.where(experienced, salary, 0.0)
+    factor = np.where(has_full_stack, np.asarray(tables['experienced_factor'])[masks], 1.0)
+    experienced_after = np.where(has_full_stack, experienced_salary * factor, experienced_salary)
+
+    before = np.where(fresher, fresher_before, experienced_salary)
+    after = np.where(fresher, fresher_after, experienced_after)
+    return _round1_array(before), _round1_array(after), _round1_array(after - before)
+
+
+def score_row(user_type, mask, has_full_stack, current_salary, tables):
+    """score_arrays() for a single row, used when NumPy is not installed."""
+    if user_type == FRESHER:
+        before = tables['fresher_before'][mask]
+        after = tables['fresher_full_stack'] if has_full_stack else before
+    elif user_type == EXPERIENCED and current_salary and current_salary > 0:
+        before = current_salary
+        after = current_salary * tables['experienced_factor'][mask] if has_full_stack else current_salary
+    else:
+        return 0, 0, 0
+    return round1(before), round1(after), round1(after - before)
+
+
+def _score_chunk(rows, tables):
+    """(before, after, uplift) lists for rows of (user_type, mask, full_stack, salary)."""
+    user_types = [USER_TYPE_CODES.get(row[0], 0) for row in rows]
+    masks = [row[1] for row in rows]
+    if not NUMPY_AVAILABLE:
+        scored = [
+            score_row(user_type, mask, row[2], row[3], tables)
+            for user_type, mask, row in zip(user_types, masks, rows)
+        ]
+        return [list(column) for column in zip(*scored)]
+
+    salaries = np.array([row[3] for row in rows], dtype=np.float64)  # None -> NaN
+    before, after, uplift = score_arrays(
+        np.array(user_types, dtype=np.int8),
+        np.array(masks, dtype=np.intp),
+        np.array([row[2] for row in rows], dtype=bool),
+        salaries,
+        tables,
+    )
+    return before.tolist(), after.tolist(), uplift.tolist()
+
+
+def rescore_leads(chunk_size=None, remask=False, force=False, on_chunk=None):
+    """
+    Recompute the stored ROI projection of every lead with a calculator profile.
+
+    Args:
+        chunk_size: Rows read and written per round trip (defaults to ROI_RESCORE_CHUNK_SIZE)
+        remask: Re-detect roi_pillar_mask from roi_skills first (needed after
+            the skill lists in leads/roi/pillars.py or skills.py change)
+        force: Write every row, not only rows whose projection changed
+        on_chunk: Optional callback(stats) after each chunk
+
+    Returns:
+        dict: scanned, updated, remasked, chunks, seconds, rows_per_second, numpy
+    """
+    chunk_size = chunk_size or settings.ROI_RESCORE_CHUNK_SIZE
+    tables = build_tables()
+    fields = ['email', 'roi_user_type', 'roi_pillar_mask', 'roi_has_full_stack', 'roi_current_salary',
+              'roi_before', 'roi_after', 'roi_uplift']
+    if remask:
+        fields.append('roi_skills')
+
+    stats = {'scanned': 0, 'updated': 0, 'remasked': 0, 'chunks': 0, 'numpy': NUMPY_AVAILABLE}
+    started = time.perf_counter()
+    queryset = Lead.objects.exclude(roi_user_type='').order_by('email').values_list(*fields)
+    last_email = None
+
+    while True:
+        page = queryset if last_email is None else queryset.filter(email__gt=last_email)
+        rows = list(page[:chunk_size])
+        if not rows:
+            break
+        last_email = rows[-1][0]
+
+        masks = [row[2] for row in rows]
+        if remask:
+            masks = [skills_mask(row[8]) for row in rows]
+        profiles = [(row[1], mask, row[3], row[4]) for row, mask in zip(rows, masks)]
+        before, after, uplift = _score_chunk(profiles, tables)
+
+        now = timezone.now()
+        changed = []
+        for i, row in enumerate(rows):
+            new_mask = masks[i] != row[2]
+            if not (force or new_mask or (before[i], after[i], uplift[i]) != tuple(row[5:8])):
+                continue
+            lead = Lead(email=row[0], roi_pillar_mask=masks[i], roi_before=before[i],
+                        roi_after=after[i], roi_uplift=uplift[i], roi_scored_at=now)
+            changed.append(lead)
+            stats['remasked'] += new_mask
+
+        if changed:
+            update_fields = list(ROI_FIELDS) + (['roi_pillar_mask'] if remask else [])
+            Lead.objects.bulk_update(changed, update_fields, batch_size=chunk_size)
+
+        stats['scanned'] += len(rows)
+        stats['updated'] += len(changed)
+        stats['chunks'] += 1
+        if on_chunk:
+            on_chunk(stats)
+
+    stats['seconds'] = round(time.perf_counter() - started, 3)
+    stats['rows_per_second'] = round(stats['scanned'] / stats['seconds']) if stats['seconds'] else 0
+    return stats
+
+
+def verify_tables():
+    """
+    Check score_arrays() / score_row() against the scalar engine for every mask.
+
+    Each mask is scored with skills that detect its pillars in every detection
+    order, so a pillar-constant change that makes the summation order matter
+    is caught before the table is rescored.
+
+    Returns:
+        list[dict]: Mismatches ({'user_type', 'pillars', 'has_full_stack', 'current_salary', ...})
+    """
+    # A skill that detects exactly its own pillar, for each pillar
+    representative = {}
+    for key, definition in PILLAR_DEFINITIONS.items():
+        for skill in definition['skills']:
+            if detect_pillars([skill]) == [key]:
+                representative[key] = skill
+                break
+
+    tables = build_tables()
+    salaries = [0, 0.05, 4.35, 6.45, 10, 12.25, 33.3, 99.99]
+    mismatches = []
+    for mask in range(MASK_COUNT):
+        pillars = mask_pillars(mask)
+        for order in permutations(pillars):
+            skills = [representative[pillar] for pillar in order]
+            for user_type in USER_TYPE_CODES:
+                for full_stack in (False, True):
+                    for salary in (salaries if user_type == 'experienced' else [0]):
+                        expected = calculate_salary(user_type, skills, full_stack, salary)
+                        want = (expected['before'], expected['after'], expected['uplift'])
+                        got = score_row(USER_TYPE_CODES[user_type], mask, full_stack, salary, tables)
+                        if NUMPY_AVAILABLE:
+                            arrays = score_arrays([USER_TYPE_CODES[user_type]], [mask], [full_stack], [salary], tables)
+                            got = tuple(float(column[0]) for column in arrays)
+                        if tuple(got) != want:
+                            mismatches.append({
+                                'user_type': user_type, 'pillars': list(order), 'has_full_stack': full_stack,
+                                'current_salary': salary, 'expected': want, 'actual': list(got),
+                            })
+    return mismatches
+
+
+def profile_fields(profile):
+    """
+    Lead ROI field values for a calculator profile.
+
+    Args:
+        profile: Profile from leads.roi.validation.validate_career_profile()
+
+    Returns:
+        dict: roi_* field values, scored with the scalar engine
+    """
+    result = calculate_salary(
+        profile['user_type'], profile['skills'], profile['has_full_stack'], profile['current_salary']
+    )
+    return {
+        'roi_user_type': profile['user_type'],
+        'roi_skills': profile['skills'],
+        'roi_has_full_stack': profile['has_full_stack'],
+        'roi_current_salary': profile['current_salary'] or None,
+        'roi_pillar_mask': skills_mask(profile['skills']),
+        'roi_before': result['before'],
+        'roi_after': result['after'],
+        'roi_uplift': result['uplift'],
+        'roi_scored_at': timezone.now(),
+    }
@@ -0,0 +1,517 @@
+"""
+Salary calculation engine (port of src/utils/salaryEngine.js).
+
+Deterministic, skill-based salary projection for the Career ROI Calculator.
+Arithmetic is done in the same order as the browser and rounded with
+JavaScript's Math.round, so results match the frontend to the last digit
+(see leads/roi/golden.py and the roi_golden management command).
+
+Results come from a table precomputed per pillar subset (build_pillar_table(),
+like buildPillarTable() in the browser) and are checked against the
+reference calculations by verify_pillar_table().
+
+Salaries are in ₹ LPA.
+"""
+import math
+
+from .pillars import get_all_pillar_keys, get_pillar_names
+from .skill_cache import detect_skill_pillars
+
+BASE_FRESHER_SALARY = 3.0
+
+# Pillar contribution values for freshers (₹ LPA)
+FRESHER_PILLAR_VALUES = {
+    'foundations': 0.3,
+    'strategy': 0.6,
+    'analytics': 0.8,
+    'project-management': 0.5,
+    'ai': 1.0,
+}
+
+# Full Stack Program multiplier range for freshers
+FULL_STACK_MULTIPLIER_MIN = 1.25
+FULL_STACK_MULTIPLIER_MAX = 1.4
+
+# Pillar uplift percentages for experienced users
+EXPERIENCED_PILLAR_UPLIFTS = {
+    'analytics': 0.25,
+    'ai': 0.30,
+    'project-management': 0.20,
+    'strategy': 0.18,
+    'foundations': 0.15,
+}
+
+# Compounding reduction applied to the uplift of several missing pillars
+COMPOUND_FACTOR = 0.9
+
+# Premium for experienced users who already cover every pillar
+CERTIFICATION_PREMIUM = 0.15
+
+USER_TYPES = ('fresher', 'experienced')
+
+
+def js_round(value):
+    """Math.round(): nearest integer, halves rounded towards +infinity."""
+    if not math.isfinite(value):
+        return value
+    rounded = math.floor(value)
+    if value - rounded >= 0.5:
+        rounded += 1
+    return rounded
+
+
+def round1(value):
+    """Math.round(value * 10) / 10."""
+    return js_round(value * 10) / 10
+
+
+def _result(before, after, detected, skills_added, explanation):
+    return {
+        'before': round1(before),
+        'after': round1(after),
+        'uplift': round1(after - before),
+        'detectedPillars': list(detected),
+        'skillsAdded': skills_added,
+        'explanation': explanation,
+    }
+
+
+def reference_fresher_salary(detected, has_full_stack):
+    """
+    Reference fresher calculation from detected pillars.
+
+    The pillar table must reproduce it exactly (see verify_pillar_table()).
+
+    Args:
+        detected: Detected pillar keys, in detection order
+        has_full_stack: Whether the Full Stack Program is completed
+
+    Returns:
+        dict: before, after, uplift, detectedPillars, skillsAdded, explanation
+    """
+    pillar_contributions = 0
+    for pillar in detected:
+        if FRESHER_PILLAR_VALUES.get(pillar):
+            pillar_contributions += FRESHER_PILLAR_VALUES[pillar]
+    salary_before = BASE_FRESHER_SALARY + pillar_contributions
+
+    salary_after = salary_before
+    skills_added = []
+    if has_full_stack:
+        all_pillars = get_all_pillar_keys()
+        full_stack_contributions = 0
+        for pillar in all_pillars:
+            if FRESHER_PILLAR_VALUES.get(pillar):
+                full_stack_contributions += FRESHER_PILLAR_VALUES[pillar]
+
+        multiplier = (FULL_STACK_MULTIPLIER_MIN + FULL_STACK_MULTIPLIER_MAX) / 2
+        salary_after = (BASE_FRESHER_SALARY + full_stack_contributions) * multiplier
+
+        for pillar in all_pillars:
+            if FRESHER_PILLAR_VALUES.get(pillar):
+                skills_added.append({
+                    'name': get_pillar_names([pillar])[0],
+                    'contribution': round1(FRESHER_PILLAR_VALUES[pillar] * multiplier),
+                })
+
+        explanation = (
+            'Salary calculated with all five pillars and market-readiness multiplier, '
+            'reflecting full-stack marketing engineer capabilities.'
+        )
+    else:
+        pillar_names = get_pillar_names(detected)
+        if pillar_names:
+            explanation = (
+                f"Salary calculated based on skill coverage across {', '.join(pillar_names).lower()}, "
+                'reflecting current market readiness.'
+            )
+        else:
+            explanation = 'Base salary for entry-level position. Complete Full Stack Program to unlock growth potential.'
+
+    return _result(salary_before, salary_after, detected, skills_added, explanation)
+
+
+def reference_experienced_salary(current_salary, detected, has_full_stack):
+    """
+    Reference experienced calculation from detected pillars.
+
+    The pillar table must reproduce it exactly (see verify_pillar_table()).
+
+    Args:
+        current_salary: Current salary in ₹ LPA (greater than 0)
+        detected: Detected pillar keys, in detection order
+        has_full_stack: Whether the Full Stack Program is completed
+
+    Returns:
+        dict: before, after, uplift, detectedPillars, skillsAdded, explanation
+    """
+    salary_after = current_salary
+    skills_added = []
+    if has_full_stack:
+        all_pillars = get_all_pillar_keys()
+        missing = [pillar for pillar in all_pillars if pillar not in detected]
+
+        if missing:
+            total_uplift = 0
+            for pillar in missing:
+                if EXPERIENCED_PILLAR_UPLIFTS.get(pillar):
+                    pillar_uplift = EXPERIENCED_PILLAR_UPLIFTS[pillar] * COMPOUND_FACTOR
+                    skills_added.append({
+                        'name': get_pillar_names([pillar])[0],
+                        'contribution': round1(current_salary * pillar_uplift),
+                    })
+                    total_uplift += EXPERIENCED_PILLAR_UPLIFTS[pillar]
+
+            total_uplift *= COMPOUND_FACTOR
+            salary_after = current_salary * (1 + total_uplift)
+
+            explanation = (
+                f"Salary uplift calculated based on adding missing pillars: "
+                f"{', '.join(get_pillar_names(missing)).lower()}. "
+                'These skills are in high demand and command premium salaries.'
+            )
+        else:
+            # Every pillar already present: spread the certification premium proportionally
+            for pillar in all_pillars:
+                if EXPERIENCED_PILLAR_UPLIFTS.get(pillar):
+                    total_uplift = 0
+                    for key in all_pillars:
+                        total_uplift = total_uplift + (EXPERIENCED_PILLAR_UPLIFTS.get(key) or 0)
+                    proportion = EXPERIENCED_PILLAR_UPLIFTS[pillar] / total_uplift
+                    skills_added.append({
+                        'name': get_pillar_names([pillar])[0],
+                        'contribution': round1(current_salary * CERTIFICATION_PREMIUM * proportion),
+                    })
+
+            salary_after = current_salary * (1 + CERTIFICATION_PREMIUM)
+            explanation = (
+                'You already have strong skill coverage. '
+                'Full Stack Program certification adds 15% premium for verified expertise.'
+            )
+    else:
+        pillar_names = get_pillar_names(detected)
+        if pillar_names:
+            explanation = (
+                f"Current salary reflects your existing skills in {', '.join(pillar_names).lower()}. "
+                'Complete Full Stack Program to unlock additional growth.'
+            )
+        else:
+            explanation = (
+                'Current salary baseline. '
+                'Add skills and complete Full Stack Program to see significant growth potential.'
+            )
+
+    return _result(current_salary, salary_after, detected, skills_added, explanation)
+
+
+def pillar_mask(pillar_keys):
+    """Bitmask of pillar keys (bit i = i-th key of get_all_pillar_keys())."""
+    all_pillars = get_all_pillar_keys()
+    mask = 0
+    for key in pillar_keys:
+        if key in all_pillars:
+            mask |= 1 << all_pillars.index(key)
+    return mask
+
+
+def build_pillar_table():
+    """
+    Precompute everything the constants above contribute, per pillar subset.
+
+    A result depends only on which of the five pillars are detected (one of
+    32 subsets) and has_full_stack, so scoring becomes a bitmask lookup plus
+    a multiply by the current salary. Mirrors buildPillarTable() in
+    salaryEngine.js.
+
+    Returns:
+        dict: fresher_full_stack_after, fresher_skills_added and one entry
+        per pillar bitmask (fresher_before, experienced_factor,
+        experienced_added, experienced_explanation, premium)
+    """
+    all_pillars = get_all_pillar_keys()
+    multiplier = (FULL_STACK_MULTIPLIER_MIN + FULL_STACK_MULTIPLIER_MAX) / 2
+
+    full_stack_contributions = 0
+    fresher_skills_added = []
+    for pillar in all_pillars:
+        if FRESHER_PILLAR_VALUES.get(pillar):
+            full_stack_contributions += FRESHER_PILLAR_VALUES[pillar]
+            fresher_skills_added.append({
+                'name': get_pillar_names([pillar])[0],
+                'contribution': round1(FRESHER_PILLAR_VALUES[pillar] * multiplier),
+            })
+
+    total_premium_uplift = 0
+    for pillar in all_pillars:
+        total_premium_uplift = total_premium_uplift + (EXPERIENCED_PILLAR_UPLIFTS.get(pillar) or 0)
+
+    entries = []
+    for mask in range(1 << len(all_pillars)):
+        present = [pillar for i, pillar in enumerate(all_pillars) if mask & (1 << i)]
+        missing = [pillar for i, pillar in enumerate(all_pillars) if not mask & (1 << i)]
+
+        fresher_contributions = 0
+        for pillar in present:
+            if FRESHER_PILLAR_VALUES.get(pillar):
+                fresher_contributions += FRESHER_PILLAR_VALUES[pillar]
+
+        entry = {
+            'fresher_before': BASE_FRESHER_SALARY + fresher_contributions,
+            'premium': not missing,
+            # (name, uplift): contribution = salary * uplift, or
+            # (name, share): salary * CERTIFICATION_PREMIUM * share once every pillar is present
+            'experienced_added': [],
+            'experienced_factor': 1 + CERTIFICATION_PREMIUM,
+            'experienced_explanation': (
+                'You already have strong skill coverage. '
+                'Full Stack Program certification adds 15% premium for verified expertise.'
+            ),
+        }
+        if missing:
+            total_uplift = 0
+            for pillar in missing:
+                if EXPERIENCED_PILLAR_UPLIFTS.get(pillar):
+                    entry['experienced_added'].append(
+                        (get_pillar_names([pillar])[0], EXPERIENCED_PILLAR_UPLIFTS[pillar] * COMPOUND_FACTOR)
+                    )
+                    total_uplift += EXPERIENCED_PILLAR_UPLIFTS[pillar]
+            total_uplift *= COMPOUND_FACTOR
+            entry['experienced_factor'] = 1 + total_uplift
+            entry['experienced_explanation'] = (
+                f"Salary uplift calculated based on adding missing pillars: "
+                f"{', '.join(get_pillar_names(missing)).lower()}. "
+                'These skills are in high demand and command premium salaries.'
+            )
+        else:
+            for pillar in all_pillars:
+                if EXPERIENCED_PILLAR_UPLIFTS.get(pillar):
+                    entry['experienced_added'].append(
+                        (get_pillar_names([pillar])[0], EXPERIENCED_PILLAR_UPLIFTS[pillar] / total_premium_uplift)
+                    )
+        entries.append(entry)
+
+    return {
+        'fresher_full_stack_after': (BASE_FRESHER_SALARY + full_stack_contributions) * multiplier,
+        'fresher_skills_added': fresher_skills_added,
+        'entries': entries,
+    }
+
+
+def _constants_signature():
+    return (
+        BASE_FRESHER_SALARY,
+        tuple(FRESHER_PILLAR_VALUES.items()),
+        FULL_STACK_MULTIPLIER_MIN,
+        FULL_STACK_MULTIPLIER_MAX,
+        tuple(EXPERIENCED_PILLAR_UPLIFTS.items()),
+        COMPOUND_FACTOR,
+        CERTIFICATION_PREMIUM,
+    )
+
+
+_pillar_table = build_pillar_table()
+_pillar_table_signature = _constants_signature()
+
+
+def get_pillar_table():
+    """
+    The pillar table for the current constants.
+
+    Rebuilt automatically when a constant has changed since it was built
+    (the constants are module attributes, so tests and what-if analyses can
+    change them at runtime).
+    """
+    global _pillar_table, _pillar_table_signature
+    signature = _constants_signature()
+    if signature != _pillar_table_signature:
+        _pillar_table = build_pillar_table()
+        _pillar_table_signature = signature
+    return _pillar_table
+
+
+def table_fresher_salary(detected, has_full_stack):
+    """reference_fresher_salary() from the pillar table."""
+    table = get_pillar_table()
+    salary_before = table['entries'][pillar_mask(detected)]['fresher_before']
+    salary_after = salary_before
+    skills_added = []
+    if has_full_stack:
+        salary_after = table['fresher_full_stack_after']
+        skills_added = [dict(skill) for skill in table['fresher_skills_added']]
+        explanation = (
+            'Salary calculated with all five pillars and market-readiness multiplier, '
+            'reflecting full-stack marketing engineer capabilities.'
+        )
+    else:
+        pillar_names = get_pillar_names(detected)
+        if pillar_names:
+            explanation = (
+                f"Salary calculated based on skill coverage across {', '.join(pillar_names).lower()}, "
+                'reflecting current market readiness.'
+            )
+        else:
+            explanation = 'Base salary for entry-level position. Complete Full Stack Program to unlock growth potential.'
+    return _result(salary_before, salary_after, detected, skills_added, explanation)
+
+
+def table_experienced_salary(current_salary, detected, has_full_stack):
+    """reference_experienced_salary() from the pillar table."""
+    salary_after = current_salary
+    skills_added = []
+    if has_full_stack:
+        entry = get_pillar_table()['entries'][pillar_mask(detected)]
+        salary_after = current_salary * entry['experienced_factor']
+        for name, factor in entry['experienced_added']:
+            if entry['premium']:
+                contribution = current_salary * CERTIFICATION_PREMIUM * factor
+            else:
+                contribution = current_salary * factor
+            skills_added.append({'name': name, 'contribution': round1(contribution)})
+        explanation = entry['experienced_explanation']
+    else:
+        pillar_names = get_pillar_names(detected)
+        if pillar_names:
+            explanation = (
+                f"Current salary reflects your existing skills in {', '.join(pillar_names).lower()}. "
+                'Complete Full Stack Program to unlock additional growth.'
+            )
+        else:
+            explanation = (
+                'Current salary baseline. '
+                'Add skills and complete Full Stack Program to see significant growth potential.'
+            )
+    return _result(current_salary, salary_after, detected, skills_added, explanation)
+
+
+def verify_pillar_table():
+    """
+    Check the pillar table against the reference calculations.
+
+    Every pillar subset is tried in every detection order, with and without
+    the Full Stack Program, for freshers and a spread of current salaries.
+
+    Returns:
+        list[dict]: Mismatches ({'user_type', 'pillars', 'has_full_stack', 'current_salary', 'expected', 'actual'})
+    """
+    all_pillars = get_all_pillar_keys()
+    salaries = [0.05, 0.25, 4.35, 6.45, 7.5, 10, 12.25, 18.75, 33.3, 99.99]
+
+    orders = [[]]
+    for order in orders:
+        orders.extend(order + [pillar] for pillar in all_pillars if pillar not in order)
+
+    mismatches = []
+    for pillars in orders:
+        for has_full_stack in (False, True):
+            checks = [('fresher', None, table_fresher_salary(pillars, has_full_stack),
+                       reference_fresher_salary(pillars, has_full_stack))]
+            for salary in salaries:
+                checks.append(('experienced', salary, table_experienced_salary(salary, pillars, has_full_stack),
+                               reference_experienced_salary(salary, pillars, has_full_stack)))
+            for user_type, salary, actual, expected in checks:
+                if actual != expected:
+                    mismatches.append({
+                        'user_type': user_type, 'pillars': pillars, 'has_full_stack': has_full_stack,
+                        'current_salary': salary, 'expected': expected, 'actual': actual,
+                    })
+    return mismatches
+
+
+def calculate_fresher_salary(user_skills, has_full_stack=False):
+    """
+    Salary for freshers / career switchers.
+
+    Args:
+        user_skills: Raw skill strings
+        has_full_stack: Whether the Full Stack Program is completed
+
+    Returns:
+        dict: before, after, uplift, detectedPillars, skillsAdded, explanation
+    """
+    return table_fresher_salary(detect_skill_pillars(user_skills), has_full_stack)
+
+
+def calculate_experienced_salary(current_salary, user_skills, has_full_stack=False):
+    """
+    Salary for experienced professionals.
+
+    Args:
+        current_salary: Current salary in ₹ LPA
+        user_skills: Raw skill strings
+        has_full_stack: Whether the Full Stack Program is completed
+
+    Returns:
+        dict: before, after, uplift, detectedPillars, skillsAdded, explanation
+    """
+    if not current_salary or not current_salary > 0:
+        return _missing_salary_result()
+    return table_experienced_salary(current_salary, detect_skill_pillars(user_skills), has_full_stack)
+
+
+def _missing_salary_result():
+    return {
+        'before': 0,
+        'after': 0,
+        'uplift': 0,
+        'detectedPillars': [],
+        'skillsAdded': [],
+        'explanation': 'Please enter your current salary to calculate growth potential.',
+    }
+
+
+def _missing_user_type_result():
+    # Without skillsAdded, as in the browser
+    return {
+        'before': 0,
+        'after': 0,
+        'uplift': 0,
+        'detectedPillars': [],
+        'explanation': 'Please select your experience level to calculate salary.',
+    }
+
+
+def calculate_salary(user_type, skills=(), has_full_stack=False, current_salary=0):
+    """
+    Route to the fresher or experienced calculation (calculateSalary() in the browser).
+
+    Returns:
+        dict: Calculation result; for an unknown user_type a zero result
+        asking for the experience level (without skillsAdded, as in the browser)
+    """
+    if user_type == 'fresher':
+        return calculate_fresher_salary(skills, has_full_stack)
+    if user_type == 'experienced':
+        return calculate_experienced_salary(current_salary, skills, has_full_stack)
+    return _missing_user_type_result()
+
+
+def calculate_salary_for_pillars(user_type, detected, has_full_stack=False, current_salary=0):
+    """
+    calculate_salary() for already detected pillars (calculateSalaryForPillars() in the browser).
+
+    Args:
+        user_type: 'fresher' or 'experienced'
+        detected: Pillar keys in detection order (detect_skill_pillars())
+        has_full_stack: Whether the Full Stack Program is completed
+        current_salary: Current salary in ₹ LPA (experienced only)
+
+    Returns:
+        dict: Same result as calculate_salary() for skills detecting these pillars
+    """
+    if user_type == 'fresher':
+        return table_fresher_salary(detected, has_full_stack)
+    if user_type == 'experienced':
+        if not current_salary or not current_salary > 0:
+            return _missing_salary_result()
+        return table_experienced_salary(current_salary, detected, has_full_stack)
+    return _missing_user_type_result()
+
+
+def score_profile(profile):
+    """calculate_salary() for a profile returned by leads.roi.validation.validate_profile()."""
+    return calculate_salary(
+        profile['user_type'],
+        profile['skills'],
+        profile['has_full_stack'],
+        profile['current_salary'],
+    )
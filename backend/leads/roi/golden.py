@@ -0,0 +1,177 @@
+"""
+Golden verification of the Python ROI engine against the browser engine.
+
+golden_cases.json holds seeded random inputs (messy skills, aliases, unicode,
+edge salaries) together with the outputs of calculateSalary() from
+src/utils/salaryEngine.js and src/utils/salaryCalculator.js. The roi_golden
+management command checks the Python port against it, and regenerates it (or
+compares against the JS engine directly) when Node.js is available.
+"""
+import json
+import random
+import shutil
+import subprocess
+from pathlib import Path
+
+from django.conf import settings
+
+from .engine import calculate_salary
+from .legacy import BACKGROUND_ADJUSTMENTS, ROLE_KEYWORDS, SKILL_KEYWORDS, calculate_legacy_salary
+from .pillars import PILLAR_DEFINITIONS
+from .skills import SKILL_ALIASES
+
+ROI_DIR = Path(__file__).resolve().parent
+FIXTURE_PATH = ROI_DIR / 'golden_cases.json'
+JS_RUNNER = ROI_DIR / 'run_js_engine.mjs'
+JS_UTILS_DIR = Path(settings.BASE_DIR).parent / 'src' / 'utils'
+
+EXTRA_SKILLS = [
+    'Google-Analytics!!', '  GA4  ', 'FB Ads', 'chat gpt', 'ChatGPT-4o', 'Gen AI tools', 'SEO/SEM',
+    'g', 'a', 'ai', 'ad', 'goo', 'market', 'data', 'excel', 'python', 'basket weaving', 'xyz',
+    'café marketing', 'SEO audit', 'İnstagram ads', 'ｓｅｏ', 'e mail marketing', 'tik-tok',
+    'constructor', '__proto__', 'toString', 'hasownproperty', '123', '', '   ', '***', 'c++', 'a/b testing',
+    'Project_Management', 'prompt-engineering', 'make.com', 'geo targeting', 'roi', 'sql server',
+]
+JUNK_VALUES = [None, 42, True, ['seo'], {'skill': 'seo'}]
+SALARIES = [0, -5, 0.05, 0.25, 3, 4.35, 6.45, 7.5, 12, 18.75, 33.3, 99.99, 150]
+ROLES = ['', 'Social Media Manager', 'SEO Specialist', 'performance marketer', 'Growth PM', 'Founder & CEO',
+         'accountant', 'pm', 'ads', 'Content Creator', 'Media Buying Lead']
+YEARS = ['1-2', '3-5', '6+', '', '10+']
+
+
+def _skill_vocabulary():
+    vocabulary = list(SKILL_ALIASES) + EXTRA_SKILLS
+    for pillar in PILLAR_DEFINITIONS.values():
+        vocabulary.extend(pillar['skills'])
+    for keywords in SKILL_KEYWORDS.values():
+        vocabulary.extend(keywords)
+    return vocabulary
+
+
+def _random_skill(rng, vocabulary):
+    skill = rng.choice(vocabulary)
+    roll = rng.random()
+    if roll < 0.15:
+        skill = skill.upper()
+    elif roll < 0.25:
+        skill = f" {skill.title()}!"
+    elif roll < 0.3:
+        skill = f"{skill} & {rng.choice(vocabulary)}"
+    return skill
+
+
+def generate_cases(count=400, legacy_count=200, seed=2024):
+    """
+    Seeded random engine inputs.
+
+    Returns:
+        tuple: (cases for calculateSalary(params), cases for the legacy calculator)
+    """
+    rng = random.Random(seed)
+    vocabulary = _skill_vocabulary()
+
+    cases = []
+    for i in range(count):
+        skills = [_random_skill(rng, vocabulary) for _ in range(rng.choice([0, 1, 2, 3, 5, 8, 15, 40]))]
+        if i % 25 == 0:
+            skills.append(rng.choice(JUNK_VALUES))
+        user_type = rng.choice(['fresher', 'experienced', 'experienced', 'fresher', 'student'])
+        salary = rng.choice(SALARIES) if rng.random() < 0.4 else round(rng.uniform(1, 60), rng.choice([0, 1, 2]))
+        cases.append({
+            'userType': user_type,
+            'skills': skills,
+            'hasFullStack': rng.random() < 0.5,
+            'currentSalary': salary,
+        })
+
+    legacy_cases = []
+    string_vocabulary = [skill for skill in vocabulary if skill.strip()] + list(ROLE_KEYWORDS)
+    for _ in range(legacy_count):
+        skills = [_random_skill(rng, string_vocabulary) for _ in range(rng.choice([0, 1, 3, 6, 12]))]
+        legacy_cases.append({
+            'userType': rng.choice(['fresher', 'experienced']),
+            'background': rng.choice(list(BACKGROUND_ADJUSTMENTS) + ['', 'arts']),
+            'fresherSkills': skills,
+            'yearsOfExp': rng.choice(YEARS),
+            'currentRole': rng.choice(ROLES),
+            'experiencedSkills': skills,
+            'programCompleted': rng.random() < 0.5,
+        })
+    return cases, legacy_cases
+
+
+def python_result(params):
+    """Python engine result for one calculateSalary(params) input."""
+    return calculate_salary(
+        params.get('userType'),
+        params.get('skills', []),
+        params.get('hasFullStack', False),
+        params.get('currentSalary', 0),
+    )
+
+
+class GoldenError(RuntimeError):
+    """Raised when the JS engine cannot be run."""
+
+
+def run_js(cases, legacy_cases):
+    """
+    Run the browser engine on the given cases with Node.js.
+
+    Returns:
+        tuple: (results, legacy results)
+
+    Raises:
+        GoldenError: If node is not installed, the run fails or the JS
+            pillar lookup table disagrees with its reference calculation
+    """
+    node = shutil.which('node')
+    if node is None:
+        raise GoldenError("Node.js is required to run the JS engine (node not found on PATH)")
+    payload = json.dumps({'src': str(JS_UTILS_DIR), 'cases': cases, 'legacy': legacy_cases})
+    proc = subprocess.run([node, str(JS_RUNNER)], input=payload, capture_output=True, text=True)
+    if proc.returncode != 0:
+        raise GoldenError(f"JS engine failed: {proc.stderr.strip()}")
+    output = json.loads(proc.stdout)
+    if output['tableMismatches']:
+        first = json.dumps(output['tableMismatches'][0], ensure_ascii=False)
+        raise GoldenError(
+            f"JS pillar table differs from the reference calculation in "
+            f"{len(output['tableMismatches'])} case(s), e.g. {first}"
+        )
+    return output['cases'], output['legacy']
+
+
+def load_fixture():
+    """Cases and expected outputs from golden_cases.json."""
+    with open(FIXTURE_PATH, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def write_fixture(cases, expected, legacy_cases, legacy_expected, seed):
+    with open(FIXTURE_PATH, 'w', encoding='utf-8') as f:
+        json.dump({
+            'seed': seed,
+            'cases': [{'input': c, 'expected': e} for c, e in zip(cases, expected)],
+            'legacy': [{'input': c, 'expected': e} for c, e in zip(legacy_cases, legacy_expected)],
+        }, f, ensure_ascii=False, separators=(',', ':'))
+        f.write('\n')
+
+
+def compare(cases, expected, legacy_cases, legacy_expected):
+    """
+    Compare the Python engine with expected JS outputs.
+
+    Returns:
+        list[dict]: Mismatches ({'engine', 'input', 'expected', 'actual'})
+    """
+    mismatches = []
+    for params, want in zip(cases, expected):
+        got = json.loads(json.dumps(python_result(params)))
+        if got != want:
+            mismatches.append({'engine': 'salaryEngine', 'input': params, 'expected': want, 'actual': got})
+    for inputs, want in zip(legacy_cases, legacy_expected):
+        got = json.loads(json.dumps(calculate_legacy_salary(inputs)))
+        if got != want:
+            mismatches.append({'engine': 'salaryCalculator', 'input': inputs, 'expected': want, 'actual': got})
+    return mismatches
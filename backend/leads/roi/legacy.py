@@ -0,0 +1,215 @@
+"""
+Legacy range-based salary calculator (port of src/utils/salaryCalculator.js).
+
+The frontend no longer calls this model, but leads scored with it before the
+switch to leads/roi/engine.py can be re-run for analytics. Salaries are
+integer ₹ LPA ranges.
+"""
+from .engine import js_round
+from .matcher import SkillMatcher
+from .skills import JS_WHITESPACE
+
+BASE_SALARIES = {
+    'fresher': {'min': 3, 'max': 6},
+    'experienced': {
+        '1-2': {'min': 4, 'max': 6},
+        '3-5': {'min': 6, 'max': 12},
+        '6+': {'min': 10, 'max': 15},
+    },
+}
+
+# Pillar -> keywords matched against free-form skill names
+SKILL_KEYWORDS = {
+    'strategy': [
+        'strategy', 'marketing', 'campaign', 'content', 'social media', 'seo', 'sem', 'ppc', 'ads',
+        'advertising', 'brand', 'communication', 'copywriting', 'email marketing',
+    ],
+    'analytics': [
+        'analytics', 'ga4', 'google analytics', 'data', 'reporting', 'dashboard', 'metrics', 'kpi',
+        'attribution', 'tracking', 'measurement',
+    ],
+    'project-management': [
+        'project', 'pm', 'coordination', 'management', 'planning', 'agile', 'scrum', 'kanban', 'jira',
+        'asana', 'trello',
+    ],
+    'ai': [
+        'ai', 'artificial intelligence', 'chatgpt', 'gpt', 'claude', 'midjourney', 'dalle', 'automation',
+        'machine learning', 'ml', 'prompt',
+    ],
+    'martech': [
+        'martech', 'marketing technology', 'crm', 'salesforce', 'hubspot', 'marketo', 'pardot', 'automation',
+        'zapier', 'integrations',
+    ],
+}
+
+PILLAR_UPLIFTS = {
+    'strategy': {'min': 0.20, 'max': 0.30},
+    'analytics': {'min': 0.30, 'max': 0.40},
+    'project-management': {'min': 0.25, 'max': 0.35},
+    'ai': {'min': 0.40, 'max': 0.60},
+    'martech': {'min': 0.10, 'max': 0.20},
+}
+
+BACKGROUND_ADJUSTMENTS = {
+    'engineering': {'min': 0.10, 'max': 0.15},
+    'mba': {'min': 0.15, 'max': 0.20},
+    'non-tech': {'min': 0, 'max': 0.05},
+}
+
+ROLE_ADJUSTMENTS = {
+    'social-media': {'min': -0.05, 'max': 0},
+    'seo': {'min': 0, 'max': 0.05},
+    'performance': {'min': 0.05, 'max': 0.10},
+    'product-growth': {'min': 0.10, 'max': 0.15},
+    'founder': {'min': 0.15, 'max': 0.25},
+}
+
+ROLE_KEYWORDS = {
+    'social-media': ['social media', 'social', 'community', 'content creator', 'influencer'],
+    'seo': ['seo', 'search engine', 'organic', 'search optimization'],
+    'performance': ['performance', 'paid ads', 'ppc', 'advertising', 'media buying', 'digital ads'],
+    'product-growth': ['product', 'growth', 'growth marketing', 'product marketing', 'pm', 'product manager'],
+    'founder': ['founder', 'entrepreneur', 'ceo', 'co-founder', 'startup'],
+}
+
+PILLAR_NAMES = {
+    'strategy': 'Strategy & Launch',
+    'analytics': 'Analytics & Data',
+    'project-management': 'Project Management',
+    'ai': 'AI for Marketing',
+    'martech': 'MarTech Exposure',
+}
+
+ALL_PILLARS = ['strategy', 'analytics', 'project-management', 'ai', 'martech']
+
+_KEYWORD_PILLARS = list(SKILL_KEYWORDS)
+KEYWORD_MATCHER = SkillMatcher(
+    (keyword, 1 << i) for i, pillar in enumerate(_KEYWORD_PILLARS) for keyword in SKILL_KEYWORDS[pillar]
+)
+
+
+def _js_trim(value):
+    return value.strip(JS_WHITESPACE)
+
+
+def map_skill_to_pillars(skill_name):
+    """
+    Pillars whose keywords contain, or are contained in, a skill name.
+
+    Returns:
+        list[str]: Matched pillars, or ['strategy'] when nothing matches
+    """
+    mask = KEYWORD_MATCHER.match(_js_trim(skill_name.lower()))
+    matched = [pillar for i, pillar in enumerate(_KEYWORD_PILLARS) if mask & (1 << i)]
+    return matched or ['strategy']
+
+
+def map_role_to_adjustment(role_text):
+    """Role adjustment key for free-form role text (None for no role, 'performance' if unmatched)."""
+    if not role_text:
+        return None
+    role = _js_trim(role_text.lower())
+    for role_key, keywords in ROLE_KEYWORDS.items():
+        for keyword in keywords:
+            if keyword in role or role in keyword:
+                return role_key
+    return 'performance'
+
+
+def get_base_salary(user_type, years_of_exp, background, current_role):
+    """Base {'min', 'max'} range for a user type, adjusted by background or role."""
+    if user_type == 'fresher':
+        base = dict(BASE_SALARIES['fresher'])
+        if background and background in BACKGROUND_ADJUSTMENTS:
+            adjustment = BACKGROUND_ADJUSTMENTS[background]
+            base['min'] = js_round(base['min'] * (1 + adjustment['min']))
+            base['max'] = js_round(base['max'] * (1 + adjustment['max']))
+        return base
+
+    if not years_of_exp or years_of_exp not in BASE_SALARIES['experienced']:
+        return {'min': 6, 'max': 10}
+    base = dict(BASE_SALARIES['experienced'][years_of_exp])
+    if current_role:
+        role_key = map_role_to_adjustment(current_role)
+        if role_key and role_key in ROLE_ADJUSTMENTS:
+            adjustment = ROLE_ADJUSTMENTS[role_key]
+            base['min'] = js_round(base['min'] * (1 + adjustment['min']))
+            base['max'] = js_round(base['max'] * (1 + adjustment['max']))
+    return base
+
+
+def map_skills_to_pillars(skills):
+    """Union of map_skill_to_pillars() over all skills, in first-seen order."""
+    pillars = []
+    for skill in skills:
+        for pillar in map_skill_to_pillars(skill):
+            if pillar not in pillars:
+                pillars.append(pillar)
+    return pillars
+
+
+def calculate_pillar_uplift(base_salary, active_pillars, program_completed):
+    """Total {'min', 'max'} uplift plus a per-pillar breakdown."""
+    pillars = ALL_PILLARS if program_completed else active_pillars
+    total_min = 0
+    total_max = 0
+    breakdown = []
+    for pillar in pillars:
+        if pillar in PILLAR_UPLIFTS:
+            uplift = PILLAR_UPLIFTS[pillar]
+            avg_base = (base_salary['min'] + base_salary['max']) / 2
+            min_uplift = avg_base * uplift['min']
+            max_uplift = avg_base * uplift['max']
+            total_min += min_uplift
+            total_max += max_uplift
+            breakdown.append({
+                'skill': PILLAR_NAMES.get(pillar, pillar),
+                'uplift': js_round((min_uplift + max_uplift) / 2),
+            })
+
+    # Several pillars compound slightly less than their sum
+    if len(pillars) > 1:
+        total_min *= 0.9
+        total_max *= 0.9
+
+    return {'min': js_round(total_min), 'max': js_round(total_max), 'breakdown': breakdown}
+
+
+def calculate_legacy_salary(inputs):
+    """
+    Legacy range calculation (calculateSalary() in salaryCalculator.js).
+
+    Args:
+        inputs: dict with userType, background, fresherSkills, yearsOfExp,
+            currentRole, experiencedSkills and programCompleted (the skills
+            list for the user type must be a list of strings)
+
+    Returns:
+        dict: before/after {'min', 'max', 'avg'}, uplift, upliftPercentage, breakdown
+    """
+    user_type = inputs.get('userType')
+    base = get_base_salary(user_type, inputs.get('yearsOfExp'), inputs.get('background'), inputs.get('currentRole'))
+    skills = inputs.get('fresherSkills') if user_type == 'fresher' else inputs.get('experiencedSkills')
+    active_pillars = map_skills_to_pillars(skills)
+    program_completed = inputs.get('programCompleted')
+    uplift = calculate_pillar_uplift(base, active_pillars, program_completed)
+
+    before_min = base['min']
+    before_max = base['max']
+    before_avg = js_round((before_min + before_max) / 2)
+    before = {'min': before_min, 'max': before_max, 'avg': before_avg}
+
+    if not active_pillars and not program_completed:
+        return {'before': before, 'after': dict(before), 'uplift': 0, 'upliftPercentage': 0, 'breakdown': []}
+
+    after_min = base['min'] + uplift['min']
+    after_max = base['max'] + uplift['max']
+    after_avg = js_round((after_min + after_max) / 2)
+    total_uplift = after_avg - before_avg
+    return {
+        'before': before,
+        'after': {'min': after_min, 'max': after_max, 'avg': after_avg},
+        'uplift': total_uplift,
+        'upliftPercentage': js_round((total_uplift / before_avg) * 100),
+        'breakdown': uplift['breakdown'],
+    }
@@ -0,0 +1,106 @@
+"""
+Precompiled bidirectional substring matcher for skill dictionaries.
+
+The browser engine matches a skill against a dictionary entry when either
+string contains the other (`known.includes(skill) || skill.includes(known)`),
+scanning every entry of every pillar per skill. SkillMatcher answers the
+same question for a whole dictionary at once:
+
+- any skill that is itself a substring of an entry (every dictionary skill
+  and alias, and their fragments) is answered by one dict lookup, from a
+  table built over all substrings of all entries
+- any other skill can only contain entries, which one pass of an
+  Aho-Corasick automaton over the skill finds
+
+Each entry carries a bitmask (a pillar bit, or an alias position), and a
+lookup returns the OR of the masks of all matching entries, so callers pick
+the first matching pillar / alias with the lowest set bit.
+"""
+
+
+class SkillMatcher:
+    """
+    Multi-pattern matcher over (entry, bitmask) pairs.
+
+    Args:
+        entries: Iterable of (entry string, int bitmask)
+    """
+
+    def __init__(self, entries):
+        entries = list(entries)
+        goto = [{}]
+        fail = [0]
+        output = [0]
+
+        # Trie of all entries
+        for entry, mask in entries:
+            state = 0
+            for char in entry:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    fail.append(0)
+                    output.append(0)
+                    goto[state][char] = next_state
+                state = next_state
+            output[state] |= mask
+
+        # Failure links, breadth first; outputs are merged along them
+        queue = list(goto[0].values())
+        for state in queue:
+            output[state] |= output[0]
+            for char, child in goto[state].items():
+                queue.append(child)
+                fallback = fail[state]
+                while fallback and char not in goto[fallback]:
+                    fallback = fail[fallback]
+                fail[child] = goto[fallback].get(char, 0)
+                output[child] |= output[fail[child]]
+
+        # Deterministic transitions (no failure-link walks while scanning);
+        # characters without a transition go back to the root
+        alphabet = {char for entry, _mask in entries for char in entry}
+        self._delta = [None] * len(goto)
+        for state in [0] + queue:
+            row = {}
+            for char in alphabet:
+                if char in goto[state]:
+                    row[char] = goto[state][char]
+                elif state:
+                    row[char] = self._delta[fail[state]].get(char, 0)
+            self._delta[state] = {char: target for char, target in row.items() if target}
+        self._output = output
+
+        # Full answers for every substring of every entry
+        containing = {}
+        for entry, mask in entries:
+            for start in range(len(entry) + 1):
+                for end in range(start, len(entry) + 1):
+                    part = entry[start:end]
+                    containing[part] = containing.get(part, 0) | mask
+        self._known = {part: mask | self.contained_in(part) for part, mask in containing.items()}
+
+    def contained_in(self, text):
+        """Mask of the entries that occur in text."""
+        delta = self._delta
+        output = self._output
+        state = 0
+        mask = output[0]
+        for char in text:
+            state = delta[state].get(char, 0)
+            mask |= output[state]
+        return mask
+
+    def match(self, text):
+        """Mask of the entries that contain, or are contained in, text."""
+        mask = self._known.get(text)
+        if mask is None:
+            # Not inside any entry, so only entries inside the text can match
+            mask = self.contained_in(text)
+        return mask
+
+
+def lowest_bit_index(mask):
+    """Position of the lowest set bit of a non-zero mask."""
+    return (mask & -mask).bit_length() - 1
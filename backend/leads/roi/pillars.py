@@ -0,0 +1,112 @@
+"""
+Pillar detection (port of src/utils/pillarDetection.js).
+
+Maps canonical skills to the Five Master Pillars of Full Stack Marketing.
+"""
+from .matcher import SkillMatcher, lowest_bit_index
+from .skills import JS_WHITESPACE
+
+FOUNDATION_SKILLS = [
+    "marketing fundamentals", "digital marketing basics", "consumer psychology",
+    "buyer behavior", "brand positioning", "brand strategy", "storytelling",
+    "copywriting", "content writing", "content strategy", "messaging",
+    "value proposition", "brand voice", "market research", "user research",
+    "customer personas", "communication skills", "narrative building",
+]
+
+STRATEGY_SKILLS = [
+    "digital marketing strategy", "growth strategy", "campaign strategy",
+    "go to market strategy", "growth marketing", "performance marketing",
+    "paid ads", "google ads", "meta ads", "facebook ads", "instagram ads",
+    "linkedin ads", "seo", "on page seo", "off page seo", "technical seo", "sem",
+    "email marketing", "lifecycle marketing", "funnel building", "cro",
+    "landing page optimization", "lead generation", "demand generation",
+]
+
+ANALYTICS_SKILLS = [
+    "google analytics", "ga", "ga4", "web analytics", "marketing analytics",
+    "data analysis", "excel", "advanced excel", "google sheets", "dashboards",
+    "reporting", "data visualization", "attribution modeling",
+    "conversion tracking", "google tag manager", "gtm", "sql", "kpis", "roi analysis",
+]
+
+PROJECT_MANAGEMENT_SKILLS = [
+    "project management", "marketing project management", "campaign planning",
+    "campaign execution", "roadmap planning", "marketing operations",
+    "resource planning", "stakeholder management", "timeline management",
+    "agile marketing", "scrum", "kanban", "workflow management", "budget management",
+]
+
+AI_MARKETING_SKILLS = [
+    "chatgpt", "gpt", "prompt engineering", "ai prompting", "generative ai",
+    "ai content creation", "ai copywriting", "claude ai", "jasper ai", "midjourney",
+    "dalle", "adobe firefly", "canva ai", "runway", "pictory", "synthesia",
+    "marketing automation", "zapier", "make", "generative engine optimization", "geo",
+]
+
+# Pillar key -> definition, in detection order
+PILLAR_DEFINITIONS = {
+    'foundations': {'name': 'Foundations & Narratives', 'skills': FOUNDATION_SKILLS},
+    'strategy': {'name': 'Strategy & Growth Execution', 'skills': STRATEGY_SKILLS},
+    'analytics': {'name': 'Analytics & Data', 'skills': ANALYTICS_SKILLS},
+    'project-management': {'name': 'Project & Marketing Operations', 'skills': PROJECT_MANAGEMENT_SKILLS},
+    'ai': {'name': 'AI & Automation for Marketing', 'skills': AI_MARKETING_SKILLS},
+}
+
+# One bit per pillar, in detection order
+_PILLAR_KEYS = list(PILLAR_DEFINITIONS)
+PILLAR_MATCHER = SkillMatcher(
+    (skill, 1 << i) for i, key in enumerate(_PILLAR_KEYS) for skill in PILLAR_DEFINITIONS[key]['skills']
+)
+
+
+def match_skill_to_pillar(user_skill, pillar_skills):
+    """True if the skill contains, or is contained in, any of the pillar's skills."""
+    for known_skill in pillar_skills:
+        if known_skill in user_skill or user_skill in known_skill:
+            return True
+    return False
+
+
+def detect_pillars(user_skills):
+    """
+    Detect the pillars covered by a list of canonical skills.
+
+    Each skill counts towards the first not-yet-detected pillar it matches (in
+    PILLAR_DEFINITIONS order), and each pillar is detected at most once.
+    PILLAR_MATCHER finds every matching pillar in one lookup, so the cost
+    does not grow with the size of the skill lists.
+
+    Returns:
+        list[str]: Pillar keys in detection order
+    """
+    detected = []
+    if not isinstance(user_skills, (list, tuple)):
+        return detected
+
+    detected_mask = 0
+    for user_skill in user_skills:
+        if not user_skill or not isinstance(user_skill, str):
+            continue
+        normalized = user_skill.lower().strip(JS_WHITESPACE)
+        available = PILLAR_MATCHER.match(normalized) & ~detected_mask
+        if available:
+            bit = available & -available
+            detected_mask |= bit
+            detected.append(_PILLAR_KEYS[lowest_bit_index(bit)])
+    return detected
+
+
+def get_pillar_names(pillar_keys):
+    """Human-readable names for pillar keys (unknown keys are skipped)."""
+    return [PILLAR_DEFINITIONS[key]['name'] for key in pillar_keys if key in PILLAR_DEFINITIONS]
+
+
+def get_all_pillar_keys():
+    """All pillar keys, in detection order."""
+    return list(PILLAR_DEFINITIONS)
+
+
+def get_pillar_definition(pillar_key):
+    """Definition dict for a pillar key, or None."""
+    return PILLAR_DEFINITIONS.get(pillar_key)
@@ -0,0 +1,172 @@
+"""
+ROI result cache for POST /api/roi/ and POST /api/roi/batch/.
+
+Off by default (ROI_RESULT_CACHE_TTL = 0): a table-driven calculation takes
+a few microseconds, less than a cache lookup, even in process memory
+(benchmarks/bench_roi_result_cache.py). Turn it on only where the
+benchmark shows a win for your cache backend.
+
+Keys are a hash of the profile with its skills lightly normalized
+(lowercased, trimmed, empty skills dropped, none of which changes what
+they match), so a hit skips skill lookup and pillar detection altogether.
+Results are stored in a Django cache (ROI_RESULT_CACHE_ALIAS, Redis when
+REDIS_URL is set, per-process memory otherwise) for ROI_RESULT_CACHE_TTL
+seconds.
+
+Keys carry a version derived from the pillar constants and names in
+engine.py / pillars.py, hashed once per pillar table rebuild, so changing
+them starts a new key space instead of serving stale results. The current
+salary is part of the key as given: experienced results scale with it, so
+any coarser bucket would change them.
+
+A cache outage never fails a calculation; results are then computed directly.
+"""
+import hashlib
+import json
+import threading
+
+from django.conf import settings
+from django.core.cache import caches
+
+from .engine import _constants_signature, calculate_salary, get_pillar_table, score_profile
+from .pillars import PILLAR_DEFINITIONS
+from .skills import JS_WHITESPACE
+
+KEY_PREFIX = 'roi:result'
+
+_stats_lock = threading.Lock()
+_stats = {'hits': 0, 'misses': 0, 'errors': 0}
+
+# (pillar table the version was computed for, version)
+_version = (None, None)
+
+
+def _count(name, amount=1):
+    with _stats_lock:
+        _stats[name] += amount
+
+
+def constants_version():
+    """
+    Short hash of the pillar constants and names that results depend on.
+
+    Computed once per pillar table: get_pillar_table() only returns a new
+    table when a constant has changed.
+    """
+    global _version
+    table = get_pillar_table()
+    built_for, version = _version
+    if table is not built_for:
+        names = tuple((key, pillar['name']) for key, pillar in PILLAR_DEFINITIONS.items())
+        raw = repr((_constants_signature(), names))
+        version = hashlib.sha256(raw.encode('utf-8')).hexdigest()[:12]
+        _version = (table, version)
+    return version
+
+
+def canonical_profile(profile):
+    """
+    The inputs a profile's result depends on, without detecting pillars.
+
+    Skills are lowercased and trimmed and empty ones dropped: normalize_skill()
+    does the same before anything is matched, so results are unchanged.
+
+    Args:
+        profile: Profile from leads.roi.validation.validate_profile()
+
+    Returns:
+        tuple: (user_type, skills, has_full_stack, current_salary);
+        salary is None where the result does not use it
+    """
+    user_type = profile['user_type']
+    skills = tuple(
+        skill for skill in (raw.lower().strip(JS_WHITESPACE) for raw in profile['skills']) if skill
+    )
+    salary = None
+    if user_type == 'experienced':
+        salary = float(profile['current_salary'] or 0)
+        if not salary > 0:
+            # Every missing salary gets the same prompt
+            salary, skills = 0.0, ()
+    return user_type, skills, bool(profile['has_full_stack']), salary
+
+
+def cache_key(canonical, version=None):
+    """Cache key for a canonical profile under a constants version."""
+    raw = json.dumps(canonical, separators=(',', ':'))
+    digest = hashlib.sha256(raw.encode('utf-8')).hexdigest()[:32]
+    return f"{KEY_PREFIX}:{version or constants_version()}:{digest}"
+
+
+def _compute(canonical):
+    user_type, skills, has_full_stack, salary = canonical
+    return calculate_salary(user_type, list(skills), has_full_stack, salary or 0)
+
+
+def score_profiles_cached(profiles):
+    """
+    score_profile() for many profiles, through the result cache.
+
+    Identical canonical profiles are computed once; hits and misses are
+    read and written with one get_many() / set_many() round trip each.
+    With ROI_RESULT_CACHE_TTL <= 0 (the default) profiles are scored directly.
+
+    Args:
+        profiles: Profiles from leads.roi.validation.validate_profile()
+
+    Returns:
+        list[dict]: Results, in input order
+    """
+    ttl = settings.ROI_RESULT_CACHE_TTL
+    if ttl <= 0:
+        return [score_profile(profile) for profile in profiles]
+
+    canonicals = [canonical_profile(profile) for profile in profiles]
+
+    version = constants_version()
+    keys = [cache_key(canonical, version) for canonical in canonicals]
+    cache = caches[settings.ROI_RESULT_CACHE_ALIAS]
+    try:
+        found = cache.get_many(set(keys))
+    except Exception as e:
+        _count('errors')
+        print(f"[ROI] ⚠️ Result cache unavailable: {e}")
+        return [_compute(canonical) for canonical in canonicals]
+
+    computed = {}
+    for key, canonical in zip(keys, canonicals):
+        if key not in found and key not in computed:
+            computed[key] = _compute(canonical)
+    _count('hits', len(keys) - len(computed))
+    _count('misses', len(computed))
+
+    if computed:
+        try:
+            cache.set_many(computed, timeout=ttl)
+        except Exception as e:
+            _count('errors')
+            print(f"[ROI] ⚠️ Result cache write failed: {e}")
+
+    return [found[key] if key in found else computed[key] for key in keys]
+
+
+def score_profile_cached(profile):
+    """score_profile() for one profile, through the result cache."""
+    return score_profiles_cached([profile])[0]
+
+
+def result_cache_stats():
+    """
+    Per-process cache counters.
+
+    Returns:
+        dict: hits, misses, errors, hit_rate (0-1), ttl, alias and the current constants version
+    """
+    with _stats_lock:
+        stats = dict(_stats)
+    lookups = stats['hits'] + stats['misses']
+    stats['hit_rate'] = round(stats['hits'] / lookups, 4) if lookups else 0
+    stats['ttl'] = settings.ROI_RESULT_CACHE_TTL
+    stats['alias'] = settings.ROI_RESULT_CACHE_ALIAS
+    stats['version'] = constants_version()
+    return stats
@@ -0,0 +1,38 @@
+/**
+ * Run the browser ROI engine (src/utils) on golden cases for leads/roi/golden.py.
+ *
+ * Reads {"src": "<path to src/utils>", "cases": [...], "legacy": [...]} on stdin
+ * and writes {"cases": [...], "legacy": [...], "tableMismatches": [...]} to stdout
+ * (tableMismatches from verifyPillarTable() in salaryEngine.js). The utils are
+ * copied to a temporary directory with explicit ".js" import specifiers, since
+ * Node's ESM loader does not resolve the extensionless imports Vite accepts.
+ */
+import { mkdtempSync, readFileSync, readdirSync, rmSync, writeFileSync } from 'node:fs'
+import { tmpdir } from 'node:os'
+import { join } from 'node:path'
+import { pathToFileURL } from 'node:url'
+
+const input = JSON.parse(readFileSync(0, 'utf8'))
+const dir = mkdtempSync(join(tmpdir(), 'roi-golden-'))
+
+try {
+  writeFileSync(join(dir, 'package.json'), '{"type": "module"}')
+  for (const name of readdirSync(input.src)) {
+    if (!name.endsWith('.js')) continue
+    const source = readFileSync(join(input.src, name), 'utf8')
+      .replace(/from '(\.\/[^'.]+)'/g, "from '$1.js'")
+    writeFileSync(join(dir, name), source)
+  }
+
+  const engine = await import(pathToFileURL(join(dir, 'salaryEngine.js')).href)
+  const legacy = await import(pathToFileURL(join(dir, 'salaryCalculator.js')).href)
+
+  const output = {
+    cases: input.cases.map((params) => engine.calculateSalary(params)),
+    legacy: input.legacy.map((inputs) => legacy.calculateSalary(inputs)),
+    tableMismatches: engine.verifyPillarTable(),
+  }
+  process.stdout.write(JSON.stringify(output))
+} finally {
+  rmSync(dir, { recursive: true, force: true })
+}
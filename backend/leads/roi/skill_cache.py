@@ -0,0 +1,93 @@
+"""
+Skill lookup cache (port of src/utils/skillCache.js).
+
+The same raw skills ("ga4", "fb ads", "chat gpt") arrive over and over, in
+the ROI API, batch scoring and lead capture. lookup_skill() memoizes, per raw
+skill string, the canonical skill and the mask of pillars it matches in a
+bounded LRU (ROI_SKILL_CACHE_SIZE entries), so repeated skills skip
+normalization, alias resolution and pillar matching. skill_cache_stats()
+reports hits and misses for sizing it (GET /api/leads/metrics/).
+"""
+from functools import lru_cache
+
+from django.conf import settings
+
+from .matcher import lowest_bit_index
+from .pillars import PILLAR_MATCHER, get_all_pillar_keys
+from .skills import JS_WHITESPACE, normalize_skill, resolve_alias
+
+_PILLAR_KEYS = get_all_pillar_keys()
+
+
+@lru_cache(maxsize=settings.ROI_SKILL_CACHE_SIZE)
+def _lookup(raw_skill):
+    normalized = normalize_skill(raw_skill)
+    if not normalized:
+        return None
+    canonical = resolve_alias(normalized)
+    if not canonical:
+        return None
+    return canonical, PILLAR_MATCHER.match(canonical.lower().strip(JS_WHITESPACE))
+
+
+def lookup_skill(raw_skill):
+    """
+    Canonical skill and matching pillars for a raw skill.
+
+    Args:
+        raw_skill: Raw skill as entered (non-strings are never cached)
+
+    Returns:
+        tuple or None: (canonical skill, pillar bitmask in PILLAR_DEFINITIONS
+        order), or None for skills the engine drops
+    """
+    if not isinstance(raw_skill, str):
+        return None
+    return _lookup(raw_skill)
+
+
+def detect_skill_pillars(user_skills):
+    """
+    detect_pillars(process_user_skills(user_skills)) through the cache.
+
+    Returns:
+        list[str]: Pillar keys in detection order
+    """
+    detected = []
+    if not isinstance(user_skills, (list, tuple)):
+        return detected
+
+    detected_mask = 0
+    for raw_skill in user_skills:
+        entry = lookup_skill(raw_skill)
+        if entry is None:
+            continue
+        available = entry[1] & ~detected_mask
+        if available:
+            bit = available & -available
+            detected_mask |= bit
+            detected.append(_PILLAR_KEYS[lowest_bit_index(bit)])
+    return detected
+
+
+def skill_cache_stats():
+    """
+    Cache counters.
+
+    Returns:
+        dict: hits, misses, size, max_size and hit_rate (0-1)
+    """
+    info = _lookup.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        'hits': info.hits,
+        'misses': info.misses,
+        'size': info.currsize,
+        'max_size': info.maxsize,
+        'hit_rate': round(info.hits / lookups, 4) if lookups else 0,
+    }
+
+
+def clear_skill_cache():
+    """Empty the cache and reset its counters (e.g. after changing the skill lists)."""
+    _lookup.cache_clear()
@@ -0,0 +1,106 @@
+"""
+Skill normalization (port of src/utils/skillNormalization.js).
+
+Free-text skills are lowercased, stripped of special characters and resolved
+through SKILL_ALIASES exactly like the browser does, including JavaScript's
+definition of whitespace and its ASCII-only \\w.
+"""
+import re
+
+SKILL_ALIASES = {
+    "ga": "google analytics",
+    "ga4": "google analytics",
+    "google analytics 4": "google analytics",
+    "fb ads": "meta ads",
+    "facebook ads": "meta ads",
+    "insta ads": "meta ads",
+    "ppc": "google ads",
+    "chat gpt": "chatgpt",
+    "prompting": "prompt engineering",
+    "ai prompting": "prompt engineering",
+    "gen ai": "generative ai",
+    "gtm": "google tag manager",
+    "gsheets": "google sheets",
+}
+
+# Characters matched by JavaScript's \s (and stripped by String.prototype.trim)
+JS_WHITESPACE = (
+    '\t\n\x0b\x0c\r \xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006'
+    '\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000\ufeff'
+)
+_WS_CLASS = re.escape(JS_WHITESPACE)
+
+SPECIAL_CHARS_RE = re.compile(f'[^A-Za-z0-9_{_WS_CLASS}]')
+WHITESPACE_RUN_RE = re.compile(f'[{_WS_CLASS}]+')
+
+# Object.prototype members that a normalized (lowercase) skill can name. In the
+# browser SKILL_ALIASES[skill] returns the inherited member instead of
+# undefined, and the skill is then dropped; resolve_alias() returns None.
+_JS_PROTOTYPE_KEYS = frozenset({'constructor', '__proto__'})
+
+
+def normalize_skill(skill):
+    """
+    Normalize a skill string: lowercase, special characters to spaces,
+    whitespace collapsed and trimmed.
+
+    Returns:
+        str: Normalized skill ('' for empty or non-string input)
+    """
+    if not skill or not isinstance(skill, str):
+        return ''
+    normalized = SPECIAL_CHARS_RE.sub(' ', skill.lower())
+    return WHITESPACE_RUN_RE.sub(' ', normalized).strip(' ')
+
+
+def resolve_alias(normalized_skill):
+    """
+    Resolve a normalized skill to its canonical name.
+
+    An exact alias wins; otherwise the first alias (in SKILL_ALIASES order)
+    that contains, or is contained in, the skill.
+    With a dozen short aliases this scan is faster than a compiled
+    SkillMatcher (see benchmarks/bench_skill_matcher.py).
+
+    Returns:
+        str or None: Canonical skill (the input itself if no alias matches),
+        or None for skills the browser engine drops
+    """
+    if normalized_skill in _JS_PROTOTYPE_KEYS:
+        return None
+    canonical = SKILL_ALIASES.get(normalized_skill)
+    if canonical:
+        return canonical
+    for alias, canonical in SKILL_ALIASES.items():
+        if alias in normalized_skill or normalized_skill in alias:
+            return canonical
+    return normalized_skill
+
+
+def fuzzy_match(user_skill, known_skill):
+    """Bidirectional contains match between two skills after normalization."""
+    if not user_skill or not known_skill:
+        return False
+    normalized_user = normalize_skill(user_skill)
+    normalized_known = normalize_skill(known_skill)
+    return normalized_known in normalized_user or normalized_user in normalized_known
+
+
+def process_user_skills(user_skills):
+    """
+    Normalize and alias-resolve a list of raw skills.
+
+    Returns:
+        list[str]: Canonical skills, in input order (empty ones dropped)
+    """
+    if not isinstance(user_skills, (list, tuple)):
+        return []
+    processed = []
+    for skill in user_skills:
+        normalized = normalize_skill(skill)
+        if not normalized:
+            continue
+        canonical = resolve_alias(normalized)
+        if canonical:
+            processed.append(canonical)
+    return processed
@@ -0,0 +1,112 @@
+"""
+Input validation for the ROI API.
+
+validate_profile() follows leads/validators.py: it returns (profile, errors)
+and accepts both snake_case field names and the camelCase names the frontend
+passes to calculateSalary() (userType, skills, hasFullStack, currentSalary).
+"""
+import math
+
+from django.conf import settings
+
+from .engine import USER_TYPES
+
+MESSAGES = {
+    'user_type_invalid': 'User type must be "fresher" or "experienced".',
+    'skills_invalid': 'Skills must be a list of strings.',
+    'skills_too_many': 'At most {max} skills are allowed.',
+    'skill_too_long': 'Each skill can be at most {max} characters.',
+    'has_full_stack_invalid': 'has_full_stack must be true or false.',
+    'current_salary_invalid': 'Current salary must be a non-negative number.',
+    'profile_invalid': 'Each profile must be a JSON object.',
+}
+
+MAX_SKILL_LENGTH = 100
+
+
+def _field(data, name, alias):
+    if name in data:
+        return data[name]
+    return data.get(alias)
+
+
+def validate_profile(data):
+    """
+    Validate one ROI profile.
+
+    Args:
+        data: Request payload (dict)
+
+    Returns:
+        tuple: (profile, errors) - profile has user_type, skills, has_full_stack
+        and current_salary; errors maps field names to message lists
+    """
+    if not isinstance(data, dict):
+        return None, {'non_field_errors': [MESSAGES['profile_invalid']]}
+
+    errors = {}
+
+    user_type = _field(data, 'user_type', 'userType')
+    if user_type not in USER_TYPES:
+        errors['user_type'] = [MESSAGES['user_type_invalid']]
+
+    skills = _field(data, 'skills', 'skills')
+    if skills is None:
+        skills = []
+    if not isinstance(skills, list) or not all(isinstance(skill, str) for skill in skills):
+        errors['skills'] = [MESSAGES['skills_invalid']]
+    elif len(skills) > settings.ROI_MAX_SKILLS:
+        errors['skills'] = [MESSAGES['skills_too_many'].format(max=settings.ROI_MAX_SKILLS)]
+    elif any(len(skill) > MAX_SKILL_LENGTH for skill in skills):
+        errors['skills'] = [MESSAGES['skill_too_long'].format(max=MAX_SKILL_LENGTH)]
+
+    has_full_stack = _field(data, 'has_full_stack', 'hasFullStack')
+    if has_full_stack is None:
+        has_full_stack = False
+    if not isinstance(has_full_stack, bool):
+        errors['has_full_stack'] = [MESSAGES['has_full_stack_invalid']]
+
+    current_salary = _field(data, 'current_salary', 'currentSalary')
+    if current_salary is None:
+        current_salary = 0
+    if (
+        isinstance(current_salary, bool)
+        or not isinstance(current_salary, (int, float))
+        or not math.isfinite(current_salary)
+        or current_salary < 0
+    ):
+        errors['current_salary'] = [MESSAGES['current_salary_invalid']]
+
+    if errors:
+        return None, errors
+    return {
+        'user_type': user_type,
+        'skills': skills,
+        'has_full_stack': has_full_stack,
+        'current_salary': current_salary,
+    }, {}
+
+
+def validate_career_profile(data):
+    """
+    Profile from the careerProfile object the lead form sends with a lead.
+
+    A lead is never rejected because of its calculator profile: a missing or
+    invalid profile is simply not stored.
+
+    Args:
+        data: career_profile from the lead payload (experience_level, skills,
+            is_full_stack, current_salary)
+
+    Returns:
+        dict or None: Profile as returned by validate_profile()
+    """
+    if not isinstance(data, dict):
+        return None
+    profile, _errors = validate_profile({
+        'user_type': data.get('experience_level'),
+        'skills': data.get('skills'),
+        'has_full_stack': data.get('is_full_stack'),
+        'current_salary': data.get('current_salary'),
+    })
+    return profile
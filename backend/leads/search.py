@@ -0,0 +1,150 @@
+"""
+Lead search.
+
+Replaces the admin's three LIKE '%q%' scans with index-backed lookups chosen
+from the shape of the query:
+
+- Contains "@"            -> email prefix     (email LIKE 'q%', primary key index)
+- Digits (+, spaces, -)   -> phone prefix     (phone_number LIKE '+91q%', leads_phone_idx)
+- Anything else           -> name tokens      (MATCH(full_name) AGAINST ('+tok* ...' IN BOOLEAN
+                                                MODE), FULLTEXT index leads_full_name_ft)
+                             or an email prefix for single-word queries
+
+Every name token is a prefix match, so "ash ra" finds "Asha Rao". On databases
+other than MySQL (and for tokens shorter than innodb_ft_min_token_size, which
+FULLTEXT ignores) name tokens fall back to LIKE '%token%'.
+"""
+import re
+
+from django.db import connection
+from django.db.models import Lookup
+
+from .models import Lead
+
+# innodb_ft_min_token_size default; shorter tokens are not in the FULLTEXT index
+FT_MIN_TOKEN = 3
+
+TOKEN_RE = re.compile(r'[A-Za-z]+')
+PHONE_QUERY_RE = re.compile(r'\+?[0-9][0-9 \-]*')
+EMAIL_PREFIX_RE = re.compile(r'[a-z0-9._%+-]+')
+
+SEARCH_FIELDS = ('email', 'full_name', 'phone_number', 'created_at', 'sheets_status')
+
+
+class FullTextMatch(Lookup):
+    """full_name__ft_match='+asha* +rao*' -> MATCH (full_name) AGAINST (... IN BOOLEAN MODE)."""
+
+    lookup_name = 'ft_match'
+
+    def as_mysql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"MATCH ({lhs}) AGAINST ({rhs} IN BOOLEAN MODE)", lhs_params + rhs_params
+
+
+Lead._meta.get_field('full_name').register_lookup(FullTextMatch)
+
+
+def phone_prefix(term):
+    """
+    Normalize a phone query to a stored-value prefix (+91XXXXXXXXXX).
+
+    "98765", "+91 98765" and "9198765432109" all become "+9198765...".
+    """
+    digits = re.sub(r'[^0-9]', '', term)
+    if term.lstrip().startswith('+') or (digits.startswith('91') and len(digits) > 10):
+        return '+' + digits
+    return '+91' + digits
+
+
+def classify(term):
+    """
+    Decide how to search for a query string.
+
+    Returns:
+        tuple: ('email', prefix), ('phone', prefix), ('name', tokens) or (None, None)
+    """
+    term = term.strip()
+    if not term:
+        return None, None
+    if '@' in term:
+        return 'email', term.lower()
+    if PHONE_QUERY_RE.fullmatch(term):
+        return 'phone', phone_prefix(term)
+    tokens = TOKEN_RE.findall(term)
+    if not tokens:
+        return None, None
+    return 'name', tokens
+
+
+def _use_fulltext():
+    return connection.vendor == 'mysql'
+
+
+def name_queryset(tokens):
+    """Leads whose name contains a word starting with every token."""
+    queryset = Lead.objects.all()
+    long_tokens = [t for t in tokens if len(t) >= FT_MIN_TOKEN]
+    if _use_fulltext() and long_tokens:
+        queryset = queryset.filter(full_name__ft_match=' '.join(f'+{t}*' for t in long_tokens))
+        tokens = [t for t in tokens if len(t) < FT_MIN_TOKEN]
+    for token in tokens:
+        queryset = queryset.filter(full_name__icontains=token)
+    return queryset
+
+
+def search_queryset(term):
+    """
+    Unsliced queryset of leads matching a query (used by the admin changelist).
+
+    As in search_leads(), a name query that is also a possible email prefix
+    runs the name match and the email-prefix match as two separate index
+    lookups; the result is filtered on the union of their primary keys.
+
+    Returns:
+        QuerySet: Matching leads (empty for a query with nothing searchable)
+    """
+    kind, value = classify(term)
+    if kind == 'email':
+        return Lead.objects.filter(email__istartswith=value)
+    if kind == 'phone':
+        return Lead.objects.filter(phone_number__istartswith=value)
+    if kind == 'name':
+        queryset = name_queryset(value)
+        single = term.strip().lower()
+        if EMAIL_PREFIX_RE.fullmatch(single):
+            # An OR of both conditions would be answered with a table scan
+            emails = set(queryset.values_list('pk', flat=True))
+            emails.update(Lead.objects.filter(email__istartswith=single).values_list('pk', flat=True))
+            queryset = Lead.objects.filter(pk__in=emails)
+        return queryset
+    return Lead.objects.none()
+
+
+def search_leads(term, limit=20):
+    """
+    Newest matching leads for the search API.
+
+    Name queries run the name match and the email-prefix match as two
+    separate index lookups and merge them, rather than one OR query that
+    MySQL would answer with a table scan.
+
+    Returns:
+        list[Lead]: Up to `limit` leads, newest first
+    """
+    kind, value = classify(term)
+    if kind is None:
+        return []
+    ordering = ('-created_at', '-email')
+    if kind != 'name':
+        return list(search_queryset(term).only(*SEARCH_FIELDS).order_by(*ordering)[:limit])
+
+    leads = {
+        lead.email: lead
+        for lead in name_queryset(value).only(*SEARCH_FIELDS).order_by(*ordering)[:limit]
+    }
+    single = term.strip().lower()
+    if EMAIL_PREFIX_RE.fullmatch(single):
+        for lead in Lead.objects.filter(email__istartswith=single).only(*SEARCH_FIELDS).order_by(*ordering)[:limit]:
+            leads.setdefault(lead.email, lead)
+    return sorted(leads.values(), key=lambda lead: (lead.created_at, lead.email), reverse=True)[:limit]
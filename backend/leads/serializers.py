@@ -2,24 +2,30 @@
 Serializers for Lead API endpoints.
 Handles validation for email and Indian phone number format.
 """
-import re
+from django.conf import settings
 from rest_framework import serializers
 from .models import Lead
+from .outbox import enqueue_lead
+from .webhook import send_to_sheets
+from .validators import clean_email, clean_full_name, clean_phone_number
 
 
 class LeadSerializer(serializers.ModelSerializer):
     """
     Serializer for Lead model.
     
-    Validates:
-    - Email format (standard email validation)
-    - Indian phone number format (+91 followed by exactly 10 digits)
+    Validates (same rules as the API views, see leads/validators.py):
+    - Name (letters and spaces only)
+    - Email format
+    - Indian phone number (10 digits, stored as +91XXXXXXXXXX)
     
     Request fields:
     - name: Maps to full_name
     - email: User's email
-    - phone: Maps to phone_number (must be in +91XXXXXXXXXX format)
+    - phone: Maps to phone_number (10 digits, +91 prefix optional)
     """
+    # Plain CharField so only the shared email rule (and its message) applies
+    email = serializers.CharField(max_length=254)
     name = serializers.CharField(source='full_name', max_length=150, write_only=True)
     phone = serializers.CharField(source='phone_number', max_length=15, write_only=True)
 
@@ -30,73 +36,51 @@ class LeadSerializer(serializers.ModelSerializer):
 
     def validate_email(self, value):
         """
-        Validate email format and check for uniqueness.
-        Django's EmailField already validates basic format,
-        but we add explicit validation for clarity.
+        Validate email format.
+        Format rules are shared with the API views (leads/validators.py).
+        Resubmissions are not rejected here: create() upserts on the email.
         """
-        if not value:
-            raise serializers.ValidationError("Email is required.")
-        
-        # Basic email format check (Django's EmailField also validates)
-        email_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-        if not re.match(email_pattern, value):
-            raise serializers.ValidationError("Invalid email format.")
-        
-        # Normalize email (lowercase and strip)
-        normalized_email = value.lower().strip()
-        
-        # Check if email already exists (for create operations)
-        if self.instance is None:  # Creating new lead
-            if Lead.objects.filter(email=normalized_email).exists():
-                raise serializers.ValidationError(
-                    "This email has already been registered. Each email can only be submitted once."
-                )
-        
+        normalized_email, error = clean_email(value)
+        if error:
+            raise serializers.ValidationError(error)
         return normalized_email
 
+    def create(self, validated_data):
+        """
+        Submit the lead the way LeadCreateView does for LEAD_WEBHOOK_MODE:
+        - outbox: the single-statement upsert into the outbox (a resubmitted
+          email only increments Lead.submissions)
+        - inline: straight to the Google Sheets webhook, nothing is stored
+          (raises WebhookError / requests exceptions on failure)
+        
+        Returns an unsaved Lead built from the validated data, so no extra
+        query is made to read the row back (created_at is not set).
+        """
+        lead = Lead(
+            email=validated_data['email'],
+            full_name=validated_data['full_name'],
+            phone_number=validated_data['phone_number'],
+        )
+        if settings.LEAD_WEBHOOK_MODE == 'outbox':
+            enqueue_lead(lead.full_name, lead.email, lead.phone_number)
+        else:
+            send_to_sheets(lead.to_webhook_payload())
+        return lead
+
     def validate_phone(self, value):
         """
         Validate Indian phone number format.
-        Must be: +91 followed by exactly 10 digits
+        Accepts 10 digits with or without the +91 prefix and returns +91XXXXXXXXXX.
         Example: +919876543210
         """
-        if not value:
-            raise serializers.ValidationError("Phone number is required.")
-        
-        # Remove any whitespace
-        value = value.strip()
-        
-        # Check if it starts with +91
-        if not value.startswith('+91'):
-            raise serializers.ValidationError(
-                "Phone number must be in Indian format: +91 followed by 10 digits. "
-                "Example: +919876543210"
-            )
-        
-        # Extract digits after +91
-        digits = value[3:]
-        
-        # Check if exactly 10 digits
-        if not digits.isdigit():
-            raise serializers.ValidationError(
-                "Phone number must contain only digits after +91."
-            )
-        
-        if len(digits) != 10:
-            raise serializers.ValidationError(
-                "Phone number must have exactly 10 digits after +91."
-            )
-        
-        return value
+        phone_number, error = clean_phone_number(value)
+        if error:
+            raise serializers.ValidationError(error)
+        return phone_number
 
     def validate_name(self, value):
-        """Validate name field."""
-        if not value or not value.strip():
-            raise serializers.ValidationError("Name is required.")
-        
-        if len(value.strip()) < 2:
-            raise serializers.ValidationError("Name must be at least 2 characters.")
-        
-        return value.strip()
-
-
+        """Validate name field (letters and spaces only)."""
+        full_name, error = clean_full_name(value)
+        if error:
+            raise serializers.ValidationError(error)
+        return full_name
@@ -0,0 +1,92 @@
+"""
+Precompiled email templates.
+
+Email bodies live as plain files in leads/email_templates/ with {field}
+placeholders (e.g. {full_name}). TemplateStore reads every file once at import
+time and splits it into static segments around the placeholders, so rendering a
+message is a single ''.join() over prebuilt pieces - no parsing and no
+re-formatting of the ~100 lines of static HTML per email.
+
+Only the declared field names are treated as placeholders; any other braces
+(CSS rules in the HTML template) are static text.
+"""
+import html
+import os
+import re
+
+
+class CompiledTemplate:
+    """
+    A template pre-split into static segments and placeholder slots.
+
+    Args:
+        source: Template text
+        fields: Placeholder names recognised in the text
+        escape: HTML-escape values on render (for text/html templates)
+    """
+
+    def __init__(self, source, fields=('full_name',), escape=False):
+        pattern = re.compile(r'\{(' + '|'.join(re.escape(f) for f in fields) + r')\}')
+        parts = pattern.split(source)
+        # parts alternates: static, field, static, field, ..., static
+        self.segments = parts[0::2]
+        self.slots = parts[1::2]
+        self.escape = escape
+        self.source = source
+
+    def render(self, **context):
+        """
+        Fill the placeholders with context values.
+
+        Raises:
+            KeyError: If a placeholder has no value in context
+        """
+        segments = self.segments
+        if not self.slots:
+            return segments[0]
+        out = [segments[0]]
+        for slot, static in zip(self.slots, segments[1:]):
+            value = str(context[slot])
+            out.append(html.escape(value) if self.escape else value)
+            out.append(static)
+        return ''.join(out)
+
+
+class TemplateStore:
+    """
+    All templates of a directory, compiled once.
+
+    Files ending in .html are HTML-escaped on render; everything else is plain text.
+
+    Args:
+        directory: Folder holding the template files
+        fields: Placeholder names recognised in every template
+    """
+
+    def __init__(self, directory, fields=('full_name',)):
+        self.directory = directory
+        self.fields = tuple(fields)
+        self._templates = {}
+        for name in sorted(os.listdir(directory)):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                with open(path, encoding='utf-8') as f:
+                    self._templates[name] = CompiledTemplate(
+                        f.read(), self.fields, escape=name.endswith('.html')
+                    )
+
+    def get(self, name):
+        """
+        Return the compiled template for a file name.
+
+        Raises:
+            KeyError: If no such template was loaded
+        """
+        return self._templates[name]
+
+    def compile_string(self, source, escape=False):
+        """Compile an inline template (e.g. a subject line) with the store's fields."""
+        return CompiledTemplate(source, self.fields, escape=escape)
+
+    def names(self):
+        return list(self._templates)
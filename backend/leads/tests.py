@@ -0,0 +1,112 @@
+from django.test import TestCase
+
+from .models import Lead
+from .outbox import enqueue_lead
+from .roi.batch import profile_fields
+from .roi.validation import validate_career_profile
+
+
+class EnqueueLeadTests(TestCase):
+    """The outbox upsert (raw INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE)."""
+
+    email = 'asha.rao@example.com'
+
+    def profile(self, **overrides):
+        data = {
+            'experience_level': 'experienced',
+            'skills': ['SEO', 'Google Analytics', 'ChatGPT'],
+            'is_full_stack': False,
+            'current_salary': 8,
+        }
+        data.update(overrides)
+        return validate_career_profile(data)
+
+    def enqueue(self, profile=None):
+        return enqueue_lead('Asha Rao', self.email, '+919876543210', profile=profile)
+
+    def test_new_email_is_inserted_as_pending(self):
+        self.assertTrue(self.enqueue())
+
+        lead = Lead.objects.get(email=self.email)
+        self.assertEqual(lead.full_name, 'Asha Rao')
+        self.assertEqual(lead.phone_number, '+919876543210')
+        self.assertEqual(lead.submissions, 1)
+        self.assertEqual(lead.sheets_status, Lead.SHEETS_PENDING)
+        self.assertIsNotNone(lead.sheets_next_attempt_at)
+        self.assertTrue(lead.roadmap_requested)
+        self.assertEqual(lead.roi_user_type, '')
+        self.assertIsNone(lead.roi_before)
+
+    def test_resubmission_only_increments_submissions(self):
+        self.assertTrue(self.enqueue())
+        Lead.objects.filter(email=self.email).update(sheets_status=Lead.SHEETS_SENT)
+
+        self.assertFalse(self.enqueue())
+        self.assertFalse(self.enqueue())
+
+        lead = Lead.objects.get(email=self.email)
+        self.assertEqual(Lead.objects.count(), 1)
+        self.assertEqual(lead.submissions, 3)
+        # Outbox state of the stored lead is left alone
+        self.assertEqual(lead.sheets_status, Lead.SHEETS_SENT)
+
+    def test_resubmission_requests_the_roadmap_for_an_imported_lead(self):
+        self.assertTrue(self.enqueue())
+        Lead.objects.filter(email=self.email).update(roadmap_requested=False)
+
+        self.assertFalse(self.enqueue())
+        self.assertTrue(Lead.objects.get(email=self.email).roadmap_requested)
+
+    def test_profile_is_stored_with_its_projection(self):
+        profile = self.profile()
+        self.assertTrue(self.enqueue(profile))
+
+        lead = Lead.objects.get(email=self.email)
+        expected = profile_fields(profile)
+        self.assertEqual(lead.roi_user_type, 'experienced')
+        self.assertEqual(lead.roi_skills, ['SEO', 'Google Analytics', 'ChatGPT'])
+        self.assertFalse(lead.roi_has_full_stack)
+        self.assertEqual(lead.roi_current_salary, 8)
+        self.assertEqual(lead.roi_pillar_mask, expected['roi_pillar_mask'])
+        self.assertEqual(lead.roi_before, expected['roi_before'])
+        self.assertEqual(lead.roi_after, expected['roi_after'])
+        self.assertEqual(lead.roi_uplift, expected['roi_uplift'])
+        self.assertIsNotNone(lead.roi_scored_at)
+
+    def test_resubmitted_profile_replaces_the_stored_one(self):
+        self.assertTrue(self.enqueue(self.profile()))
+        fresher = self.profile(experience_level='fresher', skills=['Excel'], is_full_stack=True, current_salary=0)
+
+        self.assertFalse(self.enqueue(fresher))
+
+        lead = Lead.objects.get(email=self.email)
+        expected = profile_fields(fresher)
+        self.assertEqual(lead.submissions, 2)
+        self.assertEqual(lead.roi_user_type, 'fresher')
+        self.assertEqual(lead.roi_skills, ['Excel'])
+        self.assertTrue(lead.roi_has_full_stack)
+        self.assertIsNone(lead.roi_current_salary)
+        self.assertEqual(lead.roi_pillar_mask, expected['roi_pillar_mask'])
+        self.assertEqual(lead.roi_after, expected['roi_after'])
+
+    def test_resubmission_without_profile_keeps_the_stored_one(self):
+        profile = self.profile()
+        self.assertTrue(self.enqueue(profile))
+
+        self.assertFalse(self.enqueue())
+
+        lead = Lead.objects.get(email=self.email)
+        self.assertEqual(lead.submissions, 2)
+        self.assertEqual(lead.roi_user_type, 'experienced')
+        self.assertEqual(lead.roi_after, profile_fields(profile)['roi_after'])
+
+    def test_profile_added_on_resubmission(self):
+        self.assertTrue(self.enqueue())
+        profile = self.profile()
+
+        self.assertFalse(self.enqueue(profile))
+
+        lead = Lead.objects.get(email=self.email)
+        self.assertEqual(lead.submissions, 2)
+        self.assertEqual(lead.roi_user_type, 'experienced')
+        self.assertEqual(lead.roi_before, profile_fields(profile)['roi_before'])
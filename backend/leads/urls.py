@@ -2,12 +2,23 @@
 URL routing for leads app.
 """
 from django.urls import path
-from .views import LeadCreateView
+from .views import (
+    AsyncLeadCreateView, LeadBulkImportView, LeadCreateView, LeadExportView, LeadListView, LeadMetricsView,
+    LeadSearchView, RoiBatchView, RoiCalculateView,
+)
 
 app_name = 'leads'
 
 urlpatterns = [
     path('leads/', LeadCreateView.as_view(), name='lead-create'),
+    path('leads/async/', AsyncLeadCreateView.as_view(), name='lead-create-async'),
+    path('leads/import/', LeadBulkImportView.as_view(), name='lead-import'),
+    path('leads/list/', LeadListView.as_view(), name='lead-list'),
+    path('leads/search/', LeadSearchView.as_view(), name='lead-search'),
+    path('leads/export/', LeadExportView.as_view(), name='lead-export'),
+    path('leads/metrics/', LeadMetricsView.as_view(), name='lead-metrics'),
+    path('roi/', RoiCalculateView.as_view(), name='roi-calculate'),
+    path('roi/batch/', RoiBatchView.as_view(), name='roi-batch'),
 ]
 
 
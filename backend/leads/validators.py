@@ -0,0 +1,130 @@
+"""
+Lead input validation shared by the API views, LeadSerializer and bulk imports.
+
+All patterns are compiled once at import time. Rules:
+- full_name: required, letters and spaces only, no leading/trailing spaces
+- email: required, lowercased, strict address pattern
+- phone_number: required, exactly 10 digits; an optional +91 prefix is
+  stripped and the stored value is always +91XXXXXXXXXX
+
+Both the current field names (full_name, email, phone_number) and the legacy
+ones (name, email, phone) are accepted.
+"""
+import re
+
+NAME_RE = re.compile(r'[A-Za-z ]+')
+EMAIL_RE = re.compile(r'[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}')
+PHONE_DIGITS_RE = re.compile(r'[0-9]{10}')
+
+PHONE_PREFIX = '+91'
+
+MESSAGES = {
+    'name_required': 'Name is required.',
+    'name_spaces': 'Name cannot contain leading or trailing spaces.',
+    'name_invalid': 'Name can contain only letters and spaces.',
+    'email_required': 'Email is required.',
+    'email_invalid': 'Invalid email address.',
+    'phone_required': 'Phone number is required.',
+    'phone_invalid': 'Phone number must contain exactly 10 digits.',
+}
+
+
+def _text(value):
+    if value is None:
+        return ''
+    return value if isinstance(value, str) else str(value)
+
+
+def clean_full_name(value):
+    """
+    Returns:
+        tuple: (full_name, error) - error is None when the name is valid
+    """
+    raw = _text(value)
+    full_name = raw.strip()
+    if not full_name:
+        return full_name, MESSAGES['name_required']
+    if NAME_RE.fullmatch(full_name) is None:
+        return full_name, MESSAGES['name_invalid']
+    if full_name != raw:
+        return full_name, MESSAGES['name_spaces']
+    return full_name, None
+
+
+def clean_email(value):
+    """
+    Returns:
+        tuple: (normalized email, error) - error is None when the email is valid
+    """
+    email = _text(value).strip().lower()
+    if not email:
+        return email, MESSAGES['email_required']
+    if EMAIL_RE.fullmatch(email) is None:
+        return email, MESSAGES['email_invalid']
+    return email, None
+
+
+def clean_phone_number(value):
+    """
+    Returns:
+        tuple: (phone number as +91XXXXXXXXXX, error) - error is None when valid
+    """
+    digits = _text(value).strip()
+    if digits.startswith(PHONE_PREFIX):
+        digits = digits[len(PHONE_PREFIX):]
+    if not digits:
+        return digits, MESSAGES['phone_required']
+    if PHONE_DIGITS_RE.fullmatch(digits) is None:
+        return digits, MESSAGES['phone_invalid']
+    return PHONE_PREFIX + digits, None
+
+
+def validate_lead(data):
+    """
+    Validate and normalize one lead submission.
+
+    Args:
+        data: Mapping with the submitted fields
+
+    Returns:
+        tuple: (lead_data, errors) - lead_data is the webhook payload
+        {"full_name", "email", "phone_number" (+91XXXXXXXXXX)}, or None if
+        errors (field name -> list of messages) is not empty
+    """
+    get = data.get
+    full_name, name_error = clean_full_name(get('full_name') or get('name', ''))
+    email, email_error = clean_email(get('email', ''))
+    phone_number, phone_error = clean_phone_number(get('phone_number') or get('phone', ''))
+
+    if name_error is None and email_error is None and phone_error is None:
+        return {"full_name": full_name, "email": email, "phone_number": phone_number}, {}
+
+    errors = {}
+    if name_error:
+        errors['full_name'] = [name_error]
+    if email_error:
+        errors['email'] = [email_error]
+    if phone_error:
+        errors['phone_number'] = [phone_error]
+    return None, errors
+
+
+def validate_many(records):
+    """
+    Validate a batch of lead submissions with the same rules as validate_lead().
+
+    Args:
+        records: Iterable of mappings
+
+    Returns:
+        list[tuple]: (lead_data, errors) per record, in input order. A record
+        that is not a JSON object gets errors {"non_field_errors": [...]}.
+    """
+    results = []
+    append = results.append
+    for record in records:
+        if not isinstance(record, dict):
+            append((None, {'non_field_errors': ['Expected an object with full_name, email and phone_number.']}))
+            continue
+        append(validate_lead(record))
+    return results
@@ -1,27 +1,130 @@
 """
 API views for Lead management.
 Handles POST requests to create leads and send roadmap emails.
-Sends lead data to Google Sheets via webhook instead of saving to database.
+Sends lead data to Google Sheets via webhook, either inline or through the
+durable outbox in the leads table (see LEAD_WEBHOOK_MODE and leads/outbox.py).
 """
+import json
 import os
-import re
+import time
 import traceback
 import requests
-from threading import Thread
-from django.core.mail import EmailMultiAlternatives
+from asgiref.sync import sync_to_async
 from django.conf import settings
+from django.db import close_old_connections
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework.permissions import IsAdminUser
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 
-# Google Sheets webhook URL
-GOOGLE_SHEETS_WEBHOOK_URL = "https://script.google.com/macros/s/AKfycbxg8OpadW0z9cro_BL0TudSn-p-iZS8IWb3vZm5GbLY4lzkz__4sYSipD_MglOUrP79/exec"
+from . import idempotency
+from .bulk_email import defer_roadmap_email, mark_roadmap_sent
+from .bulk_import import import_leads, open_body, parser_for
+from .cursors import InvalidCursor, before_q, decode_cursor, lead_cursor
+from .dedupe import DUPLICATE, dedupe_stats, get_duplicate_detector
+from .emails import ROADMAP_PDF, ROADMAP_PDF_PATH, build_roadmap_email
+from .export import FORMATS as EXPORT_FORMATS, iter_leads, parse_bound, stream_export
+from .http import connection_stats
+from .mail_backends import pool_stats as smtp_pool_stats
+from .mailer import get_email_dispatcher
+from .models import Lead
+from .outbox import enqueue_lead, outbox_stats
+from .roi.result_cache import result_cache_stats, score_profile_cached, score_profiles_cached
+from .roi.skill_cache import skill_cache_stats
+from .roi.validation import validate_career_profile, validate_profile
+from .search import search_leads
+from .validators import validate_lead
+from .webhook import TIMEOUT_ERRORS, WebhookError, send_to_sheets, send_to_sheets_async
+
+
+EMAIL_QUEUED = 'queued'
+EMAIL_DEFERRED = 'deferred'
+EMAIL_LOST = 'lost'
+
+
+def start_roadmap_email(email, full_name, phone_number, block=True):
+    """
+    Hand the roadmap email off to the bounded email worker pool.
+    
+    When the pool is full the email is deferred to the send_roadmaps command
+    instead (a lead row with roadmap_sent_at NULL, see defer_roadmap_email()).
+    
+    Args:
+        block: Wait up to LEAD_EMAIL_SUBMIT_TIMEOUT when the pool is full
+            (never pass True from async code)
+    
+    Returns:
+        str: EMAIL_QUEUED, EMAIL_DEFERRED, or EMAIL_LOST if it could not be deferred either
+    """
+    queued = get_email_dispatcher().submit(
+        send_roadmap_email_async, email, full_name, email, block=block
+    )
+    if queued:
+        return EMAIL_QUEUED
+    
+    print(f"[Email Pool] ⚠️ Email queue full, deferring roadmap email for {email} to send_roadmaps")
+    try:
+        defer_roadmap_email(full_name, email, phone_number)
+        return EMAIL_DEFERRED
+    except Exception as e:
+        print(f"[Email Pool] ❌ Could not defer roadmap email for {email}: {str(e)}")
+        traceback.print_exc()
+        return EMAIL_LOST
+
+
+def accepted_lead_reply(email_outcome):
+    """
+    (body, status_code) for an accepted lead, by roadmap email outcome.
+    
+    A lost email is reported as a failure so the client retries the submission.
+    """
+    if email_outcome == EMAIL_QUEUED:
+        return {"success": True, "message": "Roadmap email sent"}, status.HTTP_201_CREATED
+    if email_outcome == EMAIL_DEFERRED:
+        return {"success": True, "message": "Roadmap email queued"}, status.HTTP_202_ACCEPTED
+    return {"success": False, "message": "Failed to send roadmap email"}, status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+def is_known_duplicate(email):
+    """
+    Whether an email was already submitted (see leads/dedupe.py).
+
+    Known duplicates are answered without calling the webhook, writing the
+    outbox or sending the roadmap email again.
+    """
+    if not settings.LEAD_DEDUPE_ENABLED:
+        return False
+    if get_duplicate_detector().check(email) != DUPLICATE:
+        return False
+    print(f"[Dedupe] Duplicate submission for {email}, skipping webhook and email")
+    return True
+
+
+def remember_lead(email):
+    """
+    Record an email whose roadmap email was sent, so resubmissions are caught
+    by is_known_duplicate(). Called from send_roadmap_email_async() only after
+    a successful send: a failed or deferred email must stay retryable.
+    """
+    if settings.LEAD_DEDUPE_ENABLED:
+        get_duplicate_detector().record(email)
+
+
+DUPLICATE_RESPONSE = {
+    "success": True,
+    "message": "Roadmap email already sent"
+}
 
 
 class LeadCreateView(APIView):
     """
     API endpoint to create a lead and send roadmap email.
-    Sends lead data to Google Sheets via webhook instead of saving to database.
+    Sends lead data to Google Sheets via webhook. With LEAD_WEBHOOK_MODE = 'outbox'
+    the lead is written to the leads table and delivered by dispatch_outbox instead.
     
     POST /api/leads/
     
@@ -44,6 +147,8 @@ class LeadCreateView(APIView):
         "success": true,
         "message": "Roadmap email sent"
     }
+    (202 with "Roadmap email queued" when the email pool is full and the email
+    was left to the send_roadmaps command)
     
     Response (error):
     {
@@ -53,59 +158,43 @@ class LeadCreateView(APIView):
     """
     
     def post(self, request):
+        """
+        Process a lead submission, honouring an optional Idempotency-Key header.
+        
+        Retries carrying the key of a request that already succeeded get the
+        stored response back without resubmitting (see leads/idempotency.py).
+        """
+        key = request.headers.get(idempotency.HEADER)
+        if key is None:
+            return self.create_lead(request.data)
+        
+        claim, reply = idempotency.begin(key, request.data)
+        if reply is not None:
+            status_code, body, headers = reply
+            return Response(body, status=status_code, headers=headers)
+        try:
+            response = self.create_lead(request.data)
+        except BaseException:
+            idempotency.release(claim)
+            raise
+        idempotency.finish(claim, response.status_code, response.data)
+        return response
+    
+    def create_lead(self, data):
         """
         Process lead submission:
         1. Validate request data with strict rules
-        2. Send lead data to Google Sheets webhook
+           (known duplicates are answered here with 200, see leads/dedupe.py)
+        2. Send lead data to Google Sheets webhook (inline mode),
+           or write it to the outbox in the leads table (outbox mode),
+           together with the calculator profile and its ROI projection
         3. Start email sending in background thread (non-blocking)
         4. Return success response only if webhook succeeds (HTTP 200)
+           or the lead was durably queued
         
         Note: Email sending happens asynchronously and does not block the API response.
         """
-        errors = {}
-        
-        # Extract data (support both new and legacy field names)
-        full_name_raw = request.data.get('full_name') or request.data.get('name', '')
-        email_raw = request.data.get('email', '')
-        phone_number_raw = request.data.get('phone_number') or request.data.get('phone', '')
-        
-        # Validate Full Name (required, only letters and spaces)
-        full_name = full_name_raw.strip()
-        if not full_name:
-            errors['full_name'] = ['Name is required.']
-        else:
-            # Check for leading/trailing spaces
-            if full_name != full_name_raw:
-                errors['full_name'] = ['Name cannot contain leading or trailing spaces.']
-            # Validate: only letters and spaces allowed
-            name_pattern = r'^[A-Za-z ]+$'
-            if not re.match(name_pattern, full_name):
-                errors['full_name'] = ['Name can contain only letters and spaces.']
-        
-        # Validate Email (required, strict regex)
-        email = email_raw.strip().lower()
-        if not email:
-            errors['email'] = ['Email is required.']
-        else:
-            # Validate email format using specified regex
-            email_pattern = r'^[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}$'
-            if not re.match(email_pattern, email):
-                errors['email'] = ['Invalid email address.']
-        
-        # Validate Phone Number (required, exactly 10 digits, backend adds +91)
-        phone_number = phone_number_raw.strip()
-        
-        # Remove +91 prefix if present (frontend might send it)
-        if phone_number.startswith('+91'):
-            phone_number = phone_number[3:]
-        
-        if not phone_number:
-            errors['phone_number'] = ['Phone number is required.']
-        else:
-            # Validate: exactly 10 digits, only digits allowed
-            phone_pattern = r'^[0-9]{10}$'
-            if not re.match(phone_pattern, phone_number):
-                errors['phone_number'] = ['Phone number must contain exactly 10 digits.']
+        lead_data, errors = validate_lead(data)
         
         # Return validation errors if any
         if errors:
@@ -118,32 +207,26 @@ class LeadCreateView(APIView):
                 status=status.HTTP_400_BAD_REQUEST
             )
         
-        # Format phone number with +91 prefix for Google Sheets
-        formatted_phone = f"+91{phone_number}"
+        full_name = lead_data['full_name']
+        email = lead_data['email']
+        
+        if is_known_duplicate(email):
+            return Response(DUPLICATE_RESPONSE, status=status.HTTP_200_OK)
         
         # Prepare payload for Google Sheets webhook
-        webhook_payload = {
-            "full_name": full_name,
-            "email": email,
-            "phone_number": formatted_phone
-        }
+        webhook_payload = lead_data
         
-        # Send to Google Sheets webhook
-        try:
-            print(f"[Webhook] Sending lead data to Google Sheets...")
-            print(f"[Webhook] Payload: {webhook_payload}")
-            
-            response = requests.post(
-                GOOGLE_SHEETS_WEBHOOK_URL,
-                json=webhook_payload,
-                headers={'Content-Type': 'application/json'},
-                timeout=5  # 5 second timeout as specified
-            )
-            
-            # Check if webhook call succeeded (must be HTTP 200)
-            if response.status_code != 200:
-                print(f"[Webhook] ❌ Failed with status code: {response.status_code}")
-                print(f"[Webhook] Response: {response.text}")
+        if settings.LEAD_WEBHOOK_MODE == 'outbox':
+            # Durable outbox: persist the lead and let dispatch_outbox deliver it
+            try:
+                created = enqueue_lead(
+                    full_name, email, lead_data['phone_number'],
+                    profile=validate_career_profile(data.get('career_profile')),
+                )
+                print(f"[Outbox] {'Queued' if created else 'Already queued'} lead {email}")
+            except Exception as e:
+                print(f"[Outbox] ❌ Failed to queue lead: {str(e)}")
+                traceback.print_exc()
                 return Response(
                     {
                         "success": False,
@@ -151,11 +234,48 @@ class LeadCreateView(APIView):
                     },
                     status=status.HTTP_500_INTERNAL_SERVER_ERROR
                 )
+        else:
+            error_response = self.send_webhook(webhook_payload)
+            if error_response is not None:
+                return error_response
+        
+        # Send email asynchronously on the email worker pool
+        # API responds immediately without waiting for email
+        email_outcome = start_roadmap_email(email, full_name, lead_data['phone_number'])
+        
+        # Return success response only if webhook succeeded (or lead was queued)
+        body, status_code = accepted_lead_reply(email_outcome)
+        return Response(body, status=status_code)
+
+    def send_webhook(self, webhook_payload):
+        """
+        Send lead data to the Google Sheets webhook inline.
+        
+        Returns:
+            Response: Error response to return to the client, or None on success
+        """
+        try:
+            print(f"[Webhook] Sending lead data to Google Sheets...")
+            print(f"[Webhook] Payload: {webhook_payload}")
+            
+            send_to_sheets(webhook_payload)
             
             print(f"[Webhook] ✅ Successfully sent to Google Sheets")
+            return None
             
+        except WebhookError as e:
+            # Webhook call must succeed with HTTP 200
+            print(f"[Webhook] ❌ Failed with status code: {e.status_code}")
+            print(f"[Webhook] Response: {e.body}")
+            return Response(
+                {
+                    "success": False,
+                    "message": "Failed to submit lead"
+                },
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
         except requests.exceptions.Timeout:
-            print(f"[Webhook] ❌ Request timeout after 5 seconds")
+            print(f"[Webhook] ❌ Request timeout after {settings.GOOGLE_SHEETS_WEBHOOK_TIMEOUT} seconds")
             return Response(
                 {
                     "success": False,
@@ -183,40 +303,484 @@ class LeadCreateView(APIView):
                 },
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
+
+
+def db_to_async(func):
+    """
+    sync_to_async(func) for the async view's database and cache helpers.
+    
+    Runs on the event loop's thread pool (thread_sensitive=False) instead of
+    Django's single main sync thread, so concurrent submissions query the
+    database in parallel rather than queueing behind each other. Nothing here
+    relies on thread affinity; like a request thread, the pool thread drops
+    a broken or expired (DB_CONN_MAX_AGE) connection before and after the call.
+    """
+    def run(*args, **kwargs):
+        close_old_connections()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            close_old_connections()
+    return sync_to_async(run, thread_sensitive=False)
+
+
+@method_decorator(csrf_exempt, name='dispatch')
+class AsyncLeadCreateView(View):
+    """
+    Async version of LeadCreateView for the ASGI application (backend/asgi.py).
+    
+    POST /api/leads/async/
+    
+    Same request and response format (and Idempotency-Key handling) as
+    POST /api/leads/. Validation runs
+    inline, the webhook call goes through the per-event-loop httpx client and
+    database work runs on the event loop's thread pool (db_to_async()), so a
+    slow Apps Script response only parks a coroutine instead of a whole worker
+    thread, and concurrent outbox writes do not wait for each other.
+    """
+    
+    async def post(self, request):
+        try:
+            data = json.loads(request.body or b'{}')
+            if not isinstance(data, dict):
+                raise ValueError("Request body must be a JSON object")
+        except ValueError:
+            return JsonResponse(
+                {
+                    "success": False,
+                    "message": "Failed to submit lead"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
         
-        # Send email asynchronously in background thread
-        # API responds immediately without waiting for email
-        Thread(
-            target=send_roadmap_email_async,
-            args=(email, full_name, email)
-        ).start()
-        
-        # Return success response only if webhook succeeded
-        return Response(
-            {
-                "success": True,
-                "message": "Roadmap email sent"
-            },
-            status=status.HTTP_201_CREATED
+        key = request.headers.get(idempotency.HEADER)
+        if key is None:
+            return await self.create_lead(data)
+        
+        claim, reply = await db_to_async(idempotency.begin)(key, data)
+        if reply is not None:
+            status_code, body, headers = reply
+            return JsonResponse(body, status=status_code, headers=headers)
+        try:
+            response = await self.create_lead(data)
+        except BaseException:
+            await db_to_async(idempotency.release)(claim)
+            raise
+        await db_to_async(idempotency.finish)(claim, response.status_code, json.loads(response.content))
+        return response
+    
+    async def create_lead(self, data):
+        """Validate, store or forward the lead and queue the roadmap email."""
+        lead_data, errors = validate_lead(data)
+        if errors:
+            return JsonResponse(
+                {
+                    "success": False,
+                    "errors": errors,
+                    "message": "Failed to submit lead"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        if await db_to_async(is_known_duplicate)(lead_data['email']):
+            return JsonResponse(DUPLICATE_RESPONSE, status=status.HTTP_200_OK)
+        
+        if settings.LEAD_WEBHOOK_MODE == 'outbox':
+            try:
+                await db_to_async(enqueue_lead)(
+                    lead_data['full_name'], lead_data['email'], lead_data['phone_number'],
+                    profile=validate_career_profile(data.get('career_profile')),
+                )
+            except Exception as e:
+                print(f"[Outbox] ❌ Failed to queue lead: {str(e)}")
+                traceback.print_exc()
+                return JsonResponse(
+                    {
+                        "success": False,
+                        "message": "Failed to submit lead"
+                    },
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+        else:
+            try:
+                await send_to_sheets_async(lead_data)
+            except WebhookError as e:
+                print(f"[Webhook] ❌ Failed with status code: {e.status_code}")
+                return JsonResponse(
+                    {
+                        "success": False,
+                        "message": "Failed to submit lead"
+                    },
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+            except TIMEOUT_ERRORS:
+                print(f"[Webhook] ❌ Request timeout after {settings.GOOGLE_SHEETS_WEBHOOK_TIMEOUT} seconds")
+                return JsonResponse(
+                    {
+                        "success": False,
+                        "message": "Failed to submit lead"
+                    },
+                    status=status.HTTP_504_GATEWAY_TIMEOUT
+                )
+            except Exception as e:
+                print(f"[Webhook] ❌ Request failed: {str(e)}")
+                traceback.print_exc()
+                return JsonResponse(
+                    {
+                        "success": False,
+                        "message": "Failed to submit lead"
+                    },
+                    status=status.HTTP_500_INTERNAL_SERVER_ERROR
+                )
+        
+        # Never block the event loop waiting for a free email slot
+        email_outcome = await db_to_async(start_roadmap_email)(
+            lead_data['email'], lead_data['full_name'], lead_data['phone_number'], block=False
         )
+        
+        body, status_code = accepted_lead_reply(email_outcome)
+        return JsonResponse(body, status=status_code)
+
+
+class LeadBulkImportView(APIView):
+    """
+    Bulk lead import for partner lists (admin users only).
+    
+    POST /api/leads/import/
+    
+    Body, streamed and parsed incrementally (never loaded into memory at once),
+    with a Content-Length or chunked (Transfer-Encoding: chunked):
+    - Content-Type: application/x-ndjson - one lead object per line
+    - Content-Type: application/json - one JSON array of lead objects
+    
+    Each object uses the same fields and rules as POST /api/leads/. Valid rows
+    are written with bulk_create in chunks of LEAD_IMPORT_CHUNK_SIZE and queued
+    in the outbox (see leads/bulk_import.py).
+    
+    Response (streamed NDJSON, one line per input row, then a summary):
+    {"row": 1, "status": "created", "email": "a@example.com"}
+    {"row": 2, "status": "duplicate", "email": "b@example.com"}
+    {"row": 3, "status": "invalid", "errors": {"phone_number": ["..."]}}
+    {"summary": {"rows": 3, "created": 1, "duplicate": 1, "invalid": 1}}
+    
+    A malformed body stops the import with {"error": "..."} before the summary;
+    rows reported above it are already stored.
+    """
+    permission_classes = [IsAdminUser]
+    
+    def post(self, request):
+        parse = parser_for(request.content_type)
+        if parse is None:
+            return Response(
+                {"success": False, "message": "Use Content-Type application/x-ndjson or application/json"},
+                status=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE
+            )
+        # Content-Length is optional: large files are usually sent chunked
+        stream = open_body(request)
+        if stream is None:
+            return Response(
+                {"success": False, "message": "Request body is empty"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        def report():
+            for result in import_leads(parse(stream)):
+                yield json.dumps(result) + '\n'
+            print(f"[Import] {result['summary']}")
+        
+        return StreamingHttpResponse(report(), content_type='application/x-ndjson')
+
+
+class LeadListView(APIView):
+    """
+    Keyset-paginated lead listing, newest first (admin users only).
+    
+    GET /api/leads/list/?limit=50&cursor=...
+    
+    Pages seek on the (created_at, email) index instead of using OFFSET, so
+    every page costs the same as the first one.
+    
+    Response:
+    {
+        "results": [{"email", "full_name", "phone_number", "created_at", "sheets_status"}, ...],
+        "next_cursor": "..." or null when there are no more rows
+    }
+    """
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get('limit', settings.LEAD_LIST_PAGE_SIZE))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= settings.LEAD_LIST_MAX_PAGE_SIZE:
+            return Response(
+                {"success": False, "message": f"limit must be between 1 and {settings.LEAD_LIST_MAX_PAGE_SIZE}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        queryset = Lead.objects.order_by('-created_at', '-email')
+        cursor = request.query_params.get('cursor')
+        if cursor:
+            try:
+                queryset = queryset.filter(before_q(*decode_cursor(cursor)))
+            except InvalidCursor as e:
+                return Response({"success": False, "message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        # One extra row tells whether another page exists
+        leads = list(queryset.only(
+            'email', 'full_name', 'phone_number', 'created_at', 'sheets_status'
+        )[:limit + 1])
+        has_more = len(leads) > limit
+        leads = leads[:limit]
+        
+        return Response({
+            "results": [
+                {
+                    "email": lead.email,
+                    "full_name": lead.full_name,
+                    "phone_number": lead.phone_number,
+                    "created_at": lead.created_at.isoformat(),
+                    "sheets_status": lead.sheets_status,
+                }
+                for lead in leads
+            ],
+            "next_cursor": lead_cursor(leads[-1]) if has_more else None,
+        })
+
+
+class LeadSearchView(APIView):
+    """
+    Lead search (admin users only).
+    
+    GET /api/leads/search/?q=...&limit=20
+    
+    - q containing "@": email prefix
+    - q made of digits (optionally +91 / spaces): phone number prefix
+    - anything else: every word must prefix-match a word of the name
+      (single words also match email prefixes)
+    
+    All branches use indexes (see leads/search.py). Results are newest first.
+    
+    Response:
+    {"results": [{"email", "full_name", "phone_number", "created_at", "sheets_status"}, ...], "took_ms": 3.2}
+    """
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request):
+        query = request.query_params.get('q', '')
+        try:
+            limit = int(request.query_params.get('limit', 20))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= 100:
+            return Response(
+                {"success": False, "message": "limit must be between 1 and 100"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        started = time.perf_counter()
+        leads = search_leads(query, limit)
+        took_ms = (time.perf_counter() - started) * 1000
+        
+        return Response({
+            "results": [
+                {
+                    "email": lead.email,
+                    "full_name": lead.full_name,
+                    "phone_number": lead.phone_number,
+                    "created_at": lead.created_at.isoformat(),
+                    "sheets_status": lead.sheets_status,
+                }
+                for lead in leads
+            ],
+            "took_ms": round(took_ms, 1),
+        })
+
+
+class RoiCalculateView(APIView):
+    """
+    Server-side ROI calculation (same results as calculateSalary() in the browser).
+    
+    POST /api/roi/
+    
+    Request body:
+    {
+        "user_type": "fresher" | "experienced",
+        "skills": ["ga4", "fb ads", ...],
+        "has_full_stack": true,
+        "current_salary": 8.5  (experienced only, in LPA)
+    }
+    (userType / hasFullStack / currentSalary are accepted too)
+    
+    Response:
+    {
+        "success": true,
+        "result": {"before", "after", "uplift", "detectedPillars", "skillsAdded", "explanation"}
+    }
+    """
+    
+    def post(self, request):
+        profile, errors = validate_profile(request.data)
+        if errors:
+            return Response(
+                {
+                    "success": False,
+                    "errors": errors,
+                    "message": "Invalid ROI profile"
+                },
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response({"success": True, "result": score_profile_cached(profile)})
+
+
+class RoiBatchView(APIView):
+    """
+    Batch ROI calculation for analytics (admin users only).
+    
+    POST /api/roi/batch/
+    
+    Request body: {"profiles": [<profile as for POST /api/roi/>, ...]} or a bare
+    JSON array of profiles, at most ROI_BATCH_MAX_PROFILES per call.
+    
+    Response:
+    {
+        "success": true,
+        "count": 2,
+        "results": [{"result": {...}}, {"errors": {"user_type": [...]}}],
+        "took_ms": 41.7
+    }
+    Results are in request order; an invalid profile does not fail the batch.
+    """
+    permission_classes = [IsAdminUser]
+    
+    def post(self, request):
+        profiles = request.data.get('profiles') if isinstance(request.data, dict) else request.data
+        if not isinstance(profiles, list):
+            return Response(
+                {"success": False, "message": "Send {\"profiles\": [...]} or a JSON array of profiles"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if len(profiles) > settings.ROI_BATCH_MAX_PROFILES:
+            return Response(
+                {"success": False, "message": f"At most {settings.ROI_BATCH_MAX_PROFILES} profiles per batch"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        
+        started = time.perf_counter()
+        results = []
+        valid = []
+        for data in profiles:
+            profile, errors = validate_profile(data)
+            results.append({"errors": errors})
+            if not errors:
+                valid.append((len(results) - 1, profile))
+        scored = score_profiles_cached([profile for _, profile in valid])
+        for (index, _), result in zip(valid, scored):
+            results[index] = {"result": result}
+        took_ms = (time.perf_counter() - started) * 1000
+        print(f"[ROI] Scored {len(results)} profile(s) in {took_ms:.1f} ms")
+        
+        return Response({
+            "success": True,
+            "count": len(results),
+            "results": results,
+            "took_ms": round(took_ms, 1),
+        })
+
+
+class LeadExportView(APIView):
+    """
+    Streaming export of the leads table (admin users only).
+    
+    GET /api/leads/export/?output=csv|ndjson&created_from=...&created_to=...&after=...
+    
+    - output: csv (default) or ndjson
+    - created_from / created_to: ISO date or datetime; created_from is inclusive,
+      created_to is exclusive (a plain date includes that whole day)
+    - after: `cursor` value of the last row received, to resume an export
+    
+    Rows are streamed in (created_at, email) order, so memory use does not
+    depend on table size (see leads/export.py).
+    """
+    permission_classes = [IsAdminUser]
+    
+    def get(self, request):
+        params = request.query_params
+        output = params.get('output', 'csv')
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {"success": False, "message": f"output must be one of {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        try:
+            created_from = parse_bound(params.get('created_from'))
+            created_to = parse_bound(params.get('created_to'), end=True)
+            after = params.get('after') or None
+            if after:
+                decode_cursor(after)
+        except ValueError as e:  # includes InvalidCursor
+            return Response({"success": False, "message": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        
+        leads = iter_leads(created_from, created_to, after)
+        content_type = 'text/csv' if output == 'csv' else 'application/x-ndjson'
+        response = StreamingHttpResponse(stream_export(output, leads), content_type=content_type)
+        response['Content-Disposition'] = f'attachment; filename="leads.{output}"'
+        return response
+
+
+class LeadMetricsView(APIView):
+    """
+    Operational metrics for lead ingestion (admin users only).
+    
+    GET /api/leads/metrics/
+    
+    Response:
+    {
+        "outbox": {"pending": 0, "failed": 0, "oldest_pending_seconds": 0},
+        "http": {"https://script.google.com:443": {"connections": 1, "requests": 20, "reused": 19, ...}},
+        "email": {"queued": 0, "in_flight": 0, "sent": 0, "failed": 0, "rejected": 0, ...},
+        "smtp": {"opened": 1, "reused": 42, "discarded": 0, "idle": 1, "max_connections": 4},
+        "pdf_cache": {"loads": 1, "hits": 42, "cached_bytes": 5446010},
+        "dedupe": {"checks": 120, "lru_hits": 30, "hit_rate": 0.25, "false_positive_rate": 0.0, ...},
+        "roi_skill_cache": {"hits": 950, "misses": 50, "size": 50, "max_size": 10000, "hit_rate": 0.95},
+        "roi_result_cache": {"hits": 800, "misses": 200, "errors": 0, "hit_rate": 0.8, "ttl": 3600, ...}
+    }
+    """
+    permission_classes = [IsAdminUser]
     
+    def get(self, request):
+        return Response({
+            "outbox": outbox_stats(),
+            "http": connection_stats(),
+            "email": get_email_dispatcher().stats(),
+            "smtp": smtp_pool_stats(),
+            "pdf_cache": ROADMAP_PDF.stats(),
+            "dedupe": dedupe_stats(),
+            "roi_skill_cache": skill_cache_stats(),
+            "roi_result_cache": result_cache_stats(),
+        })
+    
+
 
 def send_roadmap_email_async(email_address, full_name, lead_email):
     """
     Asynchronous function to send roadmap email in background thread.
     
-    This function runs in a separate thread and does NOT block the API response.
-    All errors are logged but do not affect the API response.
+    This function runs on the email worker pool (leads/mailer.py) and does NOT
+    block the API response. All errors are logged but do not affect the API response.
     
     Args:
         email_address: Email address to send to (same as lead_email, kept for compatibility)
         full_name: Full name of the lead
         lead_email: Email address (primary key, used for logging)
+    
+    Returns:
+        bool: True if the email was sent, False otherwise
     """
-    # Close any existing database connections before starting thread
-    # This is important for Django threads
-    from django.db import connections
-    connections.close_all()
+    # Worker threads keep their database connection between emails (like request
+    # threads do with CONN_MAX_AGE); only drop it if it is broken or too old
+    close_old_connections()
     
     try:
         # Verify email configuration with detailed logging
@@ -232,161 +796,21 @@ def send_roadmap_email_async(email_address, full_name, lead_email):
             error_msg = f"[Email Thread] ❌ Error for email {lead_email}: Email credentials not configured"
             print(error_msg)
             print(f"[Email Thread] Please set EMAIL_HOST_USER and EMAIL_HOST_PASSWORD environment variables")
-            return
+            return False
         
-        # Path to static PDF file
-        # BASE_DIR points to backend/ directory, so we go: leads/assets/FSM_Roadmap.pdf
-        pdf_path = os.path.join(settings.BASE_DIR, "leads", "assets", "FSM_Roadmap.pdf")
-
+        # Build the message; the PDF part comes from the in-memory attachment
+        # cache (leads/attachments.py), so no per-email disk read or base64 encode
+        pdf_path = ROADMAP_PDF_PATH
+        email = build_roadmap_email(email_address, full_name)
         
-        # Verify PDF file exists
-        if not os.path.exists(pdf_path):
+        # Verify the PDF was attached (it is missing or unreadable otherwise)
+        if not email.attachments:
             error_msg = f"[Email Thread] Error for email {lead_email}: PDF not found at {pdf_path}"
             print(error_msg)
             print(f"[Email Thread] BASE_DIR: {settings.BASE_DIR}")
             print(f"[Email Thread] Checking if directory exists: {os.path.dirname(pdf_path)}")
             print(f"[Email Thread] Directory exists: {os.path.exists(os.path.dirname(pdf_path))}")
-            return
-        
-        # HTML email template
-        html_email_body = f"""<!DOCTYPE html>
-<html lang="en" style="margin:0;padding:0;">
-<head>
-  <meta charset="UTF-8" />
-  <meta name="viewport" content="width=device-width" />
-  <title>Digital Maven — Full Stack Marketing Career Roadmap</title>
-  <style>
-    body,table,td,a {{ -webkit-text-size-adjust:100%; -ms-text-size-adjust:100%; }}
-    table,td {{ mso-table-lspace:0pt; mso-table-rspace:0pt; border-collapse:collapse; }}
-    img {{ -ms-interpolation-mode:bicubic; border:0; outline:none; text-decoration:none; display:block; }}
-    body {{ margin:0; padding:0; width:100% !important; height:100% !important; background:#f5f7fb; }}
-    .w-600{{width:600px;max-width:600px;}}
-    .px-24{{padding-left:24px;padding-right:24px;}}
-    .py-16{{padding-top:16px;padding-bottom:16px;}}
-    .py-24{{padding-top:24px;padding-bottom:24px;}}
-    .small{{font-size:13px;color:#4a5568;}}
-    .shadow{{box-shadow:0 6px 24px rgba(0,0,0,.08);}}
-    .center{{text-align:center;}}
-    .lead{{font-size:16px;line-height:1.6;color:#0f172a;}}
-    .h1{{font-size:24px;line-height:1.25;margin:0;color:#0f172a;font-weight:800;}}
-    .tag{{display:inline-block;background:#003F88;color:#fff;font-weight:700;font-size:12px;letter-spacing:.6px;padding:6px 10px;border-radius:999px;}}
-    .hero{{
-      background: linear-gradient(135deg, #003F88 0%, #1a5db8 50%, #F77F00 120%);
-      text-align:center;
-      padding:18px 24px;
-    }}
-    @media screen and (max-width:620px){{
-      .w-600{{width:100%!important;max-width:100%!important;}}
-      .px-24{{padding-left:16px!important;padding-right:16px!important;}}
-      .h1{{font-size:22px!important;}}
-    }}
-  </style>
-</head>
-<body>
-  <table role="presentation" width="100%" cellpadding="0" cellspacing="0">
-    <tr>
-      <td align="center" style="padding:24px;">
-        <table role="presentation" class="w-600 shadow" cellpadding="0" cellspacing="0" style="background:#ffffff;border-radius:16px;overflow:hidden;">
-          <!-- HERO: LOGO ONLY -->
-          <tr>
-            <td class="hero">
-              <img src="https://drive.google.com/thumbnail?id=1Kki4IFKVM2-ukPrfkgo6Yv_eYNqn13RJ&sz=w1000" alt="Digital Maven" width="140" style="margin:auto;height:auto;">
-            </td>
-          </tr>
-          <!-- HEADLINE -->
-          <tr>
-            <td class="px-24 py-24 center">
-              <div style="height:10px;"></div>
-              <h1 class="h1">Your Full Stack Marketing Career Roadmap</h1>
-            </td>
-          </tr>
-          <!-- BODY -->
-          <tr>
-            <td class="px-24 py-24">
-              <p class="lead" style="margin:0 0 12px 0;">Hi {full_name},</p>
-              <p class="lead" style="margin:0 0 12px 0;">
-                Thank you for using the Career ROI tool.
-              </p>
-              <p class="lead" style="margin:0 0 12px 0;">
-                Based on your skills and experience, we've prepared a <strong>Full Stack Marketing Career Roadmap</strong> to help you understand how to grow toward higher-impact roles and stronger salary outcomes.
-              </p>
-              <p class="lead" style="margin:0 0 8px 0;">This roadmap covers:</p>
-              <ul class="lead" style="margin:0 0 12px 18px;padding:0;">
-                <li>Core marketing foundations and strategy</li>
-                <li>Growth, performance, and analytics skills</li>
-                <li>AI and MarTech capabilities shaping modern marketing</li>
-                <li>A structured path to becoming a full-stack marketing professional</li>
-              </ul>
-              <p class="lead" style="margin:0 0 12px 0;">
-                You'll find the roadmap attached to this email as a PDF.
-              </p>
-              <p class="lead" style="margin:0 0 12px 0;">
-                Take your time to go through it and use it as a reference to plan your next career moves.
-              </p>
-              <p class="lead" style="margin:0;">
-                Wishing you clarity and growth ahead,<br>
-                <strong>Team Digital Maven</strong>
-              </p>
-            </td>
-          </tr>
-          <!-- FOOTER -->
-          <tr>
-            <td class="px-24 py-16" style="background:#f0f4fb;border-top:1px solid #e6ebf5;">
-              <div class="small" style="text-align:center;color:#0f172a;">
-                Digital Maven &amp; MIT
-              </div>
-              <div class="small" style="margin-top:6px;text-align:center;">
-                © 2025 Digital Maven
-              </div>
-            </td>
-          </tr>
-        </table>
-      </td>
-    </tr>
-  </table>
-</body>
-</html>"""
-
-        # Plain text fallback
-        plain_text_body = f"""Hi {full_name},
-
-Thank you for using the Career ROI tool.
-
-Based on your skills and experience, we've prepared a Full Stack Marketing Career Roadmap to help you understand how to grow toward higher-impact roles and stronger salary outcomes.
-
-This roadmap covers:
-• Core marketing foundations and strategy
-• Growth, performance, and analytics skills
-• AI and MarTech capabilities shaping modern marketing
-• A structured path to becoming a full-stack marketing professional
-
-You'll find the roadmap attached to this email as a PDF.
-
-Take your time to go through it and use it as a reference to plan your next career moves.
-
-Wishing you clarity and growth ahead,
-Team Digital Maven
-
-Digital Maven & MIT"""
-
-        # Create email message with HTML content
-        email = EmailMultiAlternatives(
-            subject="Your Personalized Full Stack Marketing Career Roadmap",
-            body=plain_text_body,
-            from_email=settings.EMAIL_FROM_ADDRESS,
-            to=[email_address],
-        )
-        email.attach_alternative(html_email_body, "text/html")
-        
-        # Attach static PDF file (same file for all leads)
-        try:
-            print(f"[Email Thread] Attaching PDF from: {pdf_path}")
-            email.attach_file(pdf_path)
-            print(f"[Email Thread] PDF attached successfully")
-        except Exception as pdf_error:
-            print(f"[Email Thread] ⚠️ Warning: Failed to attach PDF: {str(pdf_error)}")
-            print(f"[Email Thread] Continuing without PDF attachment...")
-            # Continue without PDF - email will still be sent
+            return False
         
         # Send email with detailed logging
         print(f"[Email Thread] Attempting to send email to {email_address}...")
@@ -395,27 +819,20 @@ Digital Maven & MIT"""
         print(f"[Email Thread] SMTP Port: {settings.EMAIL_PORT}")
         print(f"[Email Thread] Use TLS: {settings.EMAIL_USE_TLS}")
         print(f"[Email Thread] PDF path: {pdf_path}")
-        print(f"[Email Thread] PDF exists: {os.path.exists(pdf_path)}")
         
-        # Test SMTP connection before sending
-        try:
-            import smtplib
-            print(f"[Email Thread] Testing SMTP connection...")
-            server = smtplib.SMTP(settings.EMAIL_HOST, settings.EMAIL_PORT, timeout=10)
-            if settings.EMAIL_USE_TLS:
-                server.starttls()
-            server.login(settings.EMAIL_HOST_USER, settings.EMAIL_HOST_PASSWORD)
-            server.quit()
-            print(f"[Email Thread] ✅ SMTP connection test successful")
-        except Exception as smtp_test_error:
-            print(f"[Email Thread] ❌ SMTP connection test failed: {str(smtp_test_error)}")
-            print(f"[Email Thread] Error type: {type(smtp_test_error).__name__}")
-            raise  # Re-raise to be caught by outer exception handler
-        
-        # Send email
+        # Send email (EMAIL_BACKEND reuses a pooled, already authenticated SMTP connection)
         print(f"[Email Thread] Sending email now...")
         email.send(fail_silently=False)  # Don't fail silently - we want to see errors
         print(f"[Email Thread] ✅ Email sent successfully to {email_address}")
+        remember_lead(lead_email)
+        if settings.LEAD_WEBHOOK_MODE == 'outbox':
+            # The lead row exists in outbox mode; record the send so the bulk
+            # sender (send_roadmaps) does not mail this lead again
+            try:
+                mark_roadmap_sent([lead_email])
+            except Exception as db_error:
+                print(f"[Email Thread] ⚠️ Warning: Could not record send for {lead_email}: {str(db_error)}")
+        return True
         
     except Exception as e:
         # Log error but do NOT raise - this runs in background thread
@@ -444,4 +861,5 @@ Digital Maven & MIT"""
                 f.write(f"Traceback:\n{error_details}\n")
         except Exception as log_err:
             print(f"[Email Thread] Failed to write error log: {str(log_err)}")
-
+        
+        return False
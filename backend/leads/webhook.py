@@ -0,0 +1,136 @@
+"""
+Google Sheets webhook client.
+
+Single place that knows how to deliver lead payloads to the Apps Script
+endpoint, shared by the inline request path and the outbox dispatcher.
+Requests go through the pooled keep-alive session from leads/http.py.
+"""
+import requests
+from asgiref.sync import sync_to_async
+from django.conf import settings
+
+from .http import HTTPX_AVAILABLE, get_async_client, get_session
+
+if HTTPX_AVAILABLE:
+    import httpx
+
+# Exceptions raised by either client when the webhook does not answer in time
+TIMEOUT_ERRORS = (requests.exceptions.Timeout,) + ((httpx.TimeoutException,) if HTTPX_AVAILABLE else ())
+
+
+class WebhookError(Exception):
+    """Raised when the Google Sheets webhook does not answer with HTTP 200."""
+
+    def __init__(self, status_code, body=''):
+        super().__init__(f"Webhook returned HTTP {status_code}")
+        self.status_code = status_code
+        self.body = body
+
+
+def send_to_sheets(payload, timeout=None):
+    """
+    POST a lead payload to the Google Sheets webhook.
+
+    Args:
+        payload: Lead payload (full_name, email, phone_number), or a list of them
+        timeout: Request timeout in seconds (defaults to GOOGLE_SHEETS_WEBHOOK_TIMEOUT)
+
+    Returns:
+        requests.Response: The webhook response (always HTTP 200)
+
+    Raises:
+        WebhookError: If the webhook answers with anything other than HTTP 200
+        requests.exceptions.RequestException: On timeouts and connection errors
+    """
+    if timeout is None:
+        timeout = settings.GOOGLE_SHEETS_WEBHOOK_TIMEOUT
+
+    response = get_session().post(
+        settings.GOOGLE_SHEETS_WEBHOOK_URL,
+        json=payload,
+        headers={'Content-Type': 'application/json'},
+        timeout=timeout
+    )
+
+    if response.status_code != 200:
+        raise WebhookError(response.status_code, response.text)
+
+    return response
+
+
+async def send_to_sheets_async(payload, timeout=None):
+    """
+    Async version of send_to_sheets() for the ASGI lead endpoint.
+
+    Uses the per-event-loop httpx client so the call never blocks the loop.
+    Without httpx it falls back to send_to_sheets() on a worker thread.
+
+    Raises:
+        WebhookError: If the webhook answers with anything other than HTTP 200
+        httpx.HTTPError: On timeouts and connection errors
+    """
+    if timeout is None:
+        timeout = settings.GOOGLE_SHEETS_WEBHOOK_TIMEOUT
+
+    if not HTTPX_AVAILABLE:
+        return await sync_to_async(send_to_sheets, thread_sensitive=False)(payload, timeout)
+
+    response = await get_async_client().post(
+        settings.GOOGLE_SHEETS_WEBHOOK_URL,
+        json=payload,
+        headers={'Content-Type': 'application/json'},
+        timeout=timeout
+    )
+
+    if response.status_code != 200:
+        raise WebhookError(response.status_code, response.text)
+
+    return response
+
+
+def send_batch_to_sheets(payloads, timeout=None):
+    """
+    POST several lead payloads to the Google Sheets webhook as one JSON array.
+
+    The Apps Script may report per-row outcomes by answering with
+    {"results": [{"ok": true}, {"ok": false, "error": "..."}, ...]} in the same
+    order as the request. A plain HTTP 200 without per-row results means every
+    row was accepted; "results" that is not a list with one entry per row
+    cannot be matched to the rows, so every row is reported as failed (and
+    retried by the outbox).
+
+    Args:
+        payloads: List of lead payloads (full_name, email, phone_number)
+        timeout: Request timeout in seconds (defaults to GOOGLE_SHEETS_WEBHOOK_TIMEOUT)
+
+    Returns:
+        list[tuple]: (ok, error) for each payload, in request order
+
+    Raises:
+        WebhookError: If the webhook answers with anything other than HTTP 200
+        requests.exceptions.RequestException: On timeouts and connection errors
+    """
+    response = send_to_sheets(payloads, timeout=timeout)
+
+    try:
+        results = response.json().get('results')
+    except (ValueError, AttributeError):
+        results = None
+
+    if results is None:
+        return [(True, '') for _ in payloads]
+    if not isinstance(results, list) or len(results) != len(payloads):
+        if isinstance(results, list):
+            error = f"Webhook returned {len(results)} result(s) for {len(payloads)} rows"
+        else:
+            error = "Webhook returned malformed per-row results"
+        return [(False, error) for _ in payloads]
+
+    outcomes = []
+    for row in results:
+        if isinstance(row, dict) and row.get('ok', False):
+            outcomes.append((True, ''))
+        else:
+            error = row.get('error', 'Rejected by webhook') if isinstance(row, dict) else 'Rejected by webhook'
+            outcomes.append((False, error))
+    return outcomes
@@ -4,6 +4,14 @@ import './LeadCaptureModal.css'
 // Get API base URL from environment variable
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://127.0.0.1:8000'
 
+// Unique key for one lead submission, sent as the Idempotency-Key header
+const newIdempotencyKey = () => {
+  if (window.crypto && typeof window.crypto.randomUUID === 'function') {
+    return window.crypto.randomUUID()
+  }
+  return `${Date.now().toString(36)}-${Math.random().toString(36).slice(2)}${Math.random().toString(36).slice(2)}`
+}
+
 const LeadCaptureModal = ({ isOpen, onClose, careerProfile }) => {
   const [formData, setFormData] = useState({
     name: '',
@@ -13,6 +21,8 @@ const LeadCaptureModal = ({ isOpen, onClose, careerProfile }) => {
   const [errors, setErrors] = useState({})
   const [isSubmitting, setIsSubmitting] = useState(false)
   const modalRef = useRef(null)
+  // { body, key } of the last submission; retrying the same details reuses its key
+  const submissionRef = useRef(null)
 
   // Handle ESC key to close modal
   useEffect(() => {
@@ -43,6 +53,7 @@ const LeadCaptureModal = ({ isOpen, onClose, careerProfile }) => {
       setFormData({ name: '', email: '', phone: '' })
       setErrors({})
       setIsSubmitting(false)
+      submissionRef.current = null
     }
   }, [isOpen])
 
@@ -169,7 +180,16 @@ const LeadCaptureModal = ({ isOpen, onClose, careerProfile }) => {
       const payload = {
         name: formData.name.trim(),
         email: formData.email.trim().toLowerCase(),
-        phone: formattedPhone
+        phone: formattedPhone,
+        // Stored with the lead so its ROI can be rescored server-side
+        career_profile: careerProfile || null,
+      }
+
+      // Retries of the same details keep their Idempotency-Key, so the backend
+      // replays the first successful response instead of submitting twice
+      const body = JSON.stringify(payload)
+      if (!submissionRef.current || submissionRef.current.body !== body) {
+        submissionRef.current = { body, key: newIdempotencyKey() }
       }
 
       // Make API call to Django backend
@@ -178,8 +198,9 @@ const LeadCaptureModal = ({ isOpen, onClose, careerProfile }) => {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
+          'Idempotency-Key': submissionRef.current.key,
         },
-        body: JSON.stringify(payload),
+        body,
       })
 
       const data = await response.json()
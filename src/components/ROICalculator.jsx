@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useRef } from 'react'
-import { calculateSalary } from '../utils/salaryEngine'
+import { createROIEngineClient, isCancelled } from '../utils/roiEngineClient'
 import { animateCountUp } from '../utils/countUp'
 import CareerPath from './CareerPath'
 import TagInput from './TagInput'
@@ -36,36 +36,57 @@ const ROICalculator = () => {
   const afterAvgRef = useRef(null)
   const upliftRef = useRef(null)
 
-  // Calculate results only when Calculate ROI is clicked
-  const handleCalculateROI = () => {
-    if (!userType) return
+  // ROI engine (Web Worker), with one incremental skills list per user type
+  const engineRef = useRef(null)
 
-    // Get skills based on user type
-    const skills = userType === 'fresher' ? fresherSkills : experiencedSkills
-    
-    // For experienced users, we need current salary from input
-    let salaryValue = 0
-    if (userType === 'experienced') {
-      salaryValue = parseFloat(currentSalary) || 0
+  useEffect(() => {
+    const engine = createROIEngineClient()
+    engine.setSkills('fresher', fresherSkills).catch(handleEngineError)
+    engine.setSkills('experienced', experiencedSkills).catch(handleEngineError)
+    engineRef.current = engine
+
+    return () => {
+      engine.terminate()
+      engineRef.current = null
     }
+    // Skills lists are kept in step by the TagInput callbacks from here on
+    // eslint-disable-next-line react-hooks/exhaustive-deps
+  }, [])
 
-    const calculation = calculateSalary({
+  const calculateResults = () => {
+    return engineRef.current.calculate({
+      list: userType,
       userType,
-      skills,
       hasFullStack: programCompleted,
-      currentSalary: salaryValue
+      // For experienced users, we need current salary from input
+      currentSalary: userType === 'experienced' ? parseFloat(currentSalary) || 0 : 0
     })
+  }
 
-    setResults(calculation)
-    setShowResults(true)
-    
-    // Scroll to results
-    setTimeout(() => {
-      const resultsElement = document.querySelector('.results-card')
-      if (resultsElement) {
-        resultsElement.scrollIntoView({ behavior: 'smooth', block: 'start' })
-      }
-    }, 100)
+  const handleEngineError = (error) => {
+    if (!isCancelled(error)) {
+      console.error('ROI engine request failed:', error)
+    }
+  }
+
+  // Calculate results only when Calculate ROI is clicked
+  const handleCalculateROI = () => {
+    if (!userType || !engineRef.current) return
+
+    calculateResults()
+      .then((calculation) => {
+        setResults(calculation)
+        setShowResults(true)
+
+        // Scroll to results
+        setTimeout(() => {
+          const resultsElement = document.querySelector('.results-card')
+          if (resultsElement) {
+            resultsElement.scrollIntoView({ behavior: 'smooth', block: 'start' })
+          }
+        }, 100)
+      })
+      .catch(handleEngineError)
   }
 
   // Show hints if user has filled some data but not all (but don't calculate)
@@ -94,24 +115,8 @@ const ROICalculator = () => {
   // Recalculate when Full Stack toggle changes (if results are already shown)
   useEffect(() => {
     // Only recalculate if results are already shown (user has clicked Calculate ROI)
-    if (showResults && userType) {
-      // Get skills based on user type
-      const skills = userType === 'fresher' ? fresherSkills : experiencedSkills
-      
-      // For experienced users, we need current salary from input
-      let salaryValue = 0
-      if (userType === 'experienced') {
-        salaryValue = parseFloat(currentSalary) || 0
-      }
-
-      const calculation = calculateSalary({
-        userType,
-        skills,
-        hasFullStack: programCompleted,
-        currentSalary: salaryValue
-      })
-
-      setResults(calculation)
+    if (showResults && userType && engineRef.current) {
+      calculateResults().then(setResults).catch(handleEngineError)
     }
     // Only recalculate when toggle changes, not when skills change
     // eslint-disable-next-line react-hooks/exhaustive-deps
@@ -152,6 +157,11 @@ const ROICalculator = () => {
     setCurrentRole('')
     setCurrentSalary('')
     setExperiencedSkills([])
+    if (engineRef.current) {
+      engineRef.current.cancelAll()
+      engineRef.current.setSkills('fresher', []).catch(handleEngineError)
+      engineRef.current.setSkills('experienced', []).catch(handleEngineError)
+    }
     setProgramCompleted(false)
     setResults(null)
     setShowHints(false)
@@ -248,6 +258,8 @@ const ROICalculator = () => {
               <TagInput
                 tags={fresherSkills}
                 onTagsChange={setFresherSkills}
+                onTagAdd={(skill) => engineRef.current?.addSkill('fresher', skill).catch(handleEngineError)}
+                onTagRemove={(index) => engineRef.current?.removeSkill('fresher', index).catch(handleEngineError)}
                 placeholder="e.g. SEO, Google Analytics, Paid Ads, Excel, ChatGPT"
                 maxTags={50}
               />
@@ -392,6 +404,8 @@ const ROICalculator = () => {
               <TagInput
                 tags={experiencedSkills}
                 onTagsChange={setExperiencedSkills}
+                onTagAdd={(skill) => engineRef.current?.addSkill('experienced', skill).catch(handleEngineError)}
+                onTagRemove={(index) => engineRef.current?.removeSkill('experienced', index).catch(handleEngineError)}
                 placeholder="e.g. SEO, Google Analytics, Paid Ads, Excel, ChatGPT"
                 maxTags={50}
               />
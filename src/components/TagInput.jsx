@@ -1,25 +1,41 @@
 import React, { useState, useRef } from 'react'
 import './TagInput.css'
 
-const TagInput = ({ tags, onTagsChange, placeholder, maxTags = 15 }) => {
+const TagInput = ({ tags, onTagsChange, onTagAdd, onTagRemove, placeholder, maxTags = 15 }) => {
   const [inputValue, setInputValue] = useState('')
   const inputRef = useRef(null)
 
-  const addTag = (value) => {
-    const trimmedValue = value.trim()
-    
-    // Validation rules
-    if (!trimmedValue) return // No empty tags
-    if (tags.length >= maxTags) return // Max tags limit
-    if (tags.some(tag => tag.toLowerCase() === trimmedValue.toLowerCase())) {
-      return // Prevent duplicates (case-insensitive)
+  // onTagAdd / onTagRemove (optional) report each edit, so a parent can
+  // update derived state incrementally instead of reprocessing every tag
+  const addTags = (values) => {
+    const nextTags = [...tags]
+
+    values.forEach(value => {
+      const trimmedValue = value.trim()
+
+      // Validation rules
+      if (!trimmedValue) return // No empty tags
+      if (nextTags.length >= maxTags) return // Max tags limit
+      if (nextTags.some(tag => tag.toLowerCase() === trimmedValue.toLowerCase())) {
+        return // Prevent duplicates (case-insensitive)
+      }
+
+      nextTags.push(trimmedValue)
+      if (onTagAdd) onTagAdd(trimmedValue)
+    })
+
+    if (nextTags.length !== tags.length) {
+      onTagsChange(nextTags)
+      setInputValue('')
     }
+  }
 
-    onTagsChange([...tags, trimmedValue])
-    setInputValue('')
+  const addTag = (value) => {
+    addTags([value])
   }
 
   const removeTag = (indexToRemove) => {
+    if (onTagRemove) onTagRemove(indexToRemove)
     onTagsChange(tags.filter((_, index) => index !== indexToRemove))
   }
 
@@ -37,6 +53,15 @@ const TagInput = ({ tags, onTagsChange, placeholder, maxTags = 15 }) => {
     setInputValue(e.target.value)
   }
 
+  // Pasting a comma or newline separated list adds every skill at once
+  const handlePaste = (e) => {
+    const text = e.clipboardData.getData('text')
+    if (!/[,\n]/.test(text)) return
+
+    e.preventDefault()
+    addTags(text.split(/[,\n]/))
+  }
+
   return (
     <div className="tag-input-container">
       <div className="tag-input-wrapper">
@@ -61,6 +86,7 @@ const TagInput = ({ tags, onTagsChange, placeholder, maxTags = 15 }) => {
             value={inputValue}
             onChange={handleInputChange}
             onKeyDown={handleKeyDown}
+            onPaste={handlePaste}
             placeholder={tags.length === 0 ? placeholder : ''}
             maxLength={50}
           />
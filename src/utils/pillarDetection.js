@@ -101,6 +101,25 @@ function matchSkillToPillar(userSkill, pillarSkills) {
   return false;
 }
 
+/**
+ * Get every pillar a single skill matches, in pillar order
+ * detectPillars assigns the skill to the first of these not yet detected
+ * 
+ * @param {string} userSkill - Normalized user skill
+ * @returns {string[]} Matching pillar keys
+ */
+export function getSkillPillars(userSkill) {
+  if (!userSkill || typeof userSkill !== 'string') {
+    return [];
+  }
+  
+  const normalizedSkill = userSkill.toLowerCase().trim();
+  
+  return Object.entries(PILLAR_DEFINITIONS)
+    .filter(([, pillarDef]) => matchSkillToPillar(normalizedSkill, pillarDef.skills))
+    .map(([pillarKey]) => pillarKey);
+}
+
 /**
  * Detect which pillars a user has based on their skills
  * Each skill maps to only ONE pillar (first match wins)
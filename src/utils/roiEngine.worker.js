@@ -0,0 +1,125 @@
+/**
+ * ROI Engine Worker
+ *
+ * Runs skill matching and salary calculation off the UI thread, so large
+ * skill lists never compete with the count-up animation for frames.
+ * Loaded by roiEngineClient.js as a module worker; the client imports the
+ * same handler directly when Web Workers are not available.
+ *
+ * Messages in:  { id, type, payload }
+ * Messages out: { id, result } | { id, error } | { id, cancelled: true }
+ *
+ * Types:
+ * - setSkills   { list, skills }       -> number of skills
+ * - addSkill    { list, skill }        -> number of skills
+ * - removeSkill { list, index }        -> number of skills
+ * - calculate   { list, userType, hasFullStack, currentSalary } -> salary result
+ * - batch       { profiles }           -> salary result per calculateSalary() params
+ * - cancel      { id }                 -> stops a running batch
+ *
+ * A "list" names one incremental skills list (e.g. 'fresher'), kept in an
+ * ROIEngineState between messages.
+ */
+
+import { calculateSalary } from './salaryEngine'
+import { createEngineState } from './roiEngineState'
+
+/**
+ * Profiles scored per batch slice before yielding to queued messages
+ */
+export const BATCH_SLICE_SIZE = 250;
+
+const engines = new Map();
+const runningBatches = new Set();
+const cancelled = new Set();
+
+function getEngine(list) {
+  if (!engines.has(list)) {
+    engines.set(list, createEngineState());
+  }
+  return engines.get(list);
+}
+
+/**
+ * Let queued messages (such as cancel) run between batch slices
+ */
+function yieldToQueue() {
+  return new Promise(resolve => setTimeout(resolve, 0));
+}
+
+async function runBatch(id, profiles) {
+  const results = [];
+
+  for (let start = 0; start < profiles.length; start += BATCH_SLICE_SIZE) {
+    if (cancelled.has(id)) {
+      return null;
+    }
+
+    for (const profile of profiles.slice(start, start + BATCH_SLICE_SIZE)) {
+      results.push(calculateSalary(profile));
+    }
+    await yieldToQueue();
+  }
+
+  return cancelled.has(id) ? null : results;
+}
+
+/**
+ * Handle one engine message
+ *
+ * @param {object} message - { id, type, payload }
+ * @returns {Promise<object>} Reply message
+ */
+export async function handleEngineMessage(message) {
+  const { id, type, payload = {} } = message;
+
+  try {
+    switch (type) {
+      case 'setSkills':
+        getEngine(payload.list).setSkills(payload.skills);
+        return { id, result: getEngine(payload.list).getSkills().length };
+
+      case 'addSkill':
+        return { id, result: getEngine(payload.list).addSkill(payload.skill) };
+
+      case 'removeSkill':
+        getEngine(payload.list).removeSkill(payload.index);
+        return { id, result: getEngine(payload.list).getSkills().length };
+
+      case 'calculate': {
+        const engine = getEngine(payload.list);
+        engine.setUserType(payload.userType);
+        engine.setHasFullStack(Boolean(payload.hasFullStack));
+        engine.setCurrentSalary(payload.currentSalary || 0);
+        return { id, result: engine.getResult() };
+      }
+
+      case 'batch': {
+        runningBatches.add(id);
+        const results = await runBatch(id, payload.profiles || []);
+        runningBatches.delete(id);
+        cancelled.delete(id);
+        return results ? { id, result: results } : { id, cancelled: true };
+      }
+
+      case 'cancel':
+        // Batches that already finished have nothing to stop
+        if (runningBatches.has(payload.id)) {
+          cancelled.add(payload.id);
+        }
+        return { id, result: true };
+
+      default:
+        return { id, error: `Unknown ROI engine message type: ${type}` };
+    }
+  } catch (error) {
+    return { id, error: error.message };
+  }
+}
+
+// Install the message handler when loaded as a worker
+if (typeof WorkerGlobalScope !== 'undefined' && self instanceof WorkerGlobalScope) {
+  self.onmessage = async (event) => {
+    self.postMessage(await handleEngineMessage(event.data));
+  };
+}
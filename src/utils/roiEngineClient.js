@@ -0,0 +1,278 @@
+/**
+ * ROI Engine Client
+ *
+ * Promise-based API over the ROI engine worker (roiEngine.worker.js):
+ * - addSkill / removeSkill / setSkills keep the worker's skills lists in step
+ *   with the UI, one message per edit
+ * - calculate is debounced: calls within debounceMs of each other collapse
+ *   into one calculation, and superseded calls reject with ROIEngineCancelled
+ * - batch scores many profiles in slices and can be stopped with an AbortSignal
+ *
+ * Without Web Worker support (or if the worker fails to load) the same
+ * handler runs on the main thread, so results are identical either way.
+ * The client mirrors every skills list it sends, so the main-thread engine
+ * that takes over from a failed worker starts from the same lists.
+ */
+
+/**
+ * Default debounce window for calculate(), in milliseconds
+ */
+export const CALCULATE_DEBOUNCE_MS = 50;
+
+// Messages answered with the number of skills in their list
+const SKILL_EDITS = new Set(['setSkills', 'addSkill', 'removeSkill']);
+
+/**
+ * Rejection reason for superseded or aborted requests
+ */
+export class ROIEngineCancelled extends Error {
+  constructor(message = 'ROI engine request cancelled') {
+    super(message);
+    this.name = 'ROIEngineCancelled';
+  }
+}
+
+/**
+ * Whether an error only means the request was cancelled
+ */
+export function isCancelled(error) {
+  return error instanceof ROIEngineCancelled;
+}
+
+function startWorker() {
+  if (typeof Worker === 'undefined') {
+    return null;
+  }
+  try {
+    return new Worker(new URL('./roiEngine.worker.js', import.meta.url), { type: 'module' });
+  } catch (error) {
+    console.warn('ROI engine worker unavailable, calculating on the main thread:', error);
+    return null;
+  }
+}
+
+/**
+ * Create an ROI engine client
+ *
+ * @param {object} options - Client options
+ * @param {number} options.debounceMs - Debounce window for calculate()
+ * @param {boolean} options.useWorker - Set false to always calculate on the main thread
+ * @returns {object} Client with calculate, addSkill, removeSkill, setSkills, batch, cancelAll, terminate
+ */
+export function createROIEngineClient({ debounceMs = CALCULATE_DEBOUNCE_MS, useWorker = true } = {}) {
+  let worker = useWorker ? startWorker() : null;
+  let nextId = 1;
+  const pending = new Map();
+  let loadingHandler = null;
+  // List name -> skills as sent so far
+  const mirrors = new Map();
+
+  // Debounced calculate: one timer, one waiting caller
+  let calculateTimer = null;
+  let waitingCalculate = null;
+  let runningCalculateId = null;
+
+  const settle = (reply) => {
+    const request = pending.get(reply.id);
+    if (!request) return;
+    pending.delete(reply.id);
+
+    if (reply.cancelled) {
+      request.reject(new ROIEngineCancelled());
+    } else if (reply.error) {
+      request.reject(new Error(reply.error));
+    } else {
+      request.resolve(reply.result);
+    }
+  };
+
+  const runInline = async (message) => {
+    // One shared import, so queued messages are still handled in order
+    if (!loadingHandler) {
+      loadingHandler = import('./roiEngine.worker.js').then(module => module.handleEngineMessage);
+    }
+    const handleMessage = await loadingHandler;
+    settle(await handleMessage(message));
+  };
+
+  const fallBackToInline = (error) => {
+    console.warn('ROI engine worker failed, calculating on the main thread:', error);
+    worker.terminate();
+    worker = null;
+    // The worker's skills lists died with it: rebuild them from the mirrors,
+    // which already include every edit it never answered
+    for (const [list, skills] of mirrors) {
+      runInline({ id: 0, type: 'setSkills', payload: { list, skills: skills.slice() } });
+    }
+    // Then replay the calculations and batches it never answered, in order
+    for (const [id, request] of Array.from(pending)) {
+      if (SKILL_EDITS.has(request.message.type)) {
+        pending.delete(id);
+        request.resolve(request.skillCount);
+      } else {
+        runInline(request.message);
+      }
+    }
+  };
+
+  if (worker) {
+    worker.onmessage = (event) => settle(event.data);
+    worker.onerror = fallBackToInline;
+  }
+
+  const send = (type, payload, skillCount) => {
+    const id = nextId++;
+    const message = { id, type, payload };
+    const promise = new Promise((resolve, reject) => {
+      pending.set(id, { resolve, reject, message, skillCount });
+    });
+
+    if (worker) {
+      worker.postMessage(message);
+    } else {
+      runInline(message);
+    }
+    return { id, promise };
+  };
+
+  const mirrorOf = (list) => {
+    if (!mirrors.has(list)) {
+      mirrors.set(list, []);
+    }
+    return mirrors.get(list);
+  };
+
+  const cancelRequest = (id) => {
+    const request = pending.get(id);
+    if (!request) return;
+    pending.delete(id);
+    request.reject(new ROIEngineCancelled());
+    if (request.message.type === 'batch') {
+      send('cancel', { id });
+    }
+  };
+
+  const cancelWaitingCalculate = () => {
+    clearTimeout(calculateTimer);
+    calculateTimer = null;
+    if (waitingCalculate) {
+      waitingCalculate.reject(new ROIEngineCancelled());
+      waitingCalculate = null;
+    }
+  };
+
+  return {
+    /**
+     * Salary result for a skills list (debounced)
+     *
+     * @param {object} params - { list, userType, hasFullStack, currentSalary }
+     * @returns {Promise<object>} Salary result
+     */
+    calculate(params) {
+      cancelWaitingCalculate();
+      // A newer calculation makes the one in flight stale
+      if (runningCalculateId !== null) {
+        cancelRequest(runningCalculateId);
+        runningCalculateId = null;
+      }
+
+      return new Promise((resolve, reject) => {
+        waitingCalculate = { resolve, reject };
+        calculateTimer = setTimeout(() => {
+          const caller = waitingCalculate;
+          waitingCalculate = null;
+          calculateTimer = null;
+
+          const { id, promise } = send('calculate', params);
+          runningCalculateId = id;
+          promise
+            .then(caller.resolve, caller.reject)
+            .finally(() => {
+              if (runningCalculateId === id) runningCalculateId = null;
+            });
+        }, debounceMs);
+      });
+    },
+
+    /**
+     * @returns {Promise<number>} Number of skills in the list
+     */
+    addSkill(list, skill) {
+      const skills = mirrorOf(list);
+      skills.push(skill);
+      return send('addSkill', { list, skill }, skills.length).promise;
+    },
+
+    /**
+     * @returns {Promise<number>} Number of skills in the list
+     */
+    removeSkill(list, index) {
+      const skills = mirrorOf(list);
+      if (index >= 0 && index < skills.length) {
+        skills.splice(index, 1);
+      }
+      return send('removeSkill', { list, index }, skills.length).promise;
+    },
+
+    /**
+     * @returns {Promise<number>} Number of skills in the list
+     */
+    setSkills(list, skills) {
+      mirrors.set(list, Array.isArray(skills) ? skills.slice() : []);
+      return send('setSkills', { list, skills }, mirrors.get(list).length).promise;
+    },
+
+    /**
+     * Salary results for many calculateSalary() parameter objects
+     *
+     * @param {object[]} profiles - calculateSalary() params per profile
+     * @param {object} options - { signal } AbortSignal that cancels the batch
+     * @returns {Promise<object[]>} Salary results, in order
+     */
+    batch(profiles, { signal } = {}) {
+      if (signal && signal.aborted) {
+        return Promise.reject(new ROIEngineCancelled());
+      }
+      const { id, promise } = send('batch', { profiles });
+      if (signal) {
+        signal.addEventListener('abort', () => cancelRequest(id), { once: true });
+      }
+      return promise;
+    },
+
+    /**
+     * Cancel the waiting calculation and every running batch
+     */
+    cancelAll() {
+      cancelWaitingCalculate();
+      for (const [id, request] of Array.from(pending)) {
+        if (request.message.type === 'calculate' || request.message.type === 'batch') {
+          cancelRequest(id);
+        }
+      }
+    },
+
+    /**
+     * Stop the worker; outstanding calculations and batches are cancelled,
+     * outstanding skill edits resolve quietly
+     */
+    terminate() {
+      cancelWaitingCalculate();
+      for (const request of pending.values()) {
+        const { type } = request.message;
+        if (SKILL_EDITS.has(type)) {
+          request.resolve(request.skillCount);
+        } else if (type === 'cancel') {
+          request.resolve(true);
+        } else {
+          request.reject(new ROIEngineCancelled());
+        }
+      }
+      pending.clear();
+      if (worker) {
+        worker.terminate();
+        worker = null;
+      }
+    }
+  };
+}
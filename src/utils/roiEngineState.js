@@ -0,0 +1,184 @@
+/**
+ * Incremental ROI Engine State
+ *
+ * Keeps a profile's skills, detected pillars and per-pillar reference
+ * counts up to date as skills are added and removed, so an edit does not
+ * send the whole skills list back through normalization and pillar
+ * detection. getResult() matches calculateSalary() for the same inputs.
+ *
+ * Pillar detection is order dependent (each skill counts towards the first
+ * matching pillar not yet detected), so the state remembers which skill
+ * detected each pillar:
+ * - addSkill: one cached lookup, then the new skill takes its first free pillar
+ * - removeSkill: free if the skill detected nothing; otherwise the later
+ *   skills are reassigned from their cached pillar lists, stopping as soon
+ *   as every pillar with a non-zero reference count is detected again
+ */
+
+import { lookupSkill } from './skillCache'
+import { getAllPillarKeys } from './pillarDetection'
+import { calculateSalaryForPillars } from './salaryEngine'
+
+export class ROIEngineState {
+  /**
+   * @param {object} params - Initial profile
+   * @param {string} params.userType - 'fresher' or 'experienced'
+   * @param {string[]} params.skills - Raw user skills
+   * @param {boolean} params.hasFullStack - Full Stack Program completion
+   * @param {number} params.currentSalary - Current salary (for experienced only)
+   */
+  constructor({ userType = null, skills = [], hasFullStack = false, currentSalary = 0 } = {}) {
+    this.userType = userType;
+    this.hasFullStack = hasFullStack;
+    this.currentSalary = currentSalary;
+    this.setSkills(skills);
+  }
+
+  /**
+   * Replace every skill (one full detection pass)
+   *
+   * @param {string[]} skills - Raw user skills
+   */
+  setSkills(skills) {
+    this.entries = [];
+    this.nextSeq = 0;
+    // Pillar -> number of skills matching it
+    this.pillarCounts = Object.fromEntries(getAllPillarKeys().map(pillar => [pillar, 0]));
+    // Pillar -> entry of the skill that detected it
+    this.detectedBy = new Map();
+
+    for (const skill of Array.isArray(skills) ? skills : []) {
+      this.addSkill(skill);
+    }
+  }
+
+  /**
+   * Add a skill at the end of the list
+   *
+   * @param {string} rawSkill - Raw skill input from user
+   * @returns {number} Number of skills
+   */
+  addSkill(rawSkill) {
+    const lookup = lookupSkill(rawSkill);
+    const entry = {
+      raw: rawSkill,
+      seq: this.nextSeq++,
+      pillars: lookup ? lookup.pillars : [],
+      detected: null
+    };
+
+    this.entries.push(entry);
+    for (const pillar of entry.pillars) {
+      this.pillarCounts[pillar]++;
+    }
+    this.assign(entry);
+    return this.entries.length;
+  }
+
+  /**
+   * Remove the skill at an index
+   *
+   * @param {number} index - Position in the skills list
+   * @returns {string|undefined} The removed raw skill
+   */
+  removeSkill(index) {
+    if (index < 0 || index >= this.entries.length) {
+      return undefined;
+    }
+
+    const [removed] = this.entries.splice(index, 1);
+    for (const pillar of removed.pillars) {
+      this.pillarCounts[pillar]--;
+    }
+
+    // A skill that detected nothing never changed what later skills detect
+    if (removed.detected === null) {
+      return removed.raw;
+    }
+
+    // Release everything detected from the removed skill onwards, then reassign
+    for (const [pillar, entry] of this.detectedBy) {
+      if (entry.seq >= removed.seq) {
+        entry.detected = null;
+        this.detectedBy.delete(pillar);
+      }
+    }
+
+    const reachable = Object.values(this.pillarCounts).filter(count => count > 0).length;
+    for (let i = index; i < this.entries.length && this.detectedBy.size < reachable; i++) {
+      this.assign(this.entries[i]);
+    }
+    return removed.raw;
+  }
+
+  /**
+   * Give an entry the first of its pillars that is not detected yet
+   */
+  assign(entry) {
+    const pillar = entry.pillars.find(key => !this.detectedBy.has(key));
+    if (pillar) {
+      entry.detected = pillar;
+      this.detectedBy.set(pillar, entry);
+    }
+  }
+
+  setUserType(userType) {
+    this.userType = userType;
+  }
+
+  setHasFullStack(hasFullStack) {
+    this.hasFullStack = hasFullStack;
+  }
+
+  setCurrentSalary(currentSalary) {
+    this.currentSalary = currentSalary;
+  }
+
+  /**
+   * @returns {string[]} Raw skills, in order
+   */
+  getSkills() {
+    return this.entries.map(entry => entry.raw);
+  }
+
+  /**
+   * @returns {object} Pillar key -> number of skills matching it
+   */
+  getPillarCounts() {
+    return { ...this.pillarCounts };
+  }
+
+  /**
+   * Detected pillars in detection order (same as detectPillars())
+   *
+   * @returns {Set<string>} Set of pillar keys detected
+   */
+  getDetectedPillars() {
+    const detecting = Array.from(this.detectedBy.values()).sort((a, b) => a.seq - b.seq);
+    return new Set(detecting.map(entry => entry.detected));
+  }
+
+  /**
+   * Salary result for the current state (same as calculateSalary())
+   *
+   * @returns {object} Salary calculation result
+   */
+  getResult() {
+    return calculateSalaryForPillars({
+      userType: this.userType,
+      detectedPillars: this.getDetectedPillars(),
+      hasFullStack: this.hasFullStack,
+      currentSalary: this.currentSalary
+    });
+  }
+}
+
+/**
+ * Create an incremental engine state
+ *
+ * @param {object} params - Initial profile (see ROIEngineState)
+ * @returns {ROIEngineState} Engine state
+ */
+export function createEngineState(params = {}) {
+  return new ROIEngineState(params);
+}
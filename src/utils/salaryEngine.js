@@ -5,8 +5,8 @@
  * Based on market readiness and skill coverage across Five Pillars
  */
 
-import { processUserSkills } from './skillNormalization'
-import { detectPillars, getAllPillarKeys, getPillarNames } from './pillarDetection'
+import { detectSkillPillars } from './skillCache'
+import { getAllPillarKeys, getPillarNames } from './pillarDetection'
 
 /**
  * Base salary for freshers (₹ LPA)
@@ -42,19 +42,24 @@ const EXPERIENCED_PILLAR_UPLIFTS = {
 };
 
 /**
- * Calculate salary for freshers/career switchers
+ * Compounding reduction applied to the uplift of several missing pillars
+ */
+const COMPOUND_FACTOR = 0.9; // 10% reduction for compounding
+
+/**
+ * Premium for experienced users who already cover every pillar
+ */
+const CERTIFICATION_PREMIUM = 0.15; // 15% premium for full-stack certification
+
+/**
+ * Reference fresher calculation from detected pillars
+ * The pillar table below must reproduce it exactly (see verifyPillarTable)
  * 
- * @param {string[]} userSkills - Raw user skills
+ * @param {Set<string>} detectedPillars - Detected pillar keys, in detection order
  * @param {boolean} hasFullStack - Whether user completed Full Stack Program
  * @returns {object} Salary calculation result
  */
-export function calculateFresherSalary(userSkills, hasFullStack = false) {
-  // Normalize and process user skills
-  const processedSkills = processUserSkills(userSkills);
-  
-  // Detect pillars from skills
-  const detectedPillars = detectPillars(processedSkills);
-  
+function referenceFresherSalary(detectedPillars, hasFullStack) {
   // Calculate base salary with pillar contributions
   let baseSalary = BASE_FRESHER_SALARY;
   let pillarContributions = 0;
@@ -130,31 +135,15 @@ export function calculateFresherSalary(userSkills, hasFullStack = false) {
 }
 
 /**
- * Calculate salary for experienced professionals
+ * Reference experienced calculation from detected pillars
+ * The pillar table below must reproduce it exactly (see verifyPillarTable)
  * 
- * @param {number} currentSalary - User's current salary (₹ LPA)
- * @param {string[]} userSkills - Raw user skills
+ * @param {number} currentSalary - User's current salary (₹ LPA), greater than 0
+ * @param {Set<string>} detectedPillars - Detected pillar keys, in detection order
  * @param {boolean} hasFullStack - Whether user completed Full Stack Program
  * @returns {object} Salary calculation result
  */
-export function calculateExperiencedSalary(currentSalary, userSkills, hasFullStack = false) {
-  if (!currentSalary || currentSalary <= 0) {
-    return {
-      before: 0,
-      after: 0,
-      uplift: 0,
-      detectedPillars: [],
-      skillsAdded: [],
-      explanation: 'Please enter your current salary to calculate growth potential.'
-    };
-  }
-  
-  // Normalize and process user skills
-  const processedSkills = processUserSkills(userSkills);
-  
-  // Detect pillars from skills
-  const detectedPillars = detectPillars(processedSkills);
-  
+function referenceExperiencedSalary(currentSalary, detectedPillars, hasFullStack) {
   const salaryBeforeFullStack = currentSalary;
   
   // Calculate uplift based on missing pillars
@@ -170,12 +159,11 @@ export function calculateExperiencedSalary(currentSalary, userSkills, hasFullSta
     if (missingPillars.length > 0) {
       // Calculate total uplift from missing pillars
       let totalUplift = 0;
-      const compoundFactor = 0.9; // 10% reduction for compounding
       
       // Calculate individual pillar contributions
       for (const pillar of missingPillars) {
         if (EXPERIENCED_PILLAR_UPLIFTS[pillar]) {
-          const pillarUplift = EXPERIENCED_PILLAR_UPLIFTS[pillar] * compoundFactor;
+          const pillarUplift = EXPERIENCED_PILLAR_UPLIFTS[pillar] * COMPOUND_FACTOR;
           const contribution = currentSalary * pillarUplift;
           
           skillsAdded.push({
@@ -187,7 +175,7 @@ export function calculateExperiencedSalary(currentSalary, userSkills, hasFullSta
         }
       }
       
-      totalUplift *= compoundFactor;
+      totalUplift *= COMPOUND_FACTOR;
       salaryAfterFullStack = currentSalary * (1 + totalUplift);
       
       const pillarNames = getPillarNames(missingPillars);
@@ -200,7 +188,7 @@ export function calculateExperiencedSalary(currentSalary, userSkills, hasFullSta
           const pillarUplift = EXPERIENCED_PILLAR_UPLIFTS[pillar];
           const totalUplift = allPillars.reduce((sum, p) => sum + (EXPERIENCED_PILLAR_UPLIFTS[p] || 0), 0);
           const proportion = pillarUplift / totalUplift;
-          const contribution = currentSalary * 0.15 * proportion;
+          const contribution = currentSalary * CERTIFICATION_PREMIUM * proportion;
           
           skillsAdded.push({
             name: getPillarNames([pillar])[0],
@@ -209,7 +197,7 @@ export function calculateExperiencedSalary(currentSalary, userSkills, hasFullSta
         }
       }
       
-      salaryAfterFullStack = currentSalary * 1.15; // 15% premium for full-stack certification
+      salaryAfterFullStack = currentSalary * (1 + CERTIFICATION_PREMIUM);
       explanation = `You already have strong skill coverage. Full Stack Program certification adds 15% premium for verified expertise.`;
     }
   } else {
@@ -231,6 +219,325 @@ export function calculateExperiencedSalary(currentSalary, userSkills, hasFullSta
   };
 }
 
+/**
+ * Pillar-combination lookup table
+ * 
+ * A result depends only on which of the five pillars are detected (one of
+ * 32 subsets) and hasFullStack, so every contribution, multiplier, premium
+ * share and missing-pillar list derived from the constants above is
+ * precomputed per subset when this module loads. Editing a constant
+ * rebuilds the table on the next load; verifyPillarTable() checks it
+ * against the reference calculations (in development and in the server's
+ * roi_golden check).
+ */
+const PILLAR_KEYS = getAllPillarKeys();
+
+/**
+ * Bitmask of detected pillars (bit i = i-th key of getAllPillarKeys())
+ * 
+ * @param {Set<string>|string[]} pillarKeys - Pillar keys
+ * @returns {number} Pillar bitmask
+ */
+export function getPillarMask(pillarKeys) {
+  let mask = 0;
+  for (const pillar of pillarKeys) {
+    const index = PILLAR_KEYS.indexOf(pillar);
+    if (index !== -1) {
+      mask |= 1 << index;
+    }
+  }
+  return mask;
+}
+
+/**
+ * Build the lookup table from the current constants
+ * 
+ * @returns {object} Shared full-stack values plus one entry per pillar bitmask
+ */
+function buildPillarTable() {
+  const multiplier = (FULL_STACK_MULTIPLIER_MIN + FULL_STACK_MULTIPLIER_MAX) / 2;
+  
+  let fullStackContributions = 0;
+  const fresherSkillsAdded = [];
+  for (const pillar of PILLAR_KEYS) {
+    if (FRESHER_PILLAR_VALUES[pillar]) {
+      fullStackContributions += FRESHER_PILLAR_VALUES[pillar];
+      fresherSkillsAdded.push({
+        name: getPillarNames([pillar])[0],
+        contribution: Math.round(FRESHER_PILLAR_VALUES[pillar] * multiplier * 10) / 10
+      });
+    }
+  }
+  
+  const totalPremiumUplift = PILLAR_KEYS.reduce((sum, p) => sum + (EXPERIENCED_PILLAR_UPLIFTS[p] || 0), 0);
+  const entries = [];
+  
+  for (let mask = 0; mask < 1 << PILLAR_KEYS.length; mask++) {
+    const present = PILLAR_KEYS.filter((_, i) => mask & (1 << i));
+    const missing = PILLAR_KEYS.filter((_, i) => !(mask & (1 << i)));
+    
+    let fresherContributions = 0;
+    for (const pillar of present) {
+      if (FRESHER_PILLAR_VALUES[pillar]) {
+        fresherContributions += FRESHER_PILLAR_VALUES[pillar];
+      }
+    }
+    
+    const entry = {
+      fresherBefore: BASE_FRESHER_SALARY + fresherContributions,
+      premium: missing.length === 0,
+      // Per pillar: contribution = currentSalary * uplift, or
+      // currentSalary * premium * share once every pillar is present
+      experiencedAdded: [],
+      experiencedFactor: 1 + CERTIFICATION_PREMIUM,
+      experiencedExplanation: `You already have strong skill coverage. Full Stack Program certification adds 15% premium for verified expertise.`
+    };
+    
+    if (missing.length > 0) {
+      let totalUplift = 0;
+      for (const pillar of missing) {
+        if (EXPERIENCED_PILLAR_UPLIFTS[pillar]) {
+          entry.experiencedAdded.push({
+            name: getPillarNames([pillar])[0],
+            uplift: EXPERIENCED_PILLAR_UPLIFTS[pillar] * COMPOUND_FACTOR
+          });
+          totalUplift += EXPERIENCED_PILLAR_UPLIFTS[pillar];
+        }
+      }
+      totalUplift *= COMPOUND_FACTOR;
+      entry.experiencedFactor = 1 + totalUplift;
+      entry.experiencedExplanation = `Salary uplift calculated based on adding missing pillars: ${getPillarNames(missing).join(', ').toLowerCase()}. These skills are in high demand and command premium salaries.`;
+    } else {
+      for (const pillar of PILLAR_KEYS) {
+        if (EXPERIENCED_PILLAR_UPLIFTS[pillar]) {
+          entry.experiencedAdded.push({
+            name: getPillarNames([pillar])[0],
+            share: EXPERIENCED_PILLAR_UPLIFTS[pillar] / totalPremiumUplift
+          });
+        }
+      }
+    }
+    
+    entries.push(entry);
+  }
+  
+  return {
+    fresherFullStackAfter: (BASE_FRESHER_SALARY + fullStackContributions) * multiplier,
+    fresherSkillsAdded,
+    entries
+  };
+}
+
+const PILLAR_TABLE = buildPillarTable();
+
+/**
+ * Fresher result from the lookup table
+ * 
+ * @param {Set<string>} detectedPillars - Detected pillar keys, in detection order
+ * @param {boolean} hasFullStack - Whether user completed Full Stack Program
+ * @returns {object} Salary calculation result
+ */
+function tableFresherSalary(detectedPillars, hasFullStack) {
+  const salaryBeforeFullStack = PILLAR_TABLE.entries[getPillarMask(detectedPillars)].fresherBefore;
+  let salaryAfterFullStack = salaryBeforeFullStack;
+  let skillsAdded = [];
+  let explanation;
+  
+  if (hasFullStack) {
+    salaryAfterFullStack = PILLAR_TABLE.fresherFullStackAfter;
+    skillsAdded = PILLAR_TABLE.fresherSkillsAdded.map(skill => ({ ...skill }));
+    explanation = `Salary calculated with all five pillars and market-readiness multiplier, reflecting full-stack marketing engineer capabilities.`;
+  } else {
+    const pillarNames = getPillarNames(detectedPillars);
+    if (pillarNames.length > 0) {
+      explanation = `Salary calculated based on skill coverage across ${pillarNames.join(', ').toLowerCase()}, reflecting current market readiness.`;
+    } else {
+      explanation = `Base salary for entry-level position. Complete Full Stack Program to unlock growth potential.`;
+    }
+  }
+  
+  return {
+    before: Math.round(salaryBeforeFullStack * 10) / 10,
+    after: Math.round(salaryAfterFullStack * 10) / 10,
+    uplift: Math.round((salaryAfterFullStack - salaryBeforeFullStack) * 10) / 10,
+    detectedPillars: Array.from(detectedPillars),
+    skillsAdded,
+    explanation
+  };
+}
+
+/**
+ * Experienced result from the lookup table
+ * 
+ * @param {number} currentSalary - User's current salary (₹ LPA), greater than 0
+ * @param {Set<string>} detectedPillars - Detected pillar keys, in detection order
+ * @param {boolean} hasFullStack - Whether user completed Full Stack Program
+ * @returns {object} Salary calculation result
+ */
+function tableExperiencedSalary(currentSalary, detectedPillars, hasFullStack) {
+  let salaryAfterFullStack = currentSalary;
+  let skillsAdded = [];
+  let explanation;
+  
+  if (hasFullStack) {
+    const entry = PILLAR_TABLE.entries[getPillarMask(detectedPillars)];
+    salaryAfterFullStack = currentSalary * entry.experiencedFactor;
+    skillsAdded = entry.experiencedAdded.map(({ name, uplift, share }) => ({
+      name,
+      contribution: Math.round((entry.premium ? currentSalary * CERTIFICATION_PREMIUM * share : currentSalary * uplift) * 10) / 10
+    }));
+    explanation = entry.experiencedExplanation;
+  } else {
+    const pillarNames = getPillarNames(detectedPillars);
+    if (pillarNames.length > 0) {
+      explanation = `Current salary reflects your existing skills in ${pillarNames.join(', ').toLowerCase()}. Complete Full Stack Program to unlock additional growth.`;
+    } else {
+      explanation = `Current salary baseline. Add skills and complete Full Stack Program to see significant growth potential.`;
+    }
+  }
+  
+  return {
+    before: Math.round(currentSalary * 10) / 10,
+    after: Math.round(salaryAfterFullStack * 10) / 10,
+    uplift: Math.round((salaryAfterFullStack - currentSalary) * 10) / 10,
+    detectedPillars: Array.from(detectedPillars),
+    skillsAdded,
+    explanation
+  };
+}
+
+/**
+ * Check the lookup table against the reference calculations
+ * Every pillar subset is tried in every detection order, with and without
+ * the Full Stack Program, for freshers and a spread of current salaries
+ * 
+ * @returns {object[]} Mismatches ({ userType, pillars, hasFullStack, currentSalary, expected, actual })
+ */
+export function verifyPillarTable() {
+  const salaries = [0.05, 0.25, 4.35, 6.45, 7.5, 10, 12.25, 18.75, 33.3, 99.99];
+  const mismatches = [];
+  
+  const orders = [[]];
+  for (let i = 0; i < orders.length; i++) {
+    for (const pillar of PILLAR_KEYS) {
+      if (!orders[i].includes(pillar)) {
+        orders.push([...orders[i], pillar]);
+      }
+    }
+  }
+  
+  for (const pillars of orders) {
+    const detectedPillars = new Set(pillars);
+    for (const hasFullStack of [false, true]) {
+      const checks = [['fresher', null, tableFresherSalary(detectedPillars, hasFullStack), referenceFresherSalary(detectedPillars, hasFullStack)]];
+      for (const salary of salaries) {
+        checks.push(['experienced', salary, tableExperiencedSalary(salary, detectedPillars, hasFullStack), referenceExperiencedSalary(salary, detectedPillars, hasFullStack)]);
+      }
+      for (const [userType, currentSalary, actual, expected] of checks) {
+        if (JSON.stringify(actual) !== JSON.stringify(expected)) {
+          mismatches.push({ userType, pillars, hasFullStack, currentSalary, expected, actual });
+        }
+      }
+    }
+  }
+  
+  return mismatches;
+}
+
+if (import.meta.env?.DEV) {
+  const mismatches = verifyPillarTable();
+  if (mismatches.length > 0) {
+    console.warn(`[salaryEngine] Pillar table differs from the reference calculation in ${mismatches.length} case(s)`, mismatches[0]);
+  }
+}
+
+/**
+ * Calculate salary for freshers/career switchers
+ * 
+ * @param {string[]} userSkills - Raw user skills
+ * @param {boolean} hasFullStack - Whether user completed Full Stack Program
+ * @returns {object} Salary calculation result
+ */
+export function calculateFresherSalary(userSkills, hasFullStack = false) {
+  // Normalize skills and detect pillars (cached per raw skill)
+  const detectedPillars = detectSkillPillars(userSkills);
+  
+  return tableFresherSalary(detectedPillars, hasFullStack);
+}
+
+/**
+ * Calculate salary for experienced professionals
+ * 
+ * @param {number} currentSalary - User's current salary (₹ LPA)
+ * @param {string[]} userSkills - Raw user skills
+ * @param {boolean} hasFullStack - Whether user completed Full Stack Program
+ * @returns {object} Salary calculation result
+ */
+export function calculateExperiencedSalary(currentSalary, userSkills, hasFullStack = false) {
+  if (!currentSalary || currentSalary <= 0) {
+    return missingSalaryResult();
+  }
+  
+  // Normalize skills and detect pillars (cached per raw skill)
+  const detectedPillars = detectSkillPillars(userSkills);
+  
+  return tableExperiencedSalary(currentSalary, detectedPillars, hasFullStack);
+}
+
+/**
+ * Result for an experienced user without a current salary
+ */
+function missingSalaryResult() {
+  return {
+    before: 0,
+    after: 0,
+    uplift: 0,
+    detectedPillars: [],
+    skillsAdded: [],
+    explanation: 'Please enter your current salary to calculate growth potential.'
+  };
+}
+
+/**
+ * Result when no experience level is selected
+ */
+function missingUserTypeResult() {
+  return {
+    before: 0,
+    after: 0,
+    uplift: 0,
+    detectedPillars: [],
+    explanation: 'Please select your experience level to calculate salary.'
+  };
+}
+
+/**
+ * Salary calculation from already detected pillars
+ * Same result as calculateSalary() for skills that detect these pillars;
+ * used by the incremental engine state (roiEngineState.js)
+ * 
+ * @param {object} params - Calculation parameters
+ * @param {string} params.userType - 'fresher' or 'experienced'
+ * @param {Set<string>} params.detectedPillars - Detected pillar keys, in detection order
+ * @param {boolean} params.hasFullStack - Full Stack Program completion
+ * @param {number} params.currentSalary - Current salary (for experienced only)
+ * @returns {object} Salary calculation result
+ */
+export function calculateSalaryForPillars(params) {
+  const { userType, detectedPillars, hasFullStack = false, currentSalary = 0 } = params;
+  
+  if (userType === 'fresher') {
+    return tableFresherSalary(detectedPillars, hasFullStack);
+  } else if (userType === 'experienced') {
+    if (!currentSalary || currentSalary <= 0) {
+      return missingSalaryResult();
+    }
+    return tableExperiencedSalary(currentSalary, detectedPillars, hasFullStack);
+  }
+  
+  return missingUserTypeResult();
+}
+
 /**
  * Main salary calculation function
  * Routes to fresher or experienced calculation based on user type
@@ -251,12 +558,6 @@ export function calculateSalary(params) {
     return calculateExperiencedSalary(currentSalary, skills, hasFullStack);
   }
   
-  return {
-    before: 0,
-    after: 0,
-    uplift: 0,
-    detectedPillars: [],
-    explanation: 'Please select your experience level to calculate salary.'
-  };
+  return missingUserTypeResult();
 }
 
@@ -0,0 +1,151 @@
+/**
+ * Skill Lookup Cache
+ * 
+ * Users type the same free-text skills again and again ("ga4", "fb ads",
+ * "chat gpt"), and every edit recalculates the whole profile. This bounded
+ * LRU cache remembers, per raw skill string, the canonical skill and the
+ * pillars it matches, so repeated skills skip normalization, alias
+ * resolution and pillar matching entirely.
+ */
+
+import { normalizeSkill, resolveAlias } from './skillNormalization'
+import { getSkillPillars } from './pillarDetection'
+
+/**
+ * Default number of raw skill strings kept in the cache
+ */
+export const SKILL_CACHE_SIZE = 500;
+
+/**
+ * Least-recently-used cache on top of Map's insertion order
+ */
+class LRUCache {
+  constructor(maxSize) {
+    this.maxSize = maxSize;
+    this.entries = new Map();
+    this.hits = 0;
+    this.misses = 0;
+    this.evictions = 0;
+  }
+  
+  get(key) {
+    if (!this.entries.has(key)) {
+      this.misses++;
+      return undefined;
+    }
+    this.hits++;
+    // Re-insert to mark as most recently used
+    const value = this.entries.get(key);
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    return value;
+  }
+  
+  set(key, value) {
+    this.entries.delete(key);
+    this.entries.set(key, value);
+    if (this.entries.size > this.maxSize) {
+      // First key in insertion order is the least recently used
+      this.entries.delete(this.entries.keys().next().value);
+      this.evictions++;
+    }
+  }
+  
+  stats() {
+    const lookups = this.hits + this.misses;
+    return {
+      hits: this.hits,
+      misses: this.misses,
+      evictions: this.evictions,
+      size: this.entries.size,
+      maxSize: this.maxSize,
+      hitRate: lookups ? this.hits / lookups : 0
+    };
+  }
+}
+
+let cache = new LRUCache(SKILL_CACHE_SIZE);
+
+/**
+ * Resolve a raw skill without the cache
+ * 
+ * @param {string} rawSkill - Raw skill input from user
+ * @returns {{canonical: string, pillars: string[]}|null} Null for skills that are dropped
+ */
+function resolveSkill(rawSkill) {
+  const normalized = normalizeSkill(rawSkill);
+  if (!normalized) {
+    return null;
+  }
+  
+  const canonical = resolveAlias(normalized);
+  return { canonical, pillars: getSkillPillars(canonical) };
+}
+
+/**
+ * Look up the canonical skill and matching pillars for a raw skill
+ * 
+ * @param {string} rawSkill - Raw skill input from user
+ * @returns {{canonical: string, pillars: string[]}|null} Null for skills that are dropped
+ */
+export function lookupSkill(rawSkill) {
+  // Only strings are cached; anything else normalizes to nothing
+  if (typeof rawSkill !== 'string') {
+    return null;
+  }
+  
+  let entry = cache.get(rawSkill);
+  if (entry === undefined) {
+    entry = resolveSkill(rawSkill);
+    cache.set(rawSkill, entry);
+  }
+  return entry;
+}
+
+/**
+ * Detect pillars from raw skills through the cache
+ * Same result as detectPillars(processUserSkills(userSkills))
+ * 
+ * @param {string[]} userSkills - Array of raw skill strings from user
+ * @returns {Set<string>} Set of pillar keys detected
+ */
+export function detectSkillPillars(userSkills) {
+  const detectedPillars = new Set();
+  
+  if (!Array.isArray(userSkills)) {
+    return detectedPillars;
+  }
+  
+  for (const rawSkill of userSkills) {
+    const entry = lookupSkill(rawSkill);
+    if (!entry) {
+      continue;
+    }
+    
+    // One skill maps to the first matching pillar not yet detected
+    const pillar = entry.pillars.find(key => !detectedPillars.has(key));
+    if (pillar) {
+      detectedPillars.add(pillar);
+    }
+  }
+  
+  return detectedPillars;
+}
+
+/**
+ * Cache counters for sizing SKILL_CACHE_SIZE
+ * 
+ * @returns {object} hits, misses, evictions, size, maxSize, hitRate
+ */
+export function getSkillCacheStats() {
+  return cache.stats();
+}
+
+/**
+ * Empty the cache and reset its counters
+ * 
+ * @param {number} maxSize - New maximum size (defaults to SKILL_CACHE_SIZE)
+ */
+export function resetSkillCache(maxSize = SKILL_CACHE_SIZE) {
+  cache = new LRUCache(maxSize);
+}